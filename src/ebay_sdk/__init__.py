@@ -1,5 +1,17 @@
 """eBay REST API SDK — thin Python wrapper over all eBay REST APIs."""
 
-from ebay_sdk.client import EbayClient
+from ebay_sdk.cache import ResponseCache
+from ebay_sdk.client import AsyncEbayClient, EbayClient, HttpConfig
+from ebay_sdk.ratelimit import RateLimit, RateLimiter, SqliteRateLimiter
+from ebay_sdk.retry import RetryPolicy
 
-__all__ = ["EbayClient"]
+__all__ = [
+    "AsyncEbayClient",
+    "EbayClient",
+    "HttpConfig",
+    "RateLimit",
+    "RateLimiter",
+    "ResponseCache",
+    "RetryPolicy",
+    "SqliteRateLimiter",
+]
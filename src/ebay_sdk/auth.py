@@ -0,0 +1,131 @@
+"""Access-token cache shared by the sync and async clients."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+from ebay_oauth import EbayOAuthClient
+
+# ``EbayOAuthClient`` treats tokens as expired this many seconds early; stay
+# in step with it so a cached header is never older than the library's token.
+_EXPIRY_SKEW = 60.0
+
+
+class TokenCache:
+    """Caches the ``Authorization`` header value for an ``EbayOAuthClient``.
+
+    The hot path is a couple of attribute reads: no call into the OAuth
+    library and no lock. Once a token enters its refresh window a single
+    background thread fetches a replacement while callers keep using the
+    current one; only if the token actually expires do callers block, and
+    then exactly one of them hits the token endpoint while the rest wait.
+
+    Parameters
+    ----------
+    oauth_client:
+        The ``EbayOAuthClient`` that issues tokens.
+    refresh_margin:
+        Seconds before expiry at which a background refresh is started.
+    default_ttl:
+        Token lifetime in seconds to assume when the OAuth client does not
+        expose one.
+    """
+
+    def __init__(
+        self,
+        oauth_client: EbayOAuthClient,
+        *,
+        refresh_margin: float = 300.0,
+        default_ttl: float = 7200.0,
+    ) -> None:
+        self._oauth = oauth_client
+        self._refresh_margin = refresh_margin
+        self._default_ttl = default_ttl
+        # Held by whoever is talking to the token endpoint, including the
+        # background refresher (which releases it from its own thread).
+        self._lock = threading.Lock()
+        self._authorization: str | None = None
+        self._expires_at = 0.0
+        self._refresh_at = 0.0
+        # Set when eBay rejected the cached token; the OAuth client's own
+        # cache would hand the same token back, so bypass it.
+        self._revoked = False
+
+    def peek(self) -> str | None:
+        """Return the cached header value, or *None* if it has expired.
+
+        Never blocks; schedules a background refresh when the token is
+        inside its refresh window.
+        """
+        authorization = self._authorization
+        now = time.monotonic()
+        if authorization is None or now >= self._expires_at:
+            return None
+        if now >= self._refresh_at:
+            self._refresh_in_background()
+        return authorization
+
+    def get(self) -> str:
+        """Return a valid ``Authorization`` header value, fetching if needed."""
+        authorization = self.peek()
+        if authorization is not None:
+            return authorization
+        with self._lock:
+            if self._authorization is None or time.monotonic() >= self._expires_at:
+                self._store(self._fetch(force=self._revoked))
+            return self._authorization
+
+    def invalidate(self, authorization: str | None = None) -> None:
+        """Drop the cached token so the next :meth:`get` fetches a new one.
+
+        Used when eBay answers 401 for a token that has not reached its
+        tracked expiry. With *authorization*, the token is only dropped if
+        it is still the cached one, so many requests failing with the same
+        revoked token cause a single refresh.
+        """
+        if authorization is not None and authorization != self._authorization:
+            return
+        self._revoked = True
+        self._expires_at = 0.0
+
+    # -- internals -------------------------------------------------------------
+
+    def _fetch(self, *, force: bool) -> str:
+        force_refresh = getattr(self._oauth, "force_refresh", None) if force else None
+        return force_refresh() if force_refresh else self._oauth.get_access_token()
+
+    def _store(self, token: str) -> None:
+        expiry = getattr(self._oauth, "_token_expiry", None)
+        if expiry:
+            ttl = float(expiry) - time.time()
+        else:
+            ttl = self._default_ttl
+        now = time.monotonic()
+        self._authorization = f"Bearer {token}"
+        self._revoked = False
+        self._refresh_at = now + max(ttl - self._refresh_margin, ttl / 2)
+        self._expires_at = now + ttl - _EXPIRY_SKEW
+
+    def _refresh_in_background(self) -> None:
+        if not self._lock.acquire(blocking=False):
+            return
+        try:
+            threading.Thread(
+                target=self._refresh_and_release,
+                name="ebay-token-refresh",
+                daemon=True,
+            ).start()
+        except BaseException:
+            self._lock.release()
+            raise
+
+    def _refresh_and_release(self) -> None:
+        try:
+            self._store(self._fetch(force=True))
+        except Exception:
+            # Keep serving the current token; try again shortly, and fall back
+            # to a blocking refresh if it runs out first.
+            self._refresh_at = time.monotonic() + min(30.0, self._refresh_margin)
+        finally:
+            self._lock.release()
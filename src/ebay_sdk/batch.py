@@ -0,0 +1,161 @@
+"""Chunking and bounded-concurrency helpers for bulk endpoints.
+
+eBay's ``bulk_*`` endpoints accept a handful of entries per call (25 for the
+Inventory API) and report a per-entry ``statusCode`` in a multi-status
+response. The helpers here split arbitrarily long iterables into chunks,
+dispatch them on a thread pool with a bounded number in flight, and merge
+the per-entry responses into a single :class:`BulkResult`.
+
+:func:`bulk_call` blocks and is meant for :class:`~ebay_sdk.client.EbayClient`;
+:func:`async_bulk_call` is its counterpart for
+:class:`~ebay_sdk.client.AsyncEbayClient`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import Awaitable, Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Any, Generic, NamedTuple, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class Outcome(NamedTuple, Generic[T, R]):
+    """Result of applying a function to one input in :func:`run_concurrently`."""
+
+    item: T
+    value: R | None
+    error: Exception | None
+
+
+@dataclass
+class ChunkError:
+    """A whole chunk that failed before eBay returned per-entry statuses."""
+
+    requests: list[dict[str, Any]]
+    error: Exception
+
+
+@dataclass
+class BulkResult:
+    """Merged outcome of a chunked bulk operation.
+
+    ``responses`` holds every per-entry response eBay returned, in input
+    order; ``chunk_errors`` holds chunks whose call failed outright.
+    """
+
+    responses: list[dict[str, Any]] = field(default_factory=list)
+    chunk_errors: list[ChunkError] = field(default_factory=list)
+
+    @property
+    def succeeded(self) -> list[dict[str, Any]]:
+        return [r for r in self.responses if r.get("statusCode", 200) < 400]
+
+    @property
+    def failed(self) -> list[dict[str, Any]]:
+        return [r for r in self.responses if r.get("statusCode", 200) >= 400]
+
+    @property
+    def ok(self) -> bool:
+        """*True* if every entry succeeded."""
+        return not self.chunk_errors and not self.failed
+
+
+def chunked(iterable: Iterable[T], size: int) -> Iterator[list[T]]:
+    """Yield successive lists of at most *size* items from *iterable*."""
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def run_concurrently(
+    fn: Callable[[T], R],
+    items: Iterable[T],
+    *,
+    max_workers: int,
+) -> Iterator[Outcome[T, R]]:
+    """Apply *fn* to each item on a thread pool, yielding outcomes in order.
+
+    *items* is consumed lazily with at most ``2 * max_workers`` calls
+    pending, so arbitrarily long (or generated) inputs run in bounded
+    memory. Exceptions raised by *fn* are captured in the outcome rather
+    than propagated.
+    """
+    window = max(1, max_workers) * 2
+    pending: deque[tuple[T, Future[R]]] = deque()
+    iterator = iter(items)
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ebay-batch") as executor:
+        for item in iterator:
+            pending.append((item, executor.submit(fn, item)))
+            if len(pending) >= window:
+                yield _outcome(*pending.popleft())
+        while pending:
+            yield _outcome(*pending.popleft())
+
+
+def bulk_call(
+    call: Callable[[dict[str, Any]], Any],
+    entries: Iterable[dict[str, Any]],
+    *,
+    chunk_size: int,
+    max_workers: int = 4,
+    response_key: str = "responses",
+) -> BulkResult:
+    """Send *entries* to a ``{"requests": [...]}`` bulk endpoint in chunks."""
+    result = BulkResult()
+    chunks = chunked(entries, chunk_size)
+    for outcome in run_concurrently(
+        lambda chunk: call({"requests": chunk}), chunks, max_workers=max_workers
+    ):
+        if outcome.error is not None:
+            result.chunk_errors.append(ChunkError(outcome.item, outcome.error))
+        else:
+            result.responses.extend((outcome.value or {}).get(response_key) or [])
+    return result
+
+
+async def async_bulk_call(
+    call: Callable[[dict[str, Any]], Awaitable[Any]],
+    entries: Iterable[dict[str, Any]],
+    *,
+    chunk_size: int,
+    max_workers: int = 4,
+    response_key: str = "responses",
+) -> BulkResult:
+    """Awaitable :func:`bulk_call` for coroutine endpoint methods.
+
+    *max_workers* chunks are in flight at once on the running event loop;
+    chunks are drawn from *entries* lazily as calls finish.
+    """
+    chunks = enumerate(chunked(entries, chunk_size))
+    outcomes: dict[int, Outcome[list[dict[str, Any]], Any]] = {}
+
+    async def worker() -> None:
+        # The workers share one iterator; the event loop runs them one at a time.
+        for index, chunk in chunks:
+            try:
+                outcomes[index] = Outcome(chunk, await call({"requests": chunk}), None)
+            except Exception as exc:
+                outcomes[index] = Outcome(chunk, None, exc)
+
+    await asyncio.gather(*(worker() for _ in range(max(1, max_workers))))
+    result = BulkResult()
+    for index in sorted(outcomes):
+        outcome = outcomes[index]
+        if outcome.error is not None:
+            result.chunk_errors.append(ChunkError(outcome.item, outcome.error))
+        else:
+            result.responses.extend((outcome.value or {}).get(response_key) or [])
+    return result
+
+
+def _outcome(item: T, future: Future[R]) -> Outcome[T, R]:
+    try:
+        return Outcome(item, future.result(), None)
+    except Exception as exc:
+        return Outcome(item, None, exc)
@@ -6,16 +6,17 @@ Version: v1.20.4
 
 from __future__ import annotations
 
+from functools import partial
 from typing import Any, TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from ebay_sdk.client import EbayClient
+    from ebay_sdk.client import AsyncEbayClient, EbayClient
 
 _BASE = "/buy/browse/v1"
 
 
 class BuyBrowseApi:
-    def __init__(self, client: EbayClient) -> None:
+    def __init__(self, client: EbayClient | AsyncEbayClient) -> None:
         self._c = client
 
     # -- Item Summary ----------------------------------------------------------
@@ -61,6 +62,41 @@ class BuyBrowseApi:
             params["fieldgroups"] = fieldgroups
         return self._c.get(f"{_BASE}/item_summary/search", params=params)
 
+    def iter_search(
+        self,
+        *,
+        q: str | None = None,
+        category_ids: str | None = None,
+        epid: str | None = None,
+        gtin: str | None = None,
+        charity_ids: str | None = None,
+        filter: str | None = None,
+        sort: str | None = None,
+        aspect_filter: str | None = None,
+        fieldgroups: str | None = None,
+        page_size: int = 200,
+        prefetch: int = 0,
+    ) -> Any:
+        """Iterate over all search results, fetching pages lazily.
+
+        *prefetch* pages are fetched ahead concurrently once the total is known.
+        """
+        fetch = partial(
+            self.search,
+            q=q,
+            category_ids=category_ids,
+            epid=epid,
+            gtin=gtin,
+            charity_ids=charity_ids,
+            filter=filter,
+            sort=sort,
+            aspect_filter=aspect_filter,
+            fieldgroups=fieldgroups,
+        )
+        return self._c.paginate(
+            fetch, "itemSummaries", page_size=page_size, prefetch=prefetch
+        )
+
     def search_by_image(
         self,
         image: dict[str, Any],
@@ -0,0 +1,184 @@
+"""Opt-in response cache for slow-changing GET endpoints.
+
+Only paths matching a configured prefix are cached, each prefix with its own
+time-to-live. A fresh hit costs no network round-trip; once an entry goes
+stale it is revalidated with ``If-None-Match`` when eBay supplied an
+``ETag``, so an unchanged resource comes back as an empty ``304``.
+
+Cached bodies are shared between callers: treat them as read-only.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any, NamedTuple, Protocol
+
+DEFAULT_TTLS: Mapping[str, float] = {
+    # Trees, subtrees and aspects only: get_default_category_tree_id reports
+    # the current categoryTreeVersion and must not be served stale.
+    "/commerce/taxonomy/v1/category_tree/": 24 * 3600.0,
+    "/sell/account/v1/fulfillment_policy": 900.0,
+    "/sell/account/v1/payment_policy": 900.0,
+    "/sell/account/v1/return_policy": 900.0,
+    "/sell/marketing/v1/ad_report_metadata": 24 * 3600.0,
+}
+
+
+class CacheEntry(NamedTuple):
+    body: Any
+    etag: str | None
+    expires_at: float
+
+    @property
+    def fresh(self) -> bool:
+        return time.time() < self.expires_at
+
+
+class CacheBackend(Protocol):
+    def get(self, key: str) -> CacheEntry | None: ...
+
+    def set(self, key: str, entry: CacheEntry) -> None: ...
+
+    def clear(self) -> None: ...
+
+
+class MemoryCacheBackend:
+    """Thread-safe in-memory LRU holding at most *maxsize* entries."""
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        self._maxsize = maxsize
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> CacheEntry | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class SqliteCacheBackend:
+    """On-disk backend that survives restarts and is shared between processes."""
+
+    def __init__(self, path: str | Path) -> None:
+        self._path = str(path)
+        self._local = threading.local()
+        self._connect().execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, body TEXT NOT NULL, etag TEXT, expires_at REAL NOT NULL)"
+        )
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self._path, timeout=30.0, isolation_level=None)
+            self._local.conn = conn
+        return conn
+
+    def get(self, key: str) -> CacheEntry | None:
+        row = self._connect().execute(
+            "SELECT body, etag, expires_at FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        return CacheEntry(json.loads(row[0]), row[1], row[2])
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        self._connect().execute(
+            "INSERT OR REPLACE INTO responses (key, body, etag, expires_at) VALUES (?, ?, ?, ?)",
+            (key, json.dumps(entry.body), entry.etag, entry.expires_at),
+        )
+
+    def clear(self) -> None:
+        self._connect().execute("DELETE FROM responses")
+
+
+class ResponseCache:
+    """Per-prefix TTL cache consulted by the clients for GET requests.
+
+    Parameters
+    ----------
+    ttls:
+        Mapping of path prefix to time-to-live in seconds; the longest
+        matching prefix wins. Defaults to :data:`DEFAULT_TTLS` (category
+        trees and aspects, business policies and report metadata).
+    backend:
+        Where entries live; defaults to a :class:`MemoryCacheBackend`.
+    namespace:
+        Mixed into every key. Give each seller account its own namespace
+        when several share one on-disk backend.
+    """
+
+    def __init__(
+        self,
+        ttls: Mapping[str, float] | None = None,
+        *,
+        backend: CacheBackend | None = None,
+        namespace: str = "",
+    ) -> None:
+        rules = DEFAULT_TTLS if ttls is None else ttls
+        self._ttls = sorted(rules.items(), key=lambda rule: len(rule[0]), reverse=True)
+        self._backend = backend if backend is not None else MemoryCacheBackend()
+        self._namespace = namespace
+
+    def ttl_for(self, path: str) -> float | None:
+        for prefix, ttl in self._ttls:
+            if path.startswith(prefix):
+                return ttl
+        return None
+
+    def key(
+        self,
+        base_url: str,
+        path: str,
+        params: dict[str, Any] | None,
+        headers: dict[str, str] | None,
+    ) -> str:
+        raw = json.dumps(
+            [self._namespace, base_url, path, params or {}, headers or {}],
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def get(self, key: str) -> CacheEntry | None:
+        return self._backend.get(key)
+
+    def store(self, key: str, body: Any, etag: str | None, ttl: float) -> None:
+        self._backend.set(key, CacheEntry(body, etag, time.time() + ttl))
+
+    def clear(self) -> None:
+        self._backend.clear()
+
+
+class CacheLookup(NamedTuple):
+    """A cacheable request's key, TTL and any existing entry."""
+
+    key: str
+    ttl: float
+    entry: CacheEntry | None
+
+    def request_headers(self, headers: dict[str, str] | None) -> dict[str, str] | None:
+        """*headers* plus ``If-None-Match`` when a stale entry has an ETag."""
+        if self.entry is None or self.entry.etag is None:
+            return headers
+        return {**(headers or {}), "If-None-Match": self.entry.etag}
@@ -1,12 +1,40 @@
-"""Base eBay API client — handles auth and HTTP requests."""
+"""Base eBay API clients — handle auth and HTTP requests."""
 
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+import os
+import time
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import IO, Any
 
 import httpx
 from ebay_oauth import EbayOAuthClient
 
+from ebay_sdk.auth import TokenCache
+from ebay_sdk.cache import CacheLookup, ResponseCache
+from ebay_sdk.pagination import PageFetcher, apaginate, paginate
+from ebay_sdk.ratelimit import RateLimiter
+from ebay_sdk.retry import RetryPolicy
+from ebay_sdk.streaming import DownloadResult, PartialDownload
+
+
+_NO_RETRY = RetryPolicy(max_attempts=1)
+
+
+def _replayable(files: dict[str, Any] | None) -> bool:
+    """Whether a multipart body can be sent again after a failed attempt."""
+    for value in (files or {}).values():
+        fileobj = value[1] if isinstance(value, tuple) else value
+        if not isinstance(fileobj, (bytes, str)) and not (
+            hasattr(fileobj, "seekable") and fileobj.seekable()
+        ):
+            return False
+    return True
+
 
 class EbayApiError(Exception):
     """Raised when the eBay API returns a non-2xx response."""
@@ -18,91 +46,150 @@ class EbayApiError(Exception):
         super().__init__(f"eBay API error {status_code} for {url}: {detail}")
 
 
-class EbayClient:
-    """Thin wrapper around eBay REST APIs.
+@dataclass(frozen=True)
+class HttpConfig:
+    """Connection-pool, protocol and timeout tuning for the HTTP layer.
 
-    Uses ``ldraney-ebay-oauth`` for token management and ``httpx`` for HTTP.
+    Any timeout left as *None* falls back to the client's ``timeout``.
+    HTTP/2 requires the optional ``h2`` package
+    (``pip install ldraney-ebay-sdk[http2]``).
 
     Parameters
     ----------
-    oauth_client:
-        An authenticated ``EbayOAuthClient`` instance.
-    sandbox:
-        If *True*, hit the eBay sandbox environment instead of production.
-    timeout:
-        HTTP request timeout in seconds.
+    max_connections:
+        Upper bound on open connections in the pool (*None* for no limit).
+    max_keepalive_connections:
+        How many idle connections to keep open for reuse.
+    keepalive_expiry:
+        Seconds an idle connection is kept before being closed.
+    http2:
+        Negotiate HTTP/2 so concurrent requests share one connection.
+    connect_timeout, read_timeout, write_timeout, pool_timeout:
+        Per-phase timeouts in seconds; ``pool_timeout`` bounds the wait
+        for a free connection when the pool is exhausted.
     """
 
+    max_connections: int | None = 100
+    max_keepalive_connections: int | None = 20
+    keepalive_expiry: float | None = 5.0
+    http2: bool = False
+    connect_timeout: float | None = None
+    read_timeout: float | None = None
+    write_timeout: float | None = None
+    pool_timeout: float | None = None
+
+    def limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+    def timeout(self, default: float | None) -> httpx.Timeout:
+        return httpx.Timeout(
+            default,
+            connect=default if self.connect_timeout is None else self.connect_timeout,
+            read=default if self.read_timeout is None else self.read_timeout,
+            write=default if self.write_timeout is None else self.write_timeout,
+            pool=default if self.pool_timeout is None else self.pool_timeout,
+        )
+
+    def client_kwargs(self, timeout: float | None) -> dict[str, Any]:
+        """Keyword arguments for ``httpx.Client`` / ``httpx.AsyncClient``."""
+        return {
+            "limits": self.limits(),
+            "timeout": self.timeout(timeout),
+            "http2": self.http2,
+        }
+
+
+class _BaseEbayClient:
+    """State and helpers shared by the sync and async clients."""
+
     PRODUCTION_BASE = "https://api.ebay.com"
     SANDBOX_BASE = "https://api.sandbox.ebay.com"
 
+    BASE_HEADERS = MappingProxyType({
+        "Content-Type": "application/json",
+        "Accept": "application/json",
+    })
+
     def __init__(
         self,
         oauth_client: EbayOAuthClient,
         *,
         sandbox: bool = False,
-        timeout: float = 30.0,
+        token_refresh_margin: float = 300.0,
+        retry: RetryPolicy | None = None,
+        rate_limiter: RateLimiter | None = None,
+        cache: ResponseCache | None = None,
     ) -> None:
         self._oauth = oauth_client
+        self._token = TokenCache(oauth_client, refresh_margin=token_refresh_margin)
         self._base_url = self.SANDBOX_BASE if sandbox else self.PRODUCTION_BASE
-        self._http = httpx.Client(base_url=self._base_url, timeout=timeout)
+        self._retry = retry or _NO_RETRY
+        self._limiter = rate_limiter
+        self._cache = cache
 
     # -- helpers ---------------------------------------------------------------
 
-    def _headers(self, extra: dict[str, str] | None = None) -> dict[str, str]:
-        token = self._oauth.get_access_token()
-        headers = {
-            "Authorization": f"Bearer {token}",
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-        }
+    def _build_headers(
+        self, authorization: str, extra: dict[str, str] | None
+    ) -> dict[str, str]:
+        headers = dict(self.BASE_HEADERS)
+        headers["Authorization"] = authorization
         if extra:
             headers.update(extra)
         return headers
 
-    def _request(
-        self,
-        method: str,
-        path: str,
-        *,
-        params: dict[str, Any] | None = None,
-        json: Any | None = None,
-        headers: dict[str, str] | None = None,
-    ) -> Any:
-        resp = self._http.request(
-            method,
-            path,
-            params=params,
-            json=json,
-            headers=self._headers(headers),
-        )
+    @staticmethod
+    def _body_headers(
+        headers: dict[str, str], files: dict[str, Any] | None
+    ) -> dict[str, str]:
+        if files:
+            # httpx supplies multipart/form-data with the boundary.
+            headers.pop("Content-Type", None)
+        return headers
+
+    @staticmethod
+    def _parse_response(resp: httpx.Response) -> Any:
         if resp.status_code == 204:
             return None
-        body = resp.json() if resp.content else None
+        try:
+            body = resp.json() if resp.content else None
+        except ValueError:
+            if resp.is_success:
+                raise
+            # Gateways and file endpoints can answer errors with HTML or text.
+            body = resp.text
         if not resp.is_success:
             raise EbayApiError(resp.status_code, body, str(resp.url))
         return body
 
-    def get(self, path: str, *, params: dict[str, Any] | None = None, headers: dict[str, str] | None = None) -> Any:
-        return self._request("GET", path, params=params, headers=headers)
-
-    def post(self, path: str, *, json: Any | None = None, params: dict[str, Any] | None = None, headers: dict[str, str] | None = None) -> Any:
-        return self._request("POST", path, json=json, params=params, headers=headers)
-
-    def put(self, path: str, *, json: Any | None = None, params: dict[str, Any] | None = None, headers: dict[str, str] | None = None) -> Any:
-        return self._request("PUT", path, json=json, params=params, headers=headers)
-
-    def delete(self, path: str, *, params: dict[str, Any] | None = None, headers: dict[str, str] | None = None) -> Any:
-        return self._request("DELETE", path, params=params, headers=headers)
-
-    def close(self) -> None:
-        self._http.close()
-
-    def __enter__(self) -> EbayClient:
-        return self
+    def _cache_lookup(
+        self,
+        method: str,
+        path: str,
+        params: dict[str, Any] | None,
+        headers: dict[str, str] | None,
+    ) -> CacheLookup | None:
+        if self._cache is None or method != "GET":
+            return None
+        ttl = self._cache.ttl_for(path)
+        if ttl is None:
+            return None
+        key = self._cache.key(self._base_url, path, params, headers)
+        return CacheLookup(key, ttl, self._cache.get(key))
 
-    def __exit__(self, *args: Any) -> None:
-        self.close()
+    def _cache_response(self, resp: httpx.Response, lookup: CacheLookup) -> Any:
+        if resp.status_code == 304 and lookup.entry is not None:
+            body = lookup.entry.body
+            etag = resp.headers.get("ETag", lookup.entry.etag)
+        else:
+            body = self._parse_response(resp)
+            etag = resp.headers.get("ETag")
+        self._cache.store(lookup.key, body, etag, lookup.ttl)
+        return body
 
     # -- sub-API accessors (lazy) ---------------------------------------------
 
@@ -145,3 +232,588 @@ class EbayClient:
     def commerce_taxonomy(self):
         from ebay_sdk.commerce.taxonomy import CommerceTaxonomyApi
         return CommerceTaxonomyApi(self)
+
+
+class EbayClient(_BaseEbayClient):
+    """Thin wrapper around eBay REST APIs.
+
+    Uses ``ldraney-ebay-oauth`` for token management and ``httpx`` for HTTP.
+
+    Parameters
+    ----------
+    oauth_client:
+        An authenticated ``EbayOAuthClient`` instance.
+    sandbox:
+        If *True*, hit the eBay sandbox environment instead of production.
+    timeout:
+        HTTP request timeout in seconds.
+    token_refresh_margin:
+        Seconds before the access token expires at which it is refreshed in
+        the background.
+    http_config:
+        Connection-pool, keep-alive, HTTP/2 and per-phase timeout settings;
+        see :class:`HttpConfig`.
+    retry:
+        Backoff policy for 429/5xx responses and transport errors; see
+        :class:`~ebay_sdk.retry.RetryPolicy`. Pass *None* to disable retries.
+    rate_limiter:
+        Optional :class:`~ebay_sdk.ratelimit.RateLimiter` that paces calls
+        per API family to stay under eBay's quotas.
+    cache:
+        Optional :class:`~ebay_sdk.cache.ResponseCache` for slow-changing
+        GET endpoints such as category trees and business policies.
+    """
+
+    def __init__(
+        self,
+        oauth_client: EbayOAuthClient,
+        *,
+        sandbox: bool = False,
+        timeout: float = 30.0,
+        token_refresh_margin: float = 300.0,
+        http_config: HttpConfig | None = None,
+        retry: RetryPolicy | None = RetryPolicy(),
+        rate_limiter: RateLimiter | None = None,
+        cache: ResponseCache | None = None,
+    ) -> None:
+        super().__init__(
+            oauth_client,
+            sandbox=sandbox,
+            token_refresh_margin=token_refresh_margin,
+            retry=retry,
+            rate_limiter=rate_limiter,
+            cache=cache,
+        )
+        http_config = http_config or HttpConfig()
+        self._http = httpx.Client(
+            base_url=self._base_url, **http_config.client_kwargs(timeout)
+        )
+
+    def _headers(self, extra: dict[str, str] | None = None) -> dict[str, str]:
+        return self._build_headers(self._token.get(), extra)
+
+    def _request(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: dict[str, Any] | None = None,
+        json: Any | None = None,
+        headers: dict[str, str] | None = None,
+        files: dict[str, Any] | None = None,
+        data: dict[str, Any] | None = None,
+    ) -> Any:
+        lookup = self._cache_lookup(method, path, params, headers)
+        if lookup is None:
+            resp = self._send(
+                method, path, params=params, json=json, headers=headers, files=files, data=data
+            )
+            return self._parse_response(resp)
+        if lookup.entry is not None and lookup.entry.fresh:
+            return lookup.entry.body
+        resp = self._send(
+            method, path, params=params, headers=lookup.request_headers(headers)
+        )
+        return self._cache_response(resp, lookup)
+
+    def _send(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: dict[str, Any] | None = None,
+        json: Any | None = None,
+        headers: dict[str, str] | None = None,
+        files: dict[str, Any] | None = None,
+        data: dict[str, Any] | None = None,
+        stream: bool = False,
+    ) -> httpx.Response:
+        """Issue a request with rate limiting and retries; return the response.
+
+        *files* and *data* send a multipart body instead of JSON; it is only
+        retried when every file can be rewound. With *stream*, the response
+        body is left unread for the caller to consume and close.
+        """
+        retry = self._retry if _replayable(files) else _NO_RETRY
+        # A 401 is retried once with a fresh token if the body can be resent.
+        reauthorize = _replayable(files)
+        attempt = 1
+        while True:
+            if self._limiter is not None:
+                wait = self._limiter.reserve(path)
+                if wait:
+                    time.sleep(wait)
+            try:
+                request = self._http.build_request(
+                    method,
+                    path,
+                    params=params,
+                    json=json,
+                    files=files,
+                    data=data,
+                    headers=self._body_headers(self._headers(headers), files),
+                )
+                resp = self._http.send(request, stream=stream)
+            except httpx.TransportError as exc:
+                if not retry.should_retry_error(method, exc, attempt):
+                    raise
+                delay = retry.delay(attempt)
+            else:
+                if resp.status_code == 401 and reauthorize:
+                    # The token was revoked before its tracked expiry.
+                    reauthorize = False
+                    resp.close()
+                    self._token.invalidate(request.headers.get("Authorization"))
+                    continue
+                if resp.is_success or not retry.should_retry_status(
+                    method, resp.status_code, attempt
+                ):
+                    return resp
+                delay = retry.delay(attempt, resp)
+                resp.close()
+            time.sleep(delay)
+            attempt += 1
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: dict[str, Any] | None = None,
+        json: Any | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> httpx.Response:
+        """Issue a request and return the raw response, e.g. to read headers.
+
+        Goes through the same rate limiting and retries as the other verbs
+        (but not the response cache); a non-2xx status raises
+        :class:`EbayApiError`.
+        """
+        resp = self._send(method, path, params=params, json=json, headers=headers)
+        if not resp.is_success:
+            self._parse_response(resp)
+        return resp
+
+    def get_bytes(
+        self,
+        path: str,
+        *,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> bytes:
+        """GET a binary body, such as a file download, without JSON decoding.
+
+        The whole body is held in memory; use :meth:`stream` or
+        :meth:`download` for large files. Not cached.
+        """
+        resp = self._send("GET", path, params=params, headers=headers)
+        if not resp.is_success:
+            self._parse_response(resp)
+        return resp.content
+
+    def get(self, path: str, *, params: dict[str, Any] | None = None, headers: dict[str, str] | None = None) -> Any:
+        return self._request("GET", path, params=params, headers=headers)
+
+    def post(self, path: str, *, json: Any | None = None, params: dict[str, Any] | None = None, headers: dict[str, str] | None = None, files: dict[str, Any] | None = None, data: dict[str, Any] | None = None) -> Any:
+        return self._request("POST", path, json=json, params=params, headers=headers, files=files, data=data)
+
+    def put(self, path: str, *, json: Any | None = None, params: dict[str, Any] | None = None, headers: dict[str, str] | None = None) -> Any:
+        return self._request("PUT", path, json=json, params=params, headers=headers)
+
+    def delete(self, path: str, *, params: dict[str, Any] | None = None, headers: dict[str, str] | None = None) -> Any:
+        return self._request("DELETE", path, params=params, headers=headers)
+
+    @contextmanager
+    def stream(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> Iterator[httpx.Response]:
+        """Issue a request whose body is read incrementally.
+
+        Yields the response with its body unread, to be consumed with
+        ``iter_bytes()``; it is closed when the block exits. A non-2xx status
+        raises :class:`EbayApiError` before anything is yielded. Streamed
+        requests bypass the response cache.
+        """
+        resp = self._send(method, path, params=params, headers=headers, stream=True)
+        try:
+            if not resp.is_success:
+                resp.read()
+                self._parse_response(resp)
+            yield resp
+        finally:
+            resp.close()
+
+    def download(
+        self,
+        path: str,
+        dest: str | os.PathLike[str] | IO[bytes],
+        *,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        resume: bool = True,
+        sha256: str | None = None,
+    ) -> DownloadResult:
+        """Stream a binary response body to *dest* without buffering it.
+
+        *dest* is a path or a writable binary file object. A path is
+        written via ``<dest>.part``: with *resume*, a partial file left by
+        an earlier attempt is continued with a ``Range`` request, and a
+        connection dropped mid-body is resumed the same way under the
+        retry policy. With *sha256*, the complete body is verified and
+        :class:`~ebay_sdk.streaming.ChecksumMismatchError` raised (and the
+        partial file discarded) on a mismatch.
+        """
+        with PartialDownload(dest, resume=resume) as part:
+            attempt = 1
+            while True:
+                request_headers = {**(headers or {}), **part.range_headers()}
+                try:
+                    with self.stream(
+                        "GET", path, params=params, headers=request_headers
+                    ) as resp:
+                        part.begin(resp.status_code)
+                        for chunk in resp.iter_bytes():
+                            part.write(chunk)
+                    break
+                except httpx.TransportError:
+                    if not part.resumable or attempt >= self._retry.max_attempts:
+                        raise
+                    time.sleep(self._retry.delay(attempt))
+                    attempt += 1
+                except EbayApiError as exc:
+                    # The partial file already holds the whole body.
+                    if exc.status_code == 416 and part.offset:
+                        break
+                    raise
+            return part.finish(sha256)
+
+    def paginate(
+        self,
+        fetch: PageFetcher,
+        items_key: str,
+        *,
+        page_size: int,
+        offset: int = 0,
+        prefetch: int = 0,
+    ) -> Iterator[Any]:
+        """Iterate the records of a list endpoint, fetching pages lazily.
+
+        With *prefetch* > 0, that many later pages are fetched concurrently
+        on worker threads while the current page is consumed.
+        """
+        return paginate(
+            fetch, items_key, page_size=page_size, offset=offset, prefetch=prefetch
+        )
+
+    def close(self) -> None:
+        self._http.close()
+
+    def __enter__(self) -> EbayClient:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+
+class AsyncEbayClient(_BaseEbayClient):
+    """Asyncio counterpart of :class:`EbayClient` built on ``httpx.AsyncClient``.
+
+    All sub-API accessors return the same API classes as :class:`EbayClient`;
+    every endpoint method returns an awaitable instead of the parsed body, so
+    a single event loop can keep many requests in flight over one shared
+    connection pool::
+
+        async with AsyncEbayClient(oauth) as ebay:
+            orders, items = await asyncio.gather(
+                ebay.sell_fulfillment.get_orders(limit=50),
+                ebay.sell_inventory.get_inventory_items(limit=100),
+            )
+
+    Parameters
+    ----------
+    oauth_client:
+        An authenticated ``EbayOAuthClient`` instance.
+    sandbox:
+        If *True*, hit the eBay sandbox environment instead of production.
+    timeout:
+        HTTP request timeout in seconds.
+    token_refresh_margin:
+        Seconds before the access token expires at which it is refreshed in
+        the background.
+    http_config:
+        Connection-pool, keep-alive, HTTP/2 and per-phase timeout settings;
+        see :class:`HttpConfig`.
+    retry:
+        Backoff policy for 429/5xx responses and transport errors; see
+        :class:`~ebay_sdk.retry.RetryPolicy`. Pass *None* to disable retries.
+    rate_limiter:
+        Optional :class:`~ebay_sdk.ratelimit.RateLimiter` that paces calls
+        per API family to stay under eBay's quotas.
+    cache:
+        Optional :class:`~ebay_sdk.cache.ResponseCache` for slow-changing
+        GET endpoints such as category trees and business policies.
+    """
+
+    def __init__(
+        self,
+        oauth_client: EbayOAuthClient,
+        *,
+        sandbox: bool = False,
+        timeout: float = 30.0,
+        token_refresh_margin: float = 300.0,
+        http_config: HttpConfig | None = None,
+        retry: RetryPolicy | None = RetryPolicy(),
+        rate_limiter: RateLimiter | None = None,
+        cache: ResponseCache | None = None,
+    ) -> None:
+        super().__init__(
+            oauth_client,
+            sandbox=sandbox,
+            token_refresh_margin=token_refresh_margin,
+            retry=retry,
+            rate_limiter=rate_limiter,
+            cache=cache,
+        )
+        http_config = http_config or HttpConfig()
+        self._http = httpx.AsyncClient(
+            base_url=self._base_url, **http_config.client_kwargs(timeout)
+        )
+
+    async def _headers(self, extra: dict[str, str] | None = None) -> dict[str, str]:
+        authorization = self._token.peek()
+        if authorization is None:
+            # The OAuth library blocks on the token endpoint; keep it off the loop.
+            authorization = await asyncio.to_thread(self._token.get)
+        return self._build_headers(authorization, extra)
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: dict[str, Any] | None = None,
+        json: Any | None = None,
+        headers: dict[str, str] | None = None,
+        files: dict[str, Any] | None = None,
+        data: dict[str, Any] | None = None,
+    ) -> Any:
+        lookup = self._cache_lookup(method, path, params, headers)
+        if lookup is None:
+            resp = await self._send(
+                method, path, params=params, json=json, headers=headers, files=files, data=data
+            )
+            return self._parse_response(resp)
+        if lookup.entry is not None and lookup.entry.fresh:
+            return lookup.entry.body
+        resp = await self._send(
+            method, path, params=params, headers=lookup.request_headers(headers)
+        )
+        return self._cache_response(resp, lookup)
+
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: dict[str, Any] | None = None,
+        json: Any | None = None,
+        headers: dict[str, str] | None = None,
+        files: dict[str, Any] | None = None,
+        data: dict[str, Any] | None = None,
+        stream: bool = False,
+    ) -> httpx.Response:
+        """Issue a request with rate limiting and retries; return the response.
+
+        *files* and *data* send a multipart body instead of JSON; it is only
+        retried when every file can be rewound. With *stream*, the response
+        body is left unread for the caller to consume and close.
+        """
+        retry = self._retry if _replayable(files) else _NO_RETRY
+        # A 401 is retried once with a fresh token if the body can be resent.
+        reauthorize = _replayable(files)
+        attempt = 1
+        while True:
+            if self._limiter is not None:
+                wait = self._limiter.reserve(path)
+                if wait:
+                    await asyncio.sleep(wait)
+            try:
+                request = self._http.build_request(
+                    method,
+                    path,
+                    params=params,
+                    json=json,
+                    files=files,
+                    data=data,
+                    headers=self._body_headers(await self._headers(headers), files),
+                )
+                resp = await self._http.send(request, stream=stream)
+            except httpx.TransportError as exc:
+                if not retry.should_retry_error(method, exc, attempt):
+                    raise
+                delay = retry.delay(attempt)
+            else:
+                if resp.status_code == 401 and reauthorize:
+                    # The token was revoked before its tracked expiry.
+                    reauthorize = False
+                    await resp.aclose()
+                    self._token.invalidate(request.headers.get("Authorization"))
+                    continue
+                if resp.is_success or not retry.should_retry_status(
+                    method, resp.status_code, attempt
+                ):
+                    return resp
+                delay = retry.delay(attempt, resp)
+                await resp.aclose()
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: dict[str, Any] | None = None,
+        json: Any | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> httpx.Response:
+        """Issue a request and return the raw response, e.g. to read headers.
+
+        Goes through the same rate limiting and retries as the other verbs
+        (but not the response cache); a non-2xx status raises
+        :class:`EbayApiError`.
+        """
+        resp = await self._send(method, path, params=params, json=json, headers=headers)
+        if not resp.is_success:
+            self._parse_response(resp)
+        return resp
+
+    async def get_bytes(
+        self,
+        path: str,
+        *,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> bytes:
+        """GET a binary body, such as a file download, without JSON decoding.
+
+        The whole body is held in memory; use :meth:`stream` or
+        :meth:`download` for large files. Not cached.
+        """
+        resp = await self._send("GET", path, params=params, headers=headers)
+        if not resp.is_success:
+            self._parse_response(resp)
+        return resp.content
+
+    async def get(self, path: str, *, params: dict[str, Any] | None = None, headers: dict[str, str] | None = None) -> Any:
+        return await self._request("GET", path, params=params, headers=headers)
+
+    async def post(self, path: str, *, json: Any | None = None, params: dict[str, Any] | None = None, headers: dict[str, str] | None = None, files: dict[str, Any] | None = None, data: dict[str, Any] | None = None) -> Any:
+        return await self._request("POST", path, json=json, params=params, headers=headers, files=files, data=data)
+
+    async def put(self, path: str, *, json: Any | None = None, params: dict[str, Any] | None = None, headers: dict[str, str] | None = None) -> Any:
+        return await self._request("PUT", path, json=json, params=params, headers=headers)
+
+    async def delete(self, path: str, *, params: dict[str, Any] | None = None, headers: dict[str, str] | None = None) -> Any:
+        return await self._request("DELETE", path, params=params, headers=headers)
+
+    @asynccontextmanager
+    async def stream(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> AsyncIterator[httpx.Response]:
+        """Issue a request whose body is read incrementally.
+
+        Yields the response with its body unread, to be consumed with
+        ``aiter_bytes()``; it is closed when the block exits. A non-2xx status
+        raises :class:`EbayApiError` before anything is yielded. Streamed
+        requests bypass the response cache.
+        """
+        resp = await self._send(method, path, params=params, headers=headers, stream=True)
+        try:
+            if not resp.is_success:
+                await resp.aread()
+                self._parse_response(resp)
+            yield resp
+        finally:
+            await resp.aclose()
+
+    async def download(
+        self,
+        path: str,
+        dest: str | os.PathLike[str] | IO[bytes],
+        *,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        resume: bool = True,
+        sha256: str | None = None,
+    ) -> DownloadResult:
+        """Stream a binary response body to *dest* without buffering it.
+
+        *dest* is a path or a writable binary file object. A path is
+        written via ``<dest>.part``: with *resume*, a partial file left by
+        an earlier attempt is continued with a ``Range`` request, and a
+        connection dropped mid-body is resumed the same way under the
+        retry policy. With *sha256*, the complete body is verified and
+        :class:`~ebay_sdk.streaming.ChecksumMismatchError` raised (and the
+        partial file discarded) on a mismatch.
+        """
+        with PartialDownload(dest, resume=resume) as part:
+            attempt = 1
+            while True:
+                request_headers = {**(headers or {}), **part.range_headers()}
+                try:
+                    async with self.stream(
+                        "GET", path, params=params, headers=request_headers
+                    ) as resp:
+                        part.begin(resp.status_code)
+                        async for chunk in resp.aiter_bytes():
+                            part.write(chunk)
+                    break
+                except httpx.TransportError:
+                    if not part.resumable or attempt >= self._retry.max_attempts:
+                        raise
+                    await asyncio.sleep(self._retry.delay(attempt))
+                    attempt += 1
+                except EbayApiError as exc:
+                    # The partial file already holds the whole body.
+                    if exc.status_code == 416 and part.offset:
+                        break
+                    raise
+            return part.finish(sha256)
+
+    def paginate(
+        self,
+        fetch: PageFetcher,
+        items_key: str,
+        *,
+        page_size: int,
+        offset: int = 0,
+        prefetch: int = 0,
+    ) -> AsyncIterator[Any]:
+        """Iterate the records of a list endpoint, fetching pages lazily.
+
+        With *prefetch* > 0, that many later pages are fetched concurrently
+        as event-loop tasks while the current page is consumed.
+        """
+        return apaginate(
+            fetch, items_key, page_size=page_size, offset=offset, prefetch=prefetch
+        )
+
+    async def aclose(self) -> None:
+        await self._http.aclose()
+
+    async def __aenter__(self) -> AsyncEbayClient:
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.aclose()
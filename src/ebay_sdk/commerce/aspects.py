@@ -0,0 +1,177 @@
+"""On-disk index of item aspects for every leaf category.
+
+``fetch_item_aspects`` returns the aspects of the whole marketplace as one
+gzipped document that can run to gigabytes. :meth:`AspectIndex.build`
+consumes it as a stream — one category at a time, straight into a SQLite
+file — and the index then answers per-category lookups with a primary-key
+read, keeping recently used categories parsed in memory::
+
+    index = AspectIndex.build(
+        "ebay-us-aspects.db", ebay.commerce_taxonomy.iter_item_aspects("0")
+    )
+    index.validate("9355", {"Brand": "Apple", "Model": "iPhone 13"})
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+from collections.abc import Iterable, Mapping, Sequence
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, NamedTuple
+
+
+class AspectRule(NamedTuple):
+    """The constraints eBay places on one aspect of a category."""
+
+    name: str
+    required: bool
+    selection_only: bool
+    multi_valued: bool
+    max_length: int | None
+    values: frozenset[str]
+
+
+class AspectIndex:
+    """Read-only view of an aspect index written by :meth:`build`.
+
+    Parameters
+    ----------
+    path:
+        The SQLite file.
+    cache_size:
+        How many categories' parsed rules to keep in memory.
+    """
+
+    def __init__(self, path: str | Path, *, cache_size: int = 4096) -> None:
+        self._path = str(path)
+        self._local = threading.local()
+        meta = dict(self._connect().execute("SELECT key, value FROM meta"))
+        self.tree_id = meta.get("tree_id")
+        self.version = meta.get("version")
+        self.rules = lru_cache(maxsize=cache_size)(self._load_rules)
+
+    @classmethod
+    def build(
+        cls,
+        path: str | Path,
+        records: Iterable[dict[str, Any]],
+        *,
+        tree_id: str | None = None,
+        version: str | None = None,
+    ) -> AspectIndex:
+        """Write *records* (``categoryAspects`` entries) to *path* and open it.
+
+        Records are inserted as they arrive, so passing the generator from
+        :meth:`CommerceTaxonomyApi.iter_item_aspects` never materialises the
+        full download.
+        """
+        with sqlite3.connect(str(path)) as conn:
+            conn.executescript(
+                "DROP TABLE IF EXISTS meta; DROP TABLE IF EXISTS aspects;"
+                "CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT);"
+                "CREATE TABLE aspects (category_id TEXT PRIMARY KEY,"
+                " name TEXT NOT NULL, aspects TEXT NOT NULL);"
+            )
+            conn.executemany(
+                "INSERT INTO meta VALUES (?, ?)",
+                [("tree_id", tree_id), ("version", version)],
+            )
+            conn.executemany(
+                "INSERT OR REPLACE INTO aspects VALUES (?, ?, ?)",
+                (
+                    (
+                        record["category"]["categoryId"],
+                        record["category"].get("categoryName", ""),
+                        json.dumps(record.get("aspects") or [], separators=(",", ":")),
+                    )
+                    for record in records
+                ),
+            )
+        conn.close()
+        return cls(path)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self._path, check_same_thread=False)
+            self._local.conn = conn
+        return conn
+
+    # -- lookups ---------------------------------------------------------------
+
+    def __contains__(self, category_id: object) -> bool:
+        return self._connect().execute(
+            "SELECT 1 FROM aspects WHERE category_id = ?", (category_id,)
+        ).fetchone() is not None
+
+    def __len__(self) -> int:
+        return self._connect().execute("SELECT COUNT(*) FROM aspects").fetchone()[0]
+
+    def aspects(self, category_id: str) -> list[dict[str, Any]]:
+        """The raw ``aspects`` list eBay returned for *category_id*."""
+        row = self._connect().execute(
+            "SELECT aspects FROM aspects WHERE category_id = ?", (category_id,)
+        ).fetchone()
+        if row is None:
+            raise KeyError(category_id)
+        return json.loads(row[0])
+
+    def _load_rules(self, category_id: str) -> Mapping[str, AspectRule]:
+        rules = {}
+        for aspect in self.aspects(category_id):
+            constraint = aspect.get("aspectConstraint") or {}
+            name = aspect["localizedAspectName"]
+            rules[name.casefold()] = AspectRule(
+                name=name,
+                required=bool(constraint.get("aspectRequired")),
+                selection_only=constraint.get("aspectMode") == "SELECTION_ONLY",
+                multi_valued=constraint.get("itemToAspectCardinality") == "MULTI",
+                max_length=constraint.get("aspectMaxLength"),
+                values=frozenset(
+                    v["localizedValue"].casefold()
+                    for v in aspect.get("aspectValues") or ()
+                ),
+            )
+        return rules
+
+    def validate(
+        self, category_id: str, specifics: Mapping[str, str | Sequence[str]]
+    ) -> list[str]:
+        """Problems with *specifics* for a listing in *category_id*.
+
+        An empty list means the item specifics satisfy every required,
+        cardinality, length and closed-vocabulary constraint. Aspects the
+        category does not define are allowed, as eBay accepts custom ones.
+        Raises :class:`KeyError` for a category not in the index.
+        """
+        rules = self.rules(category_id)
+        given = {
+            name.casefold(): [value] if isinstance(value, str) else list(value)
+            for name, value in specifics.items()
+        }
+        problems = []
+        for key, rule in rules.items():
+            values = [v for v in given.get(key, ()) if v]
+            if not values:
+                if rule.required:
+                    problems.append(f"missing required aspect {rule.name!r}")
+                continue
+            if len(values) > 1 and not rule.multi_valued:
+                problems.append(f"{rule.name!r} accepts a single value")
+            for value in values:
+                if rule.max_length is not None and len(value) > rule.max_length:
+                    problems.append(
+                        f"{rule.name!r} value {value!r} exceeds {rule.max_length} characters"
+                    )
+                if rule.selection_only and value.casefold() not in rule.values:
+                    problems.append(f"{rule.name!r} does not accept {value!r}")
+        return problems
+
+    def close(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
@@ -0,0 +1,142 @@
+"""Offline category suggestions from a local :class:`CategoryTree`.
+
+Builds an inverted index from the words in each leaf category's name and
+path, and ranks categories for a listing title by IDF-weighted word overlap.
+Only when the best local match is weak does it fall back to
+``get_category_suggestions``, so bulk listing runs resolve most titles
+without a network round-trip::
+
+    suggester = CategorySuggester(tree, taxonomy=ebay.commerce_taxonomy)
+    best = suggester.suggest("Canon EF 50mm f/1.8 lens")[0]
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from collections import defaultdict
+from typing import TYPE_CHECKING, NamedTuple
+
+from ebay_sdk.commerce.category_tree import CategoryTree
+
+if TYPE_CHECKING:
+    from ebay_sdk.commerce.taxonomy import CommerceTaxonomyApi
+
+_WORD = re.compile(r"[a-z0-9]+")
+_STOPWORDS = frozenset({"a", "an", "and", "by", "for", "in", "of", "on", "or", "the", "to", "with"})
+# A word in the category's own name counts fully; one from an ancestor's
+# name only narrows the department.
+_NAME_WEIGHT = 1.0
+_ANCESTOR_WEIGHT = 0.5
+
+
+class CategorySuggestion(NamedTuple):
+    category_id: str
+    name: str
+    path: str
+    score: float | None
+    source: str
+
+
+def tokenize(text: str) -> list[str]:
+    """Lower-case words of *text* with stopwords removed and plurals folded."""
+    words = []
+    for word in _WORD.findall(text.lower()):
+        if word in _STOPWORDS:
+            continue
+        if len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+            word = word[:-1]
+        words.append(word)
+    return words
+
+
+class CategorySuggester:
+    """Ranks leaf categories for free-text titles.
+
+    Parameters
+    ----------
+    tree:
+        The category tree to index.
+    taxonomy:
+        ``ebay.commerce_taxonomy`` of a synchronous :class:`EbayClient`, used
+        as the fallback; without it suggestions are always local.
+    min_score:
+        Local results whose best score (0–1, the share of the title's
+        weighted words matched) is below this are replaced by the remote
+        suggestions.
+    """
+
+    def __init__(
+        self,
+        tree: CategoryTree,
+        *,
+        taxonomy: CommerceTaxonomyApi | None = None,
+        min_score: float = 0.5,
+    ) -> None:
+        self._tree = tree
+        self._taxonomy = taxonomy
+        self._min_score = min_score
+        self._postings: dict[str, dict[str, float]] = defaultdict(dict)
+        leaves = 0
+        for category in tree.leaves():
+            leaves += 1
+            weights: dict[str, float] = {}
+            for ancestor in tree.ancestors(category.category_id):
+                for word in tokenize(ancestor.name):
+                    weights[word] = _ANCESTOR_WEIGHT
+            for word in tokenize(category.name):
+                weights[word] = _NAME_WEIGHT
+            for word, weight in weights.items():
+                self._postings[word][category.category_id] = weight
+        self._idf = {
+            word: math.log(1 + leaves / len(postings))
+            for word, postings in self._postings.items()
+        }
+        # Words the taxonomy has never seen (brands, model numbers) lower
+        # confidence, but less than a known word that failed to match would.
+        self._unknown_idf = math.log(1 + leaves) / 2
+
+    def suggest_local(self, title: str, *, limit: int = 5) -> list[CategorySuggestion]:
+        """Rank categories for *title* using only the local index."""
+        words = set(tokenize(title))
+        if not words:
+            return []
+        total = sum(self._idf.get(word, self._unknown_idf) for word in words)
+        scores: dict[str, float] = defaultdict(float)
+        for word in words:
+            idf = self._idf.get(word)
+            if idf is None:
+                continue
+            for category_id, weight in self._postings[word].items():
+                scores[category_id] += idf * weight
+        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)[:limit]
+        return [
+            CategorySuggestion(
+                category_id,
+                self._tree[category_id].name,
+                self._tree.path(category_id),
+                score / total,
+                "local",
+            )
+            for category_id, score in ranked
+        ]
+
+    def suggest(self, title: str, *, limit: int = 5) -> list[CategorySuggestion]:
+        """Rank categories for *title*, asking eBay only on low confidence."""
+        local = self.suggest_local(title, limit=limit)
+        if self._taxonomy is None or (local and local[0].score >= self._min_score):
+            return local
+        response = self._taxonomy.get_category_suggestions(self._tree.tree_id, title)
+        remote = []
+        for suggestion in (response or {}).get("categorySuggestions", [])[:limit]:
+            category = suggestion["category"]
+            category_id = category["categoryId"]
+            path = (
+                self._tree.path(category_id)
+                if category_id in self._tree
+                else category.get("categoryName", "")
+            )
+            remote.append(CategorySuggestion(
+                category_id, category.get("categoryName", ""), path, None, "remote"
+            ))
+        return remote or local
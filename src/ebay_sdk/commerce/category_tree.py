@@ -0,0 +1,224 @@
+"""Indexed, persistable form of a Taxonomy API category tree.
+
+``get_category_tree`` returns the whole marketplace taxonomy as one deeply
+nested JSON document. :class:`CategoryTree` flattens it once into dictionary
+indexes so that looking up a category, its parent, ancestors, children or
+display path is a dict access rather than a tree walk, and stores it in a
+small SQLite file so the multi-megabyte download is not repeated::
+
+    tree = CategoryTree.from_response(ebay.commerce_taxonomy.get_category_tree("0"))
+    tree.save("ebay-us-categories.db")
+    ...
+    tree = CategoryTree.load("ebay-us-categories.db")
+    tree.path("9355")  # 'Cell Phones & Accessories > Cell Phones & Smartphones'
+"""
+
+from __future__ import annotations
+
+import itertools
+import sqlite3
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any, NamedTuple
+
+
+class Category(NamedTuple):
+    category_id: str
+    name: str
+    parent_id: str | None
+    level: int
+    leaf: bool
+
+
+class CategoryTree:
+    """Flat, indexed category tree.
+
+    Parameters
+    ----------
+    categories:
+        Every node of the tree, root included, in any order.
+    tree_id:
+        The ``categoryTreeId`` the nodes belong to.
+    version:
+        The ``categoryTreeVersion`` the nodes were fetched at.
+    """
+
+    def __init__(
+        self,
+        categories: Iterable[Category],
+        *,
+        tree_id: str,
+        version: str | None = None,
+    ) -> None:
+        self.tree_id = tree_id
+        self.version = version
+        self._categories: dict[str, Category] = {}
+        self._children: dict[str, list[str]] = {}
+        self._paths: dict[str, tuple[str, ...]] = {}
+        self.root_id: str | None = None
+        for category in categories:
+            self._add(category)
+
+    # -- construction ----------------------------------------------------------
+
+    @classmethod
+    def from_response(cls, response: dict[str, Any]) -> CategoryTree:
+        """Build from a ``get_category_tree`` response."""
+        tree = cls(
+            (),
+            tree_id=response.get("categoryTreeId", ""),
+            version=response.get("categoryTreeVersion"),
+        )
+        tree._add_nodes(response["rootCategoryNode"], None)
+        return tree
+
+    def _add_nodes(self, node: dict[str, Any], parent_id: str | None) -> None:
+        # Iterative walk: the response can be arbitrarily deep.
+        stack = [(node, parent_id)]
+        while stack:
+            node, parent_id = stack.pop()
+            info = node["category"]
+            category_id = info["categoryId"]
+            children = node.get("childCategoryTreeNodes") or []
+            self._add(Category(
+                category_id=category_id,
+                name=info.get("categoryName", ""),
+                parent_id=parent_id,
+                level=node.get("categoryTreeNodeLevel", 0),
+                leaf=node.get("leafCategoryTreeNode", not children),
+            ))
+            stack.extend((child, category_id) for child in reversed(children))
+
+    def replace_subtree(self, node: dict[str, Any]) -> None:
+        """Swap a category and everything below it for a fresh copy.
+
+        *node* is the ``categorySubtreeNode`` of a ``get_category_subtree``
+        response; its category must already be in the tree.
+        """
+        category_id = node["category"]["categoryId"]
+        parent_id = self._categories[category_id].parent_id
+        for category in list(self.descendants(category_id)):
+            del self._categories[category.category_id]
+            del self._children[category.category_id]
+        del self._categories[category_id]
+        del self._children[category_id]
+        self._paths.clear()
+        siblings = self._children.get(parent_id) if parent_id is not None else None
+        position = siblings.index(category_id) if siblings is not None else 0
+        if siblings is not None:
+            siblings.remove(category_id)
+        self._add_nodes(node, parent_id)
+        if siblings is not None:
+            # Keep the subtree where it was among its siblings.
+            siblings.insert(position, siblings.pop())
+
+    def _add(self, category: Category) -> None:
+        self._categories[category.category_id] = category
+        self._children.setdefault(category.category_id, [])
+        if category.parent_id is None:
+            self.root_id = category.category_id
+        else:
+            self._children.setdefault(category.parent_id, []).append(category.category_id)
+
+    # -- lookups ---------------------------------------------------------------
+
+    def __getitem__(self, category_id: str) -> Category:
+        return self._categories[category_id]
+
+    def __contains__(self, category_id: object) -> bool:
+        return category_id in self._categories
+
+    def __len__(self) -> int:
+        return len(self._categories)
+
+    def __iter__(self) -> Iterator[Category]:
+        return iter(self._categories.values())
+
+    def get(self, category_id: str) -> Category | None:
+        return self._categories.get(category_id)
+
+    def parent(self, category_id: str) -> Category | None:
+        parent_id = self._categories[category_id].parent_id
+        return None if parent_id is None else self._categories[parent_id]
+
+    def children(self, category_id: str) -> list[Category]:
+        return [self._categories[c] for c in self._children.get(category_id, ())]
+
+    def ancestors(self, category_id: str) -> list[Category]:
+        """Ancestors from the top-level category down, excluding the root."""
+        chain = []
+        parent_id = self._categories[category_id].parent_id
+        while parent_id is not None and parent_id != self.root_id:
+            category = self._categories[parent_id]
+            chain.append(category)
+            parent_id = category.parent_id
+        chain.reverse()
+        return chain
+
+    def descendants(self, category_id: str) -> Iterator[Category]:
+        """All categories below *category_id*, depth first."""
+        stack = list(reversed(self._children.get(category_id, ())))
+        while stack:
+            child_id = stack.pop()
+            yield self._categories[child_id]
+            stack.extend(reversed(self._children.get(child_id, ())))
+
+    def leaves(self, category_id: str | None = None) -> Iterator[Category]:
+        """Leaf categories of the whole tree, or below *category_id*."""
+        nodes = self if category_id is None else self.descendants(category_id)
+        return (category for category in nodes if category.leaf)
+
+    def path(self, category_id: str, sep: str = " > ") -> str:
+        """Display path such as ``"Electronics > Cameras > Lenses"``."""
+        return sep.join(self.path_names(category_id))
+
+    def path_names(self, category_id: str) -> tuple[str, ...]:
+        """Category names from the top level down to *category_id*."""
+        names = self._paths.get(category_id)
+        if names is None:
+            names = tuple(c.name for c in self.ancestors(category_id))
+            if category_id != self.root_id:
+                names += (self._categories[category_id].name,)
+            self._paths[category_id] = names
+        return names
+
+    # -- persistence -----------------------------------------------------------
+
+    def save(self, path: str | Path) -> None:
+        """Write the tree to a SQLite file, replacing any previous contents."""
+        with sqlite3.connect(str(path)) as conn:
+            conn.executescript(
+                "DROP TABLE IF EXISTS meta; DROP TABLE IF EXISTS categories;"
+                "CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT);"
+                "CREATE TABLE categories (id TEXT PRIMARY KEY, name TEXT NOT NULL,"
+                " parent_id TEXT, level INTEGER NOT NULL, leaf INTEGER NOT NULL);"
+            )
+            conn.executemany(
+                "INSERT INTO meta VALUES (?, ?)",
+                [("tree_id", self.tree_id), ("version", self.version)],
+            )
+            # Depth-first order, so sibling order survives a reload.
+            nodes = (
+                self
+                if self.root_id is None
+                else itertools.chain([self[self.root_id]], self.descendants(self.root_id))
+            )
+            conn.executemany("INSERT INTO categories VALUES (?, ?, ?, ?, ?)", nodes)
+        conn.close()
+
+    @classmethod
+    def load(cls, path: str | Path) -> CategoryTree:
+        """Read a tree written by :meth:`save`."""
+        conn = sqlite3.connect(str(path))
+        try:
+            meta = dict(conn.execute("SELECT key, value FROM meta"))
+            rows = conn.execute(
+                "SELECT id, name, parent_id, level, leaf FROM categories ORDER BY rowid"
+            ).fetchall()
+        finally:
+            conn.close()
+        return cls(
+            (Category(r[0], r[1], r[2], r[3], bool(r[4])) for r in rows),
+            tree_id=meta.get("tree_id", ""),
+            version=meta.get("version"),
+        )
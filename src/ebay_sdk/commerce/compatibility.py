@@ -0,0 +1,221 @@
+"""Memoised resolver for parts-compatibility (fitment) properties.
+
+Fitment is a chain of dependent lookups — the models available depend on
+the year and make already chosen — so building it for many SKUs repeats
+the same ``get_compatibility_property_values`` queries over and over.
+:class:`CompatibilityResolver` caches every value list by property and
+canonical filter prefix, lets concurrent callers of an identical lookup
+share one request, and can walk a category's whole fitment tree once and
+save it, so later runs resolve entirely from a local file::
+
+    resolver = CompatibilityResolver(
+        ebay.commerce_taxonomy, "100", "33559", properties=["Year", "Make", "Model"]
+    )
+    resolver.values("Model", {"Year": "2018", "Make": "Toyota"})
+    resolver.expand({"Year": "2018", "Make": "Toyota", "Model": "Camry"})
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+from collections.abc import Iterable, Mapping, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ebay_sdk.commerce.taxonomy import CommerceTaxonomyApi
+
+Fitment = dict[str, str]
+_Key = tuple[str, tuple[tuple[str, str], ...]]
+
+
+class CompatibilityResolver:
+    """Caching front end to the Taxonomy compatibility endpoints.
+
+    Parameters
+    ----------
+    taxonomy:
+        ``ebay.commerce_taxonomy`` of a synchronous :class:`EbayClient`.
+    category_tree_id, category_id:
+        The parts category whose compatibility properties are resolved.
+    properties:
+        The property chain, most general first (e.g. ``Year``, ``Make``,
+        ``Model``, ``Trim``). Defaults to the order eBay lists them in.
+    """
+
+    def __init__(
+        self,
+        taxonomy: CommerceTaxonomyApi,
+        category_tree_id: str,
+        category_id: str,
+        *,
+        properties: Sequence[str] | None = None,
+    ) -> None:
+        self._taxonomy = taxonomy
+        self.category_tree_id = category_tree_id
+        self.category_id = category_id
+        self._properties = tuple(properties) if properties is not None else None
+        self._values: dict[_Key, tuple[str, ...]] = {}
+        self._inflight: dict[_Key, Future[tuple[str, ...]]] = {}
+        self._lock = threading.Lock()
+        self.calls = 0
+
+    def properties(self) -> tuple[str, ...]:
+        """The property chain, fetched once if not given."""
+        if self._properties is None:
+            response = self._taxonomy.get_compatibility_properties(
+                self.category_tree_id, self.category_id
+            )
+            self._properties = tuple(
+                prop["name"] for prop in (response or {}).get("compatibilityProperties", [])
+            )
+        return self._properties
+
+    def values(
+        self, compatibility_property: str, filters: Mapping[str, str] | None = None
+    ) -> tuple[str, ...]:
+        """Values of *compatibility_property* given the *filters* already chosen.
+
+        Filters are canonicalised to the property order, so
+        ``{"Make": "Toyota", "Year": "2018"}`` and its reverse share an entry.
+        Concurrent calls for the same key wait for a single request.
+        """
+        key = self._key(compatibility_property, filters or {})
+        with self._lock:
+            cached = self._values.get(key)
+            if cached is not None:
+                return cached
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = self._inflight[key] = Future()
+        if not owner:
+            return future.result()
+        try:
+            values = self._fetch(key)
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            with self._lock:
+                self._values[key] = values
+            future.set_result(values)
+            return values
+        finally:
+            with self._lock:
+                del self._inflight[key]
+
+    def is_valid(self, fitment: Mapping[str, str]) -> bool:
+        """Whether each value in *fitment* is offered given the ones before it."""
+        chosen: Fitment = {}
+        for prop in self.properties():
+            if prop not in fitment:
+                continue
+            if fitment[prop] not in self.values(prop, chosen):
+                return False
+            chosen[prop] = fitment[prop]
+        return True
+
+    def expand(
+        self, partial: Mapping[str, str], *, max_workers: int = 8
+    ) -> list[Fitment]:
+        """Every complete fitment that extends *partial*."""
+        return self.expand_many([partial], max_workers=max_workers)[0]
+
+    def expand_many(
+        self, partials: Iterable[Mapping[str, str]], *, max_workers: int = 8
+    ) -> list[list[Fitment]]:
+        """:meth:`expand` for many partial fitments, sharing one thread pool.
+
+        The tree is walked a property at a time, so all lookups for one
+        level run concurrently and each distinct prefix is queried once.
+        """
+        frontier = [(index, dict(partial)) for index, partial in enumerate(partials)]
+        results: list[list[Fitment]] = [[] for _ in frontier]
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            for prop in self.properties():
+                pending = [(i, f) for i, f in frontier if prop not in f]
+                done = [(i, f) for i, f in frontier if prop in f]
+                lookups = pool.map(lambda item: self.values(prop, item[1]), pending)
+                frontier = done
+                for (index, fitment), values in zip(pending, lookups):
+                    if not values:
+                        frontier.append((index, fitment))
+                    frontier.extend((index, {**fitment, prop: value}) for value in values)
+        for index, fitment in frontier:
+            results[index].append(fitment)
+        return results
+
+    # -- persistence -----------------------------------------------------------
+
+    def precompute(self, path: str | Path, *, max_workers: int = 8) -> int:
+        """Resolve the category's entire fitment tree and :meth:`save` it.
+
+        Returns the number of complete fitments. Limit ``properties`` when
+        constructing the resolver to keep the walk to a practical depth.
+        """
+        fitments = self.expand({}, max_workers=max_workers)
+        self.save(path)
+        return len(fitments)
+
+    def save(self, path: str | Path) -> None:
+        """Write every cached value list to a JSON file."""
+        with self._lock:
+            entries = [
+                [prop, [list(pair) for pair in prefix], list(values)]
+                for (prop, prefix), values in self._values.items()
+            ]
+        document = {
+            "categoryTreeId": self.category_tree_id,
+            "categoryId": self.category_id,
+            "properties": list(self.properties()),
+            "values": entries,
+        }
+        Path(path).write_text(json.dumps(document, separators=(",", ":")))
+
+    @classmethod
+    def load(cls, taxonomy: CommerceTaxonomyApi, path: str | Path) -> CompatibilityResolver:
+        """A resolver pre-filled from a file written by :meth:`save`.
+
+        Lookups missing from the file still go to *taxonomy*.
+        """
+        document = json.loads(Path(path).read_text())
+        resolver = cls(
+            taxonomy,
+            document["categoryTreeId"],
+            document["categoryId"],
+            properties=document["properties"],
+        )
+        for prop, prefix, values in document["values"]:
+            resolver._values[(prop, tuple(tuple(pair) for pair in prefix))] = tuple(values)
+        return resolver
+
+    # -- internals -------------------------------------------------------------
+
+    def _key(self, compatibility_property: str, filters: Mapping[str, str]) -> _Key:
+        order = self.properties()
+        prefix = [(p, filters[p]) for p in order if p in filters]
+        prefix += sorted((p, v) for p, v in filters.items() if p not in order)
+        return compatibility_property, tuple(prefix)
+
+    def _fetch(self, key: _Key) -> tuple[str, ...]:
+        prop, prefix = key
+        with self._lock:
+            self.calls += 1
+        response = self._taxonomy.get_compatibility_property_values(
+            self.category_tree_id,
+            prop,
+            self.category_id,
+            filter=",".join(f"{p}:{_escape(v)}" for p, v in prefix) or None,
+        )
+        return tuple(
+            entry["value"]
+            for entry in (response or {}).get("compatibilityPropertyValues", [])
+        )
+
+
+def _escape(value: str) -> str:
+    # eBay splits the filter on commas; literal ones must be escaped.
+    return value.replace(",", r"\,")
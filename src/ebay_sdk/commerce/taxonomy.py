@@ -6,16 +6,19 @@ Version: v1.1.1
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from typing import Any, TYPE_CHECKING
 
+from ebay_sdk.streaming import gunzip_chunks, iter_json_array
+
 if TYPE_CHECKING:
-    from ebay_sdk.client import EbayClient
+    from ebay_sdk.client import AsyncEbayClient, EbayClient
 
 _BASE = "/commerce/taxonomy/v1"
 
 
 class CommerceTaxonomyApi:
-    def __init__(self, client: EbayClient) -> None:
+    def __init__(self, client: EbayClient | AsyncEbayClient) -> None:
         self._c = client
 
     def get_default_category_tree_id(self, marketplace_id: str) -> Any:
@@ -96,3 +99,17 @@ class CommerceTaxonomyApi:
         return self._c.get(
             f"{_BASE}/category_tree/{category_tree_id}/fetch_item_aspects"
         )
+
+    def iter_item_aspects(self, category_tree_id: str) -> Iterator[dict[str, Any]]:
+        """Stream ``fetch_item_aspects``, yielding one category's entry at a time.
+
+        The (gzipped) download is decompressed and parsed incrementally, so
+        memory stays bounded regardless of the marketplace size. Each entry
+        has ``category`` and ``aspects`` keys. Requires :class:`EbayClient`.
+        """
+        with self._c.stream(
+            "GET", f"{_BASE}/category_tree/{category_tree_id}/fetch_item_aspects"
+        ) as resp:
+            yield from iter_json_array(
+                gunzip_chunks(resp.iter_bytes()), "categoryAspects"
+            )
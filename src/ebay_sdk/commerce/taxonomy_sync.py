@@ -0,0 +1,213 @@
+"""Incremental synchronisation of a local :class:`CategoryTree`.
+
+Each :meth:`TaxonomySync.sync` costs one ``get_default_category_tree_id``
+call when eBay's ``categoryTreeVersion`` has not moved. When it has, the
+expired-category mappings are fetched and only the top-level subtrees they
+touch are re-downloaded with ``get_category_subtree``; the full tree is
+fetched only on first use, when a remapping points somewhere the local tree
+cannot place, or once ``full_refresh_after`` has elapsed (new categories
+that expire nothing are otherwise invisible to an incremental sync).
+
+The mappings are kept next to the tree, so stale category ids stored in
+inventory can be translated with :meth:`TaxonomySync.remap`::
+
+    sync = TaxonomySync(ebay.commerce_taxonomy, "ebay-us-categories.db")
+    sync.sync()
+    sync.remap("29792")  # -> the category that replaced it
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from ebay_sdk.client import EbayApiError
+from ebay_sdk.commerce.category_tree import CategoryTree
+
+if TYPE_CHECKING:
+    from ebay_sdk.commerce.taxonomy import CommerceTaxonomyApi
+
+
+@dataclass
+class SyncResult:
+    """What a :meth:`TaxonomySync.sync` did."""
+
+    version: str | None
+    previous_version: str | None
+    full: bool = False
+    refreshed: list[str] = field(default_factory=list)
+    remapped: int = 0
+
+    @property
+    def changed(self) -> bool:
+        return self.version != self.previous_version
+
+
+class TaxonomySync:
+    """Keeps a category tree file current with minimal downloads.
+
+    Parameters
+    ----------
+    taxonomy:
+        ``ebay.commerce_taxonomy`` of a synchronous :class:`EbayClient`.
+    path:
+        SQLite file holding the tree (as written by
+        :meth:`CategoryTree.save`) plus the sync state and remappings.
+    marketplace_id:
+        Marketplace whose default tree is tracked.
+    full_refresh_after:
+        Seconds after which the next version change triggers a full
+        download instead of an incremental one.
+    """
+
+    def __init__(
+        self,
+        taxonomy: CommerceTaxonomyApi,
+        path: str | Path,
+        *,
+        marketplace_id: str = "EBAY_US",
+        full_refresh_after: float = 7 * 24 * 3600.0,
+    ) -> None:
+        self._taxonomy = taxonomy
+        self._path = str(path)
+        self._marketplace_id = marketplace_id
+        self._full_refresh_after = full_refresh_after
+        self._tree: CategoryTree | None = None
+        with sqlite3.connect(self._path) as conn:
+            conn.executescript(
+                "CREATE TABLE IF NOT EXISTS sync_state (key TEXT PRIMARY KEY, value TEXT);"
+                "CREATE TABLE IF NOT EXISTS expired_categories"
+                " (from_id TEXT PRIMARY KEY, to_id TEXT NOT NULL);"
+            )
+            self._remaps = dict(conn.execute("SELECT from_id, to_id FROM expired_categories"))
+            self._state = dict(conn.execute("SELECT key, value FROM sync_state"))
+        conn.close()
+
+    @property
+    def tree(self) -> CategoryTree:
+        """The local tree, loaded on first access (synced if there is none)."""
+        if self._tree is None:
+            if "version" not in self._state:
+                self.sync()
+            else:
+                self._tree = CategoryTree.load(self._path)
+        assert self._tree is not None
+        return self._tree
+
+    def sync(self) -> SyncResult:
+        """Bring the local tree up to eBay's current version."""
+        current = self._taxonomy.get_default_category_tree_id(self._marketplace_id)
+        tree_id = current["categoryTreeId"]
+        version = current.get("categoryTreeVersion")
+        previous = self._state.get("version")
+        result = SyncResult(version=version, previous_version=previous)
+        if previous is not None and previous == version and self._state.get("tree_id") == tree_id:
+            return result
+
+        remaps = self._expired_categories(tree_id)
+        result.remapped = len(remaps.keys() - self._remaps.keys())
+        last_full = float(self._state.get("last_full", 0))
+        needs_full = (
+            previous is None
+            or self._state.get("tree_id") != tree_id
+            or time.time() - last_full >= self._full_refresh_after
+        )
+        if not needs_full:
+            tree = self.tree
+            new = {k: v for k, v in remaps.items() if self._remaps.get(k) != v}
+            for category_id in self._affected_roots(tree, new):
+                try:
+                    response = self._taxonomy.get_category_subtree(tree_id, category_id)
+                except EbayApiError as exc:
+                    if exc.status_code != 404:
+                        raise
+                    # The top-level category itself expired; only a full
+                    # download can rebuild that part of the tree.
+                    needs_full = True
+                    break
+                tree.replace_subtree(response["categorySubtreeNode"])
+                result.refreshed.append(category_id)
+            # A replacement that lives under a different top-level category
+            # is still missing after the refresh.
+            if any(v not in tree and v not in remaps for v in new.values()):
+                needs_full = True
+        if needs_full:
+            tree = CategoryTree.from_response(self._taxonomy.get_category_tree(tree_id))
+            last_full = time.time()
+            result.full = True
+            result.refreshed = []
+        tree.version = version
+        self._save(
+            tree, remaps, {"tree_id": tree_id, "version": version, "last_full": str(last_full)}
+        )
+        return result
+
+    def remap(self, category_id: str) -> str:
+        """The active category that replaced *category_id*, or itself.
+
+        Chains of expirations are followed to the final replacement.
+        """
+        seen = {category_id}
+        while category_id in self._remaps:
+            category_id = self._remaps[category_id]
+            if category_id in seen:
+                break
+            seen.add(category_id)
+        return category_id
+
+    def remap_many(self, category_ids: Iterable[str]) -> dict[str, str]:
+        """Map each stale id in *category_ids* to its replacement."""
+        return {
+            category_id: replacement
+            for category_id in category_ids
+            if (replacement := self.remap(category_id)) != category_id
+        }
+
+    # -- internals -------------------------------------------------------------
+
+    def _expired_categories(self, tree_id: str) -> dict[str, str]:
+        try:
+            response = self._taxonomy.get_expired_categories(tree_id)
+        except EbayApiError as exc:
+            if exc.status_code == 404:  # no expirations for this tree
+                return {}
+            raise
+        return {
+            mapping["fromExpiredCategoryId"]: mapping["toCategoryId"]
+            for mapping in (response or {}).get("expiredCategories", [])
+        }
+
+    @staticmethod
+    def _affected_roots(tree: CategoryTree, remaps: dict[str, str]) -> list[str]:
+        """Top-level categories containing either end of a remapping.
+
+        A replacement not yet in the local tree (a split or a new id) is
+        usually created next to the category it replaces, so refreshing the
+        expired category's top-level subtree brings it in.
+        """
+        roots: dict[str, None] = {}
+        for from_id, to_id in remaps.items():
+            for category_id in (from_id, to_id):
+                if category_id not in tree or category_id == tree.root_id:
+                    continue
+                ancestors = tree.ancestors(category_id)
+                roots[ancestors[0].category_id if ancestors else category_id] = None
+        return list(roots)
+
+    def _save(
+        self, tree: CategoryTree, remaps: dict[str, str], state: dict[str, str | None]
+    ) -> None:
+        tree.save(self._path)
+        with sqlite3.connect(self._path) as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO expired_categories VALUES (?, ?)", remaps.items()
+            )
+            conn.executemany("INSERT OR REPLACE INTO sync_state VALUES (?, ?)", state.items())
+        conn.close()
+        self._tree = tree
+        self._remaps.update(remaps)
+        self._state.update(state)
@@ -0,0 +1,132 @@
+"""Lazy iteration over eBay's ``limit``/``offset`` list endpoints.
+
+eBay list responses share one envelope: the page's records under an
+endpoint-specific key (``orders``, ``offers``, ``itemSummaries`` ...) next to
+``total``, ``limit``, ``offset`` and a ``next`` link. The helpers here walk
+that envelope one page at a time, so only a single page is ever held in
+memory.
+
+Once the first page reports ``total``, the remaining offsets are known and
+independent; with ``prefetch=N`` up to *N* further pages are fetched
+concurrently while the caller consumes the current one, bounding memory to
+``N + 1`` pages.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any
+
+PageFetcher = Callable[..., Any]
+
+
+def paginate(
+    fetch: PageFetcher,
+    items_key: str,
+    *,
+    page_size: int,
+    offset: int = 0,
+    prefetch: int = 0,
+) -> Iterator[Any]:
+    """Yield every record from successive pages returned by *fetch*.
+
+    *fetch* is called as ``fetch(limit=..., offset=...)`` and must return a
+    parsed list response; records are read from ``page[items_key]``. With
+    *prefetch* > 0, up to that many later pages are fetched on a thread pool
+    ahead of the consumer.
+    """
+    while True:
+        page = fetch(limit=page_size, offset=offset) or {}
+        items = page.get(items_key) or []
+        yield from items
+        offset += len(items)
+        if not items or not _has_more(page, offset):
+            return
+        if prefetch > 0 and page.get("total") is not None:
+            break
+    yield from _prefetched(
+        fetch, items_key, _remaining_offsets(offset, len(items), int(page["total"])),
+        page_size, prefetch,
+    )
+
+
+def _prefetched(
+    fetch: PageFetcher,
+    items_key: str,
+    offsets: range,
+    page_size: int,
+    prefetch: int,
+) -> Iterator[Any]:
+    pending: deque[Future[Any]] = deque()
+    remaining = iter(offsets)
+    executor = ThreadPoolExecutor(max_workers=prefetch, thread_name_prefix="ebay-prefetch")
+    try:
+        for page_offset in remaining:
+            pending.append(executor.submit(fetch, limit=page_size, offset=page_offset))
+            if len(pending) >= prefetch:
+                break
+        while pending:
+            page = pending.popleft().result() or {}
+            next_offset = next(remaining, None)
+            if next_offset is not None:
+                pending.append(executor.submit(fetch, limit=page_size, offset=next_offset))
+            yield from page.get(items_key) or []
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def apaginate(
+    fetch: Callable[..., Awaitable[Any]],
+    items_key: str,
+    *,
+    page_size: int,
+    offset: int = 0,
+    prefetch: int = 0,
+) -> AsyncIterator[Any]:
+    """Async counterpart of :func:`paginate` for :class:`AsyncEbayClient`.
+
+    Prefetched pages run as tasks on the current event loop.
+    """
+    while True:
+        page = await fetch(limit=page_size, offset=offset) or {}
+        items = page.get(items_key) or []
+        for item in items:
+            yield item
+        offset += len(items)
+        if not items or not _has_more(page, offset):
+            return
+        if prefetch > 0 and page.get("total") is not None:
+            break
+    offsets = iter(_remaining_offsets(offset, len(items), int(page["total"])))
+    pending: deque[asyncio.Task[Any]] = deque()
+    try:
+        for page_offset in offsets:
+            pending.append(asyncio.ensure_future(fetch(limit=page_size, offset=page_offset)))
+            if len(pending) >= prefetch:
+                break
+        while pending:
+            page = await pending.popleft() or {}
+            next_offset = next(offsets, None)
+            if next_offset is not None:
+                pending.append(asyncio.ensure_future(fetch(limit=page_size, offset=next_offset)))
+            for item in page.get(items_key) or []:
+                yield item
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+def _remaining_offsets(offset: int, step: int, total: int) -> range:
+    # Step by what the server actually returned: it may cap ``limit`` below
+    # the requested page size.
+    return range(offset, total, step)
+
+
+def _has_more(page: dict[str, Any], offset: int) -> bool:
+    total = page.get("total")
+    if total is not None:
+        return offset < int(total)
+    return bool(page.get("next"))
@@ -0,0 +1,163 @@
+"""Client-side token-bucket rate limiting keyed by eBay API family.
+
+Each sub-API module talks to a single ``_BASE`` prefix such as
+``/buy/browse/v1`` or ``/sell/inventory/v1``, and eBay meters call quotas per
+API; the limiter uses that prefix as its bucket key.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """A sustained call rate plus the burst allowed on top of it.
+
+    Parameters
+    ----------
+    rate:
+        Calls replenished per second.
+    burst:
+        Bucket capacity — calls that may be made back to back.
+    """
+
+    rate: float
+    burst: float = 1.0
+
+    def __post_init__(self) -> None:
+        if self.rate <= 0:
+            raise ValueError(f"rate must be positive, got {self.rate}")
+        if self.burst < 1:
+            raise ValueError(f"burst must be at least 1, got {self.burst}")
+
+    @classmethod
+    def per_day(cls, calls: int, *, burst: float = 10.0) -> RateLimit:
+        """Spread a daily quota evenly over 24 hours."""
+        return cls(rate=calls / 86400.0, burst=burst)
+
+
+def api_family(path: str) -> str:
+    """Return the ``/<group>/<api>/<version>`` prefix of a request path."""
+    parts = path.split("?", 1)[0].strip("/").split("/")
+    return "/" + "/".join(parts[:3])
+
+
+class RateLimiter:
+    """In-process token buckets shared by every thread using the client.
+
+    Buckets are reservation based: :meth:`reserve` always takes a token and
+    returns how long the caller must wait before using it, so callers queue
+    up fairly rather than polling, and the same limiter serves both the
+    sync and async clients.
+
+    Parameters
+    ----------
+    limits:
+        Mapping of API family prefix (e.g. ``"/sell/inventory/v1"``) to its
+        :class:`RateLimit`.
+    default:
+        Limit applied to families not listed in *limits*; *None* leaves
+        them unthrottled.
+    """
+
+    def __init__(
+        self,
+        limits: dict[str, RateLimit],
+        *,
+        default: RateLimit | None = None,
+    ) -> None:
+        self._limits = {api_family(k): v for k, v in limits.items()}
+        self._default = default
+        self._lock = threading.Lock()
+        # family -> (tokens, monotonic timestamp of last update)
+        self._state: dict[str, tuple[float, float]] = {}
+
+    def limit_for(self, path: str) -> tuple[str, RateLimit | None]:
+        family = api_family(path)
+        return family, self._limits.get(family, self._default)
+
+    def reserve(self, path: str) -> float:
+        """Take one token for *path*'s API family; return seconds to wait."""
+        family, limit = self.limit_for(path)
+        if limit is None:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            tokens, updated = self._state.get(family, (limit.burst, now))
+            tokens, wait = _take(tokens, now - updated, limit)
+            self._state[family] = (tokens, now)
+        return wait
+
+
+class SqliteRateLimiter(RateLimiter):
+    """Token buckets persisted in SQLite so several processes share quotas.
+
+    Each reservation runs in an ``IMMEDIATE`` transaction, which serialises
+    all processes pointing at the same database file.
+
+    Parameters
+    ----------
+    path:
+        Database file; created on first use.
+    limits, default:
+        As for :class:`RateLimiter`.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        limits: dict[str, RateLimit],
+        *,
+        default: RateLimit | None = None,
+    ) -> None:
+        super().__init__(limits, default=default)
+        self._path = str(path)
+        self._local = threading.local()
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS buckets ("
+                "family TEXT PRIMARY KEY, tokens REAL NOT NULL, updated REAL NOT NULL)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self._path, timeout=30.0, isolation_level=None)
+            self._local.conn = conn
+        return conn
+
+    def reserve(self, path: str) -> float:
+        family, limit = self.limit_for(path)
+        if limit is None:
+            return 0.0
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            # Wall-clock time: monotonic clocks are not comparable across processes.
+            now = time.time()
+            row = conn.execute(
+                "SELECT tokens, updated FROM buckets WHERE family = ?", (family,)
+            ).fetchone()
+            tokens, updated = row if row else (limit.burst, now)
+            tokens, wait = _take(tokens, max(0.0, now - updated), limit)
+            conn.execute(
+                "INSERT OR REPLACE INTO buckets (family, tokens, updated) VALUES (?, ?, ?)",
+                (family, tokens, now),
+            )
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+        return wait
+
+
+def _take(tokens: float, elapsed: float, limit: RateLimit) -> tuple[float, float]:
+    """Refill for *elapsed* seconds, take one token, return (tokens, wait)."""
+    tokens = min(limit.burst, tokens + elapsed * limit.rate) - 1.0
+    wait = -tokens / limit.rate if tokens < 0 else 0.0
+    return tokens, wait
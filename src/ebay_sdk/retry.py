@@ -0,0 +1,90 @@
+"""Retry policy for transient eBay API failures."""
+
+from __future__ import annotations
+
+import random
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+
+import httpx
+
+# Failures where the request provably never reached eBay, so resending it
+# cannot duplicate a side effect whatever the HTTP method.
+_UNSENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Exponential backoff with full jitter, honouring ``Retry-After``.
+
+    Retries are idempotency-aware: a POST such as ``publish_offer`` is only
+    resent when eBay rejected it outright (HTTP 429) or the connection was
+    never established. Any other retryable status or transport error is
+    retried only for methods in ``idempotent_methods``.
+
+    Parameters
+    ----------
+    max_attempts:
+        Total tries per request, including the first (``1`` disables retries).
+    backoff_factor:
+        Base delay in seconds; attempt *n* waits up to
+        ``backoff_factor * 2 ** (n - 1)``.
+    max_backoff:
+        Cap on the computed backoff delay.
+    jitter:
+        Draw each delay uniformly from ``[0, backoff]`` to spread out
+        clients that failed together.
+    retry_statuses:
+        HTTP statuses considered transient.
+    idempotent_methods:
+        Methods that are safe to resend after an ambiguous failure.
+    max_retry_after:
+        Upper bound on a server-supplied ``Retry-After`` delay.
+    """
+
+    max_attempts: int = 4
+    backoff_factor: float = 0.5
+    max_backoff: float = 30.0
+    jitter: bool = True
+    retry_statuses: frozenset[int] = frozenset({429, 500, 502, 503, 504})
+    idempotent_methods: frozenset[str] = frozenset(
+        {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+    )
+    max_retry_after: float = 120.0
+
+    def should_retry_status(self, method: str, status_code: int, attempt: int) -> bool:
+        """Whether a response with *status_code* on try *attempt* is retried."""
+        if attempt >= self.max_attempts or status_code not in self.retry_statuses:
+            return False
+        return status_code == 429 or method.upper() in self.idempotent_methods
+
+    def should_retry_error(self, method: str, exc: Exception, attempt: int) -> bool:
+        """Whether a transport error on try *attempt* is retried."""
+        if attempt >= self.max_attempts or not isinstance(exc, httpx.TransportError):
+            return False
+        return isinstance(exc, _UNSENT_ERRORS) or method.upper() in self.idempotent_methods
+
+    def delay(self, attempt: int, response: httpx.Response | None = None) -> float:
+        """Seconds to wait before the try following *attempt*."""
+        if response is not None:
+            retry_after = _parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                return min(retry_after, self.max_retry_after)
+        backoff = min(self.backoff_factor * 2 ** (attempt - 1), self.max_backoff)
+        if self.jitter:
+            return random.uniform(0, backoff)
+        return backoff
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
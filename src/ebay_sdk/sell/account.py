@@ -9,13 +9,13 @@ from __future__ import annotations
 from typing import Any, TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from ebay_sdk.client import EbayClient
+    from ebay_sdk.client import AsyncEbayClient, EbayClient
 
 _BASE = "/sell/account/v1"
 
 
 class SellAccountApi:
-    def __init__(self, client: EbayClient) -> None:
+    def __init__(self, client: EbayClient | AsyncEbayClient) -> None:
         self._c = client
 
     # -- Custom Policy ---------------------------------------------------------
@@ -0,0 +1,250 @@
+"""A refreshable inbox of payment disputes.
+
+Listing disputes is cheap; the detail and activity behind each one are
+two more calls per dispute. :class:`DisputeInbox` pages through the
+summaries on every :meth:`~DisputeInbox.refresh`, compares each summary's
+status and dates with the previous refresh, and fetches detail and
+activity concurrently only for disputes that are new or have changed.
+Everything else is served from the previous snapshot::
+
+    inbox = DisputeInbox(ebay.sell_fulfillment)
+    snapshot = inbox.refresh()
+    for entry in snapshot.entries:
+        print(entry.dispute_id, entry.status, entry.respond_by, entry.last_activity)
+
+:func:`download_evidence` streams every evidence file of many disputes to
+disk concurrently.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from ebay_sdk.batch import run_concurrently
+from ebay_sdk.sell.fulfillment import SellFulfillmentApi
+from ebay_sdk.streaming import DownloadResult
+
+# Summary fields that move when a dispute does.
+_FINGERPRINT_FIELDS = ("paymentDisputeStatus", "respondByDate", "closedDate", "reason")
+
+
+class DisputeEntry(NamedTuple):
+    """The dashboard view of one dispute."""
+
+    dispute_id: str
+    order_id: str | None
+    status: str | None
+    reason: str | None
+    amount: dict[str, Any] | None
+    open_date: str | None
+    respond_by: str | None
+    closed_date: str | None
+    revision: int | None
+    evidence_count: int
+    last_activity: dict[str, Any] | None
+    fingerprint: tuple[Any, ...]
+
+
+@dataclass
+class DisputeSnapshot:
+    """Result of a :meth:`DisputeInbox.refresh`.
+
+    *refreshed* lists the disputes whose detail and activity were fetched
+    this time; *errors* holds the ones whose hydration failed, which are
+    listed from their summary alone and retried on the next refresh.
+    """
+
+    entries: list[DisputeEntry]
+    refreshed: list[str] = field(default_factory=list)
+    errors: dict[str, Exception] = field(default_factory=dict)
+    elapsed: float = 0.0
+
+
+class EvidenceDownload(NamedTuple):
+    """One evidence file fetched (or not) by :func:`download_evidence`.
+
+    *evidence_id* and *file_id* are *None* when the dispute itself could
+    not be read.
+    """
+
+    dispute_id: str
+    evidence_id: str | None
+    file_id: str | None
+    path: Path | None
+    result: DownloadResult | None
+    error: Exception | None = None
+
+
+class DisputeInbox:
+    """Incrementally hydrated payment dispute list.
+
+    Parameters
+    ----------
+    fulfillment:
+        ``ebay.sell_fulfillment`` of a synchronous :class:`EbayClient`.
+    max_workers:
+        Detail and activity calls in flight at once.
+    page_size:
+        ``limit`` per ``get_payment_disputes`` page.
+    """
+
+    def __init__(
+        self,
+        fulfillment: SellFulfillmentApi,
+        *,
+        max_workers: int = 8,
+        page_size: int = 200,
+    ) -> None:
+        self._fulfillment = fulfillment
+        self._max_workers = max_workers
+        self._page_size = page_size
+        self._entries: dict[str, DisputeEntry] = {}
+
+    def refresh(self, **filters: Any) -> DisputeSnapshot:
+        """List disputes and hydrate the new or changed ones.
+
+        *filters* are passed to ``iter_payment_disputes`` (e.g.
+        ``payment_dispute_status="OPEN"``). Disputes no longer listed drop
+        out of the snapshot.
+        """
+        started = time.monotonic()
+        summaries = list(
+            self._fulfillment.iter_payment_disputes(page_size=self._page_size, **filters)
+        )
+        stale = [
+            summary for summary in summaries
+            if (entry := self._entries.get(summary["paymentDisputeId"])) is None
+            or entry.fingerprint != _fingerprint(summary)
+        ]
+        snapshot = DisputeSnapshot(entries=[])
+        hydrated = self._hydrate(stale, snapshot)
+        entries = {}
+        for summary in summaries:
+            dispute_id = summary["paymentDisputeId"]
+            if dispute_id in hydrated:
+                entries[dispute_id] = hydrated[dispute_id]
+            elif dispute_id in snapshot.errors:
+                # No fingerprint, so it is hydrated again next time.
+                entries[dispute_id] = _entry(summary, {}, None)._replace(fingerprint=())
+            else:
+                entries[dispute_id] = self._entries[dispute_id]
+        self._entries = entries
+        snapshot.entries = list(entries.values())
+        snapshot.elapsed = time.monotonic() - started
+        return snapshot
+
+    # -- internals -------------------------------------------------------------
+
+    def _hydrate(
+        self, summaries: Iterable[dict[str, Any]], snapshot: DisputeSnapshot
+    ) -> dict[str, DisputeEntry]:
+        summaries = {summary["paymentDisputeId"]: summary for summary in summaries}
+        calls = [
+            (dispute_id, call)
+            for dispute_id in summaries
+            for call in (
+                self._fulfillment.get_payment_dispute,
+                self._fulfillment.get_payment_dispute_activity,
+            )
+        ]
+        responses: dict[str, list[Any]] = {dispute_id: [] for dispute_id in summaries}
+        for outcome in run_concurrently(
+            lambda item: item[1](item[0]), calls, max_workers=self._max_workers
+        ):
+            dispute_id = outcome.item[0]
+            if outcome.error is not None:
+                snapshot.errors.setdefault(dispute_id, outcome.error)
+            else:
+                responses[dispute_id].append(outcome.value or {})
+        hydrated = {}
+        for dispute_id, summary in summaries.items():
+            if dispute_id in snapshot.errors:
+                continue
+            detail, activity = responses[dispute_id]
+            hydrated[dispute_id] = _entry(summary, detail, _last_activity(activity))
+            snapshot.refreshed.append(dispute_id)
+        return hydrated
+
+
+def download_evidence(
+    fulfillment: SellFulfillmentApi,
+    dispute_ids: Iterable[str],
+    download_dir: str | os.PathLike[str],
+    *,
+    max_workers: int = 8,
+) -> list[EvidenceDownload]:
+    """Stream every evidence file of *dispute_ids* into *download_dir*.
+
+    Disputes are read concurrently to find their files, then the files are
+    downloaded concurrently, each written in chunks to
+    ``<dispute_id>/<evidence_id>-<file_id><suffix>`` (the suffix taken from
+    the file's name). Failures are reported per file, or per dispute when
+    the dispute itself could not be read.
+    """
+    download_dir = Path(download_dir)
+    downloads: list[EvidenceDownload] = []
+    files: list[tuple[str, str, str, Path]] = []
+    for outcome in run_concurrently(
+        fulfillment.get_payment_dispute, dispute_ids, max_workers=max_workers
+    ):
+        if outcome.error is not None:
+            downloads.append(
+                EvidenceDownload(outcome.item, None, None, None, None, outcome.error)
+            )
+            continue
+        for evidence in (outcome.value or {}).get("evidence", []):
+            for info in evidence.get("files", []):
+                name = f"{evidence['evidenceId']}-{info['fileId']}"
+                name += Path(info.get("name") or "").suffix
+                files.append((
+                    outcome.item,
+                    evidence["evidenceId"],
+                    info["fileId"],
+                    download_dir / outcome.item / name,
+                ))
+
+    def fetch(item: tuple[str, str, str, Path]) -> DownloadResult:
+        dispute_id, evidence_id, file_id, path = item
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return fulfillment.download_evidence_content_to(dispute_id, evidence_id, file_id, path)
+
+    for outcome in run_concurrently(fetch, files, max_workers=max_workers):
+        downloads.append(EvidenceDownload(*outcome.item, outcome.value, outcome.error))
+    return downloads
+
+
+def _fingerprint(summary: dict[str, Any]) -> tuple[Any, ...]:
+    return tuple(summary.get(name) for name in _FINGERPRINT_FIELDS)
+
+
+def _last_activity(activity: dict[str, Any]) -> dict[str, Any] | None:
+    # ISO-8601 timestamps sort chronologically as strings.
+    return max(
+        activity.get("activity", []),
+        key=lambda event: event.get("activityDate", ""),
+        default=None,
+    )
+
+
+def _entry(
+    summary: dict[str, Any], detail: dict[str, Any], last_activity: dict[str, Any] | None
+) -> DisputeEntry:
+    return DisputeEntry(
+        dispute_id=summary["paymentDisputeId"],
+        order_id=summary.get("orderId"),
+        status=summary.get("paymentDisputeStatus"),
+        reason=summary.get("reason"),
+        amount=summary.get("amount"),
+        open_date=summary.get("openDate"),
+        respond_by=summary.get("respondByDate"),
+        closed_date=summary.get("closedDate"),
+        revision=detail.get("revision"),
+        evidence_count=len(detail.get("evidence", [])),
+        last_activity=last_activity,
+        fingerprint=_fingerprint(summary),
+    )
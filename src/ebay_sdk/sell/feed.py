@@ -6,16 +6,34 @@ Version: v1.3.1
 
 from __future__ import annotations
 
-from typing import Any, TYPE_CHECKING
+import csv
+import gzip
+import inspect
+import io
+import os
+import shutil
+import tempfile
+import zipfile
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import ExitStack
+from functools import partial
+from pathlib import Path
+from typing import IO, Any, TYPE_CHECKING
+from xml.etree import ElementTree
+
+from ebay_sdk.streaming import IterableReader, UploadReader, iter_json_array
 
 if TYPE_CHECKING:
-    from ebay_sdk.client import EbayClient
+    from ebay_sdk.client import AsyncEbayClient, EbayClient
+    from ebay_sdk.streaming import DownloadResult
 
 _BASE = "/sell/feed/v1"
+# Result files are zip/gzip archives, not JSON.
+_DOWNLOAD_HEADERS = {"Accept": "application/octet-stream"}
 
 
 class SellFeedApi:
-    def __init__(self, client: EbayClient) -> None:
+    def __init__(self, client: EbayClient | AsyncEbayClient) -> None:
         self._c = client
 
     # -- Task ------------------------------------------------------------------
@@ -46,10 +64,46 @@ class SellFeedApi:
             params["offset"] = offset
         return self._c.get(f"{_BASE}/task", params=params)
 
+    def iter_tasks(
+        self,
+        *,
+        feed_type: str | None = None,
+        schedule_id: str | None = None,
+        look_back_days: int | None = None,
+        date_range: str | None = None,
+        page_size: int = 100,
+        prefetch: int = 0,
+    ) -> Any:
+        """Iterate over all matching feed tasks, fetching pages lazily."""
+        fetch = partial(
+            self.get_tasks,
+            feed_type=feed_type,
+            schedule_id=schedule_id,
+            look_back_days=look_back_days,
+            date_range=date_range,
+        )
+        return self._c.paginate(fetch, "tasks", page_size=page_size, prefetch=prefetch)
+
     def create_task(self, body: dict[str, Any]) -> Any:
         """Create a feed task."""
         return self._c.post(f"{_BASE}/task", json=body)
 
+    def submit_task(
+        self,
+        body: dict[str, Any],
+        *,
+        kind: str = "task",
+        marketplace_id: str | None = None,
+    ) -> str:
+        """Create a task and return its id, read from the ``Location`` header.
+
+        *kind* selects the endpoint: ``"task"``, ``"inventory_task"`` or
+        ``"order_task"``. Requires :class:`EbayClient`.
+        """
+        headers = {"X-EBAY-C-MARKETPLACE-ID": marketplace_id} if marketplace_id else None
+        resp = self._c.request("POST", f"{_BASE}/{kind}", json=body, headers=headers)
+        return resp.headers["Location"].rstrip("/").rsplit("/", 1)[-1]
+
     def get_task(self, task_id: str) -> Any:
         """Get a specific task."""
         return self._c.get(f"{_BASE}/task/{task_id}")
@@ -58,9 +112,96 @@ class SellFeedApi:
         """Upload a file for a task."""
         return self._c.post(f"{_BASE}/task/{task_id}/upload_file", json=body)
 
+    def upload_file_from(
+        self,
+        task_id: str,
+        source: str | os.PathLike[str] | IO[bytes] | Iterable[bytes],
+        *,
+        file_name: str | None = None,
+        content_type: str | None = None,
+        on_progress: Callable[[int, int | None], None] | None = None,
+        total: int | None = None,
+    ) -> Any:
+        """Upload a feed file as streamed multipart/form-data.
+
+        *source* is a path, binary file object or iterable of ``bytes``;
+        it is read in chunks as the request is sent, never all at once.
+        *on_progress* receives ``(bytes_sent, total)``. Path and seekable
+        sources are retried like any request; an iterable is sent once.
+        On :class:`AsyncEbayClient` the source is opened when the returned
+        coroutine is awaited and closed once the upload finishes.
+        """
+        if file_name is None:
+            file_name = (
+                Path(source).name
+                if isinstance(source, (str, os.PathLike))
+                else Path(str(getattr(source, "name", "upload"))).name
+            )
+        path = f"{_BASE}/task/{task_id}/upload_file"
+        data = {"fileName": file_name, "name": "file", "type": "form-data"}
+        if inspect.iscoroutinefunction(self._c.post):
+            return self._upload_file_async(
+                path, source, file_name, content_type, data, on_progress, total
+            )
+        with UploadReader(source, on_progress=on_progress, total=total) as reader:
+            return self._c.post(
+                path, files={"file": (file_name, reader, content_type)}, data=data
+            )
+
+    async def _upload_file_async(
+        self,
+        path: str,
+        source: str | os.PathLike[str] | IO[bytes] | Iterable[bytes],
+        file_name: str,
+        content_type: str | None,
+        data: dict[str, str],
+        on_progress: Callable[[int, int | None], None] | None,
+        total: int | None,
+    ) -> Any:
+        # The reader must stay open until the request has been sent.
+        with UploadReader(source, on_progress=on_progress, total=total) as reader:
+            return await self._c.post(
+                path, files={"file": (file_name, reader, content_type)}, data=data
+            )
+
     def download_result_file(self, task_id: str) -> Any:
-        """Download the result file for a completed task."""
-        return self._c.get(f"{_BASE}/task/{task_id}/download_result_file")
+        """Download the result file (a zip or gzip archive) for a completed task.
+
+        Returns the raw bytes, held in memory; prefer
+        :meth:`download_result_file_to` or :meth:`iter_result_file` for
+        large files.
+        """
+        return self._c.get_bytes(
+            f"{_BASE}/task/{task_id}/download_result_file", headers=_DOWNLOAD_HEADERS
+        )
+
+    def iter_result_file(self, task_id: str) -> Iterator[bytes]:
+        """Yield a task's result file as raw chunks. Requires :class:`EbayClient`."""
+        yield from self._iter_file(f"{_BASE}/task/{task_id}/download_result_file")
+
+    def download_result_file_to(
+        self,
+        task_id: str,
+        dest: str | os.PathLike[str] | IO[bytes],
+        *,
+        resume: bool = True,
+        sha256: str | None = None,
+    ) -> DownloadResult:
+        """Stream a task's result file to a path or binary file object.
+
+        See :meth:`EbayClient.download` for resume and checksum behaviour.
+        """
+        return self._c.download(
+            f"{_BASE}/task/{task_id}/download_result_file",
+            dest,
+            headers=_DOWNLOAD_HEADERS,
+            resume=resume,
+            sha256=sha256,
+        )
+
+    def _iter_file(self, path: str) -> Iterator[bytes]:
+        with self._c.stream("GET", path, headers=_DOWNLOAD_HEADERS) as resp:
+            yield from resp.iter_bytes()
 
     # -- Order Task ------------------------------------------------------------
 
@@ -198,9 +339,35 @@ class SellFeedApi:
         return self._c.delete(f"{_BASE}/schedule/{schedule_id}")
 
     def get_latest_result_file(self, schedule_id: str) -> Any:
-        """Download the latest result file for a schedule."""
-        return self._c.get(
-            f"{_BASE}/schedule/{schedule_id}/download_result_file"
+        """Download the latest result file for a schedule as raw bytes.
+
+        The file is held in memory; prefer :meth:`download_latest_result_file_to`
+        or :meth:`iter_latest_result_file` for large files.
+        """
+        return self._c.get_bytes(
+            f"{_BASE}/schedule/{schedule_id}/download_result_file",
+            headers=_DOWNLOAD_HEADERS,
+        )
+
+    def iter_latest_result_file(self, schedule_id: str) -> Iterator[bytes]:
+        """Yield a schedule's latest result file as raw chunks. Requires :class:`EbayClient`."""
+        yield from self._iter_file(f"{_BASE}/schedule/{schedule_id}/download_result_file")
+
+    def download_latest_result_file_to(
+        self,
+        schedule_id: str,
+        dest: str | os.PathLike[str] | IO[bytes],
+        *,
+        resume: bool = True,
+        sha256: str | None = None,
+    ) -> DownloadResult:
+        """Stream a schedule's latest result file to a path or binary file object."""
+        return self._c.download(
+            f"{_BASE}/schedule/{schedule_id}/download_result_file",
+            dest,
+            headers=_DOWNLOAD_HEADERS,
+            resume=resume,
+            sha256=sha256,
         )
 
     # -- Schedule Template -----------------------------------------------------
@@ -223,3 +390,182 @@ class SellFeedApi:
     def get_schedule_template(self, schedule_template_id: str) -> Any:
         """Get a specific schedule template."""
         return self._c.get(f"{_BASE}/schedule_template/{schedule_template_id}")
+
+
+# -- Result file parsing -------------------------------------------------------
+
+_READ_SIZE = 1 << 16
+# Non-seekable zip input is spooled to disk beyond this size.
+_SPOOL_IN_MEMORY = 8 << 20
+
+
+def iter_feed_records(
+    source: str | os.PathLike[str] | IO[bytes] | Iterable[bytes],
+    *,
+    fmt: str | None = None,
+    record_tag: str | None = None,
+    json_key: str | None = None,
+    tuples: bool = False,
+) -> Iterator[Any]:
+    """Yield the records of a feed result file without loading it.
+
+    *source* is a path, binary file object or iterable of ``bytes`` such as
+    :meth:`SellFeedApi.iter_result_file`. Zip archives (every member, in
+    order) and gzip files are decompressed on the fly; the payload is then
+    parsed incrementally as CSV, XML or JSON according to *fmt*, the member
+    name, or its first byte.
+
+    - CSV (comma or tab separated): one dict per row keyed by the header,
+      or with *tuples* a tuple of values per row (header skipped).
+    - XML: one dict per element named *record_tag* (default: each child of
+      the document root). Namespaces are dropped, attributes become
+      ``"@name"`` keys and repeated children become lists; every finished
+      element is cleared, so memory stays flat.
+    - JSON: each element of the array under *json_key*, or of the document
+      if it is a top-level array.
+
+    Zip needs random access: a non-seekable source is first spooled to a
+    temporary file.
+    """
+    with ExitStack() as stack:
+        stream = _open_binary(source, stack)
+        head = stream.peek(4)[:4]
+        if head.startswith(b"PK\x03\x04"):
+            if not stream.seekable():
+                spool = stack.enter_context(
+                    tempfile.SpooledTemporaryFile(max_size=_SPOOL_IN_MEMORY)
+                )
+                shutil.copyfileobj(stream, spool, _READ_SIZE)
+                spool.seek(0)
+                stream = spool
+            archive = stack.enter_context(zipfile.ZipFile(stream))
+            for info in archive.infolist():
+                if info.is_dir():
+                    continue
+                with archive.open(info) as member:
+                    yield from _iter_member(
+                        io.BufferedReader(member), info.filename,
+                        fmt, record_tag, json_key, tuples,
+                    )
+        elif head.startswith(b"\x1f\x8b"):
+            member = stack.enter_context(gzip.GzipFile(fileobj=stream))
+            name = _source_name(source)
+            if name is not None and name.endswith(".gz"):
+                name = name[:-3]
+            yield from _iter_member(
+                io.BufferedReader(member), name,
+                fmt, record_tag, json_key, tuples,
+            )
+        else:
+            yield from _iter_member(
+                stream, _source_name(source), fmt, record_tag, json_key, tuples
+            )
+
+
+def _open_binary(source: Any, stack: ExitStack) -> io.BufferedIOBase:
+    if isinstance(source, (str, os.PathLike)):
+        return stack.enter_context(open(source, "rb"))
+    if hasattr(source, "read"):
+        if hasattr(source, "peek"):
+            return source
+        return io.BufferedReader(IterableReader(iter(lambda: source.read(_READ_SIZE), b"")))
+    return io.BufferedReader(IterableReader(source))
+
+
+def _source_name(source: Any) -> str | None:
+    name = source if isinstance(source, (str, os.PathLike)) else getattr(source, "name", None)
+    return os.fspath(name) if isinstance(name, (str, os.PathLike)) else None
+
+
+def _iter_member(
+    stream: io.BufferedReader,
+    name: str | None,
+    fmt: str | None,
+    record_tag: str | None,
+    json_key: str | None,
+    tuples: bool,
+) -> Iterator[Any]:
+    fmt = fmt or _sniff_format(stream, name)
+    if fmt == "xml":
+        yield from _iter_xml(stream, record_tag)
+    elif fmt == "json":
+        yield from iter_json_array(iter(lambda: stream.read(_READ_SIZE), b""), json_key)
+    elif fmt == "csv":
+        yield from _iter_csv(stream, tuples)
+    else:
+        raise ValueError(f"unsupported feed format {fmt!r}")
+
+
+def _sniff_format(stream: io.BufferedReader, name: str | None) -> str:
+    suffix = Path(name).suffix.lower() if name else ""
+    if suffix in (".csv", ".tsv", ".txt"):
+        return "csv"
+    if suffix in (".xml", ".json"):
+        return suffix[1:]
+    head = stream.peek(256).lstrip(b"\xef\xbb\xbf \t\r\n")[:1]
+    if head == b"<":
+        return "xml"
+    if head in (b"{", b"["):
+        return "json"
+    return "csv"
+
+
+def _iter_csv(stream: io.BufferedReader, tuples: bool) -> Iterator[Any]:
+    text = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+    first = text.readline()
+    delimiter = "\t" if first.count("\t") > first.count(",") else ","
+    header = next(csv.reader([first], delimiter=delimiter), [])
+    rows = csv.reader(text, delimiter=delimiter)
+    if tuples:
+        for row in rows:
+            yield tuple(row)
+    else:
+        for row in rows:
+            yield dict(zip(header, row))
+
+
+def _iter_xml(stream: io.BufferedReader, record_tag: str | None) -> Iterator[dict[str, Any]]:
+    open_elements: list[ElementTree.Element] = []
+    open_records = 0
+    for event, element in ElementTree.iterparse(stream, events=("start", "end")):
+        if record_tag is None:
+            is_record = len(open_elements) == (1 if event == "start" else 2)
+        else:
+            is_record = _local_name(element.tag) == record_tag
+        if event == "start":
+            open_elements.append(element)
+            open_records += is_record
+            continue
+        open_elements.pop()
+        open_records -= is_record
+        if is_record:
+            yield _element_to_dict(element)
+        if (is_record or not open_records) and open_elements:
+            # Finished records, and anything outside one, are no longer
+            # needed; detach them so the tree never grows.
+            open_elements[-1].remove(element)
+
+
+def _local_name(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
+
+
+def _element_to_dict(element: ElementTree.Element) -> dict[str, Any]:
+    record: dict[str, Any] = {f"@{_local_name(k)}": v for k, v in element.attrib.items()}
+    for child in element:
+        key = _local_name(child.tag)
+        value: Any = (
+            _element_to_dict(child)
+            if len(child) or child.attrib
+            else (child.text or "").strip()
+        )
+        if key in record:
+            if not isinstance(record[key], list):
+                record[key] = [record[key]]
+            record[key].append(value)
+        else:
+            record[key] = value
+    text = (element.text or "").strip()
+    if text:
+        record["#text"] = text
+    return record
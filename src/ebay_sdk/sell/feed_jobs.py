@@ -0,0 +1,197 @@
+"""Run Feed API jobs end to end: create, upload, poll, fetch the result.
+
+Each :class:`FeedJob` describes one task. :class:`FeedOrchestrator` runs many
+of them on a thread pool; each job is created (the task id is read from the
+``Location`` header), given its upload if it has one, and polled with a
+backoff that starts short, stretches while the status stays the same and
+snaps back when it changes. As soon as a job finishes its result file is
+streamed into the caller's callback, so results are handled in the order
+eBay completes them::
+
+    def store(result, chunks):
+        with open(f"{result.task_id}.zip", "wb") as out:
+            for chunk in chunks:
+                out.write(chunk)
+
+    orchestrator = FeedOrchestrator(ebay.sell_feed)
+    jobs = [
+        FeedJob("LMS_ADD_FIXED_PRICE_ITEM", upload="items.xml", marketplace_id="EBAY_US"),
+        FeedJob("LMS_ORDER_REPORT", kind="order_task", extra={"filterCriteria": criteria}),
+    ]
+    results = orchestrator.run(jobs, on_result=store)
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field
+from typing import IO, Any
+
+from ebay_sdk.batch import run_concurrently
+from ebay_sdk.sell.feed import SellFeedApi
+
+TERMINAL_STATUSES = frozenset({
+    "COMPLETED", "COMPLETED_WITH_ERROR", "PARTIALLY_PROCESSED", "FAILED",
+})
+# Statuses for which eBay provides a result file.
+RESULT_STATUSES = frozenset({"COMPLETED", "COMPLETED_WITH_ERROR", "PARTIALLY_PROCESSED"})
+
+
+@dataclass
+class FeedJob:
+    """One Feed API task to run.
+
+    Parameters
+    ----------
+    feed_type:
+        The ``feedType``, e.g. ``LMS_ADD_FIXED_PRICE_ITEM``.
+    kind:
+        Which create endpoint to use: ``"task"``, ``"inventory_task"`` or
+        ``"order_task"``; polling uses the matching ``get_*`` call.
+    upload:
+        File to upload after creating the task (path, binary file or
+        iterable of ``bytes``); only upload feed types take one.
+    schema_version:
+        The ``schemaVersion`` of the feed.
+    marketplace_id:
+        Sent as ``X-EBAY-C-MARKETPLACE-ID``, which most LMS feeds require.
+    extra:
+        Additional request-body fields such as ``filterCriteria``.
+    """
+
+    feed_type: str
+    kind: str = "task"
+    upload: str | os.PathLike[str] | IO[bytes] | Iterable[bytes] | None = None
+    schema_version: str = "1.0"
+    marketplace_id: str | None = None
+    extra: dict[str, Any] = field(default_factory=dict)
+
+    def body(self) -> dict[str, Any]:
+        return {"feedType": self.feed_type, "schemaVersion": self.schema_version, **self.extra}
+
+
+@dataclass
+class FeedJobResult:
+    """Where a :class:`FeedJob` ended up."""
+
+    job: FeedJob
+    task_id: str | None = None
+    status: str | None = None
+    task: dict[str, Any] | None = None
+    error: Exception | None = None
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and self.status == "COMPLETED"
+
+
+class FeedOrchestrator:
+    """Runs :class:`FeedJob` instances concurrently to completion.
+
+    Parameters
+    ----------
+    feed:
+        ``ebay.sell_feed`` of a synchronous :class:`EbayClient`.
+    max_workers:
+        Jobs in flight at once.
+    poll_initial, poll_max, poll_factor:
+        Polling starts every *poll_initial* seconds, grows by *poll_factor*
+        each time the status is unchanged, up to *poll_max*, and resets when
+        the status moves.
+    timeout:
+        Seconds after which a job still not finished is abandoned with a
+        :class:`TimeoutError`.
+    """
+
+    def __init__(
+        self,
+        feed: SellFeedApi,
+        *,
+        max_workers: int = 8,
+        poll_initial: float = 2.0,
+        poll_max: float = 60.0,
+        poll_factor: float = 1.5,
+        timeout: float = 4 * 3600.0,
+    ) -> None:
+        self._feed = feed
+        self._max_workers = max_workers
+        self._poll_initial = poll_initial
+        self._poll_max = poll_max
+        self._poll_factor = poll_factor
+        self._timeout = timeout
+
+    def run(
+        self,
+        jobs: Iterable[FeedJob],
+        *,
+        on_result: Callable[[FeedJobResult, Iterator[bytes]], None] | None = None,
+    ) -> list[FeedJobResult]:
+        """Run *jobs* and return their results in input order.
+
+        *on_result* is called from the worker thread as each job with a
+        result file finishes, with the result and an iterator over the
+        file's raw bytes; the file is streamed while it is consumed. An
+        exception raised by a job or its callback is recorded on that
+        job's :class:`FeedJobResult` rather than stopping the others.
+        """
+        results = []
+        for outcome in run_concurrently(
+            lambda job: self._run_job(job, on_result), jobs, max_workers=self._max_workers
+        ):
+            if outcome.error is not None:
+                results.append(FeedJobResult(outcome.item, error=outcome.error))
+            else:
+                results.append(outcome.value)
+        return results
+
+    # -- internals -------------------------------------------------------------
+
+    def _run_job(
+        self,
+        job: FeedJob,
+        on_result: Callable[[FeedJobResult, Iterator[bytes]], None] | None,
+    ) -> FeedJobResult:
+        started = time.monotonic()
+        result = FeedJobResult(job)
+        try:
+            result.task_id = self._feed.submit_task(
+                job.body(), kind=job.kind, marketplace_id=job.marketplace_id
+            )
+            if job.upload is not None:
+                self._feed.upload_file_from(result.task_id, job.upload)
+            result.task = self._poll(job.kind, result.task_id, started)
+            result.status = result.task.get("status")
+            if on_result is not None and result.status in RESULT_STATUSES:
+                on_result(result, self._feed.iter_result_file(result.task_id))
+        except Exception as exc:
+            result.error = exc
+        result.elapsed = time.monotonic() - started
+        return result
+
+    def _poll(self, kind: str, task_id: str, started: float) -> dict[str, Any]:
+        get = {
+            "task": self._feed.get_task,
+            "inventory_task": self._feed.get_inventory_task,
+            "order_task": self._feed.get_order_task,
+        }[kind]
+        interval = self._poll_initial
+        last_status = None
+        while True:
+            task = get(task_id)
+            status = task.get("status")
+            if status in TERMINAL_STATUSES:
+                return task
+            if status != last_status:
+                interval = self._poll_initial
+                last_status = status
+            else:
+                interval = min(interval * self._poll_factor, self._poll_max)
+            remaining = self._timeout - (time.monotonic() - started)
+            if remaining <= 0:
+                raise TimeoutError(
+                    f"feed task {task_id} still {status} after {self._timeout:.0f}s"
+                )
+            time.sleep(min(interval, remaining))
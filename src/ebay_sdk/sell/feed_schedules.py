@@ -0,0 +1,158 @@
+"""Fetch each new result of recurring Feed schedules exactly once.
+
+:class:`ScheduleResultFetcher` remembers, per ``schedule_id``, the task id
+and SHA-256 of the last result file it delivered. A poll pages through
+each schedule's tasks from the last *look_back_days* (usually one
+``get_tasks`` call); a file is downloaded only when a completed task
+created after the last delivered one appears, and a file whose content
+matches the previous one is dropped rather than delivered again. Many
+schedules share one polling loop::
+
+    fetcher = ScheduleResultFetcher(ebay.sell_feed, "schedules.json", "downloads/")
+    fetcher.watch(["sched-1", "sched-2"], on_result=ingest, interval=900)
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from ebay_sdk.batch import run_concurrently
+from ebay_sdk.sell.feed import SellFeedApi
+
+_RESULT_STATUSES = ("COMPLETED", "COMPLETED_WITH_ERROR", "PARTIALLY_PROCESSED")
+
+
+class ScheduleResult(NamedTuple):
+    """A newly downloaded result file for a schedule."""
+
+    schedule_id: str
+    task_id: str
+    path: Path
+    sha256: str
+    task: dict[str, Any]
+
+
+class ScheduleResultFetcher:
+    """De-duplicating downloader for the latest result of Feed schedules.
+
+    Parameters
+    ----------
+    feed:
+        ``ebay.sell_feed`` of a synchronous :class:`EbayClient`.
+    state_path:
+        JSON file recording the last result delivered per schedule.
+    download_dir:
+        Where result files are written, as ``<schedule_id>-<task_id>``.
+    max_workers:
+        Schedules checked concurrently per poll.
+    look_back_days:
+        How far back ``get_tasks`` looks for a schedule's tasks, at most 90.
+        Must cover the schedule's interval, or its newest result can be
+        out of range between runs.
+    """
+
+    def __init__(
+        self,
+        feed: SellFeedApi,
+        state_path: str | os.PathLike[str],
+        download_dir: str | os.PathLike[str],
+        *,
+        max_workers: int = 4,
+        look_back_days: int = 31,
+    ) -> None:
+        self._feed = feed
+        self._state_path = Path(state_path)
+        self._download_dir = Path(download_dir)
+        self._download_dir.mkdir(parents=True, exist_ok=True)
+        self._max_workers = max_workers
+        self._look_back_days = look_back_days
+        self._lock = threading.Lock()
+        self.errors: dict[str, Exception] = {}
+        self.state: dict[str, dict[str, Any]] = (
+            json.loads(self._state_path.read_text()) if self._state_path.exists() else {}
+        )
+
+    def poll(self, schedule_ids: Iterable[str]) -> list[ScheduleResult]:
+        """Check every schedule once and download the results not yet seen.
+
+        A result counts as seen once its file is on disk. A schedule whose
+        check fails is retried on the next poll and its error kept in
+        :attr:`errors`; the error is re-raised only if every schedule failed.
+        """
+        schedule_ids = list(schedule_ids)
+        results: list[ScheduleResult] = []
+        self.errors = {}
+        for outcome in run_concurrently(
+            self._poll_schedule, schedule_ids, max_workers=self._max_workers
+        ):
+            if outcome.error is not None:
+                self.errors[outcome.item] = outcome.error
+            elif outcome.value is not None:
+                results.append(outcome.value)
+        if self.errors and len(self.errors) == len(schedule_ids):
+            raise next(iter(self.errors.values()))
+        return results
+
+    def watch(
+        self,
+        schedule_ids: Iterable[str],
+        on_result: Callable[[ScheduleResult], None],
+        *,
+        interval: float = 900.0,
+        stop: threading.Event | None = None,
+    ) -> None:
+        """Poll every *interval* seconds, passing each new result to *on_result*.
+
+        Runs until *stop* is set.
+        """
+        schedule_ids = list(schedule_ids)
+        stop = stop or threading.Event()
+        while not stop.is_set():
+            for result in self.poll(schedule_ids):
+                on_result(result)
+            stop.wait(interval)
+
+    # -- internals -------------------------------------------------------------
+
+    def _latest_task(self, schedule_id: str, after: str) -> dict[str, Any] | None:
+        # get_tasks does not promise an order, so every page is checked.
+        # ISO-8601 timestamps sort chronologically as strings.
+        finished = (
+            task
+            for task in self._feed.iter_tasks(
+                schedule_id=schedule_id, look_back_days=self._look_back_days
+            )
+            if task.get("status") in _RESULT_STATUSES
+            and task.get("creationDate", "") > after
+        )
+        return max(finished, key=lambda task: task["creationDate"], default=None)
+
+    def _poll_schedule(self, schedule_id: str) -> ScheduleResult | None:
+        seen = self.state.get(schedule_id, {})
+        task = self._latest_task(schedule_id, seen.get("creationDate") or "")
+        if task is None or task["taskId"] == seen.get("taskId"):
+            return None
+        path = self._download_dir / f"{schedule_id}-{task['taskId']}"
+        download = self._feed.download_result_file_to(task["taskId"], path)
+        duplicate = download.sha256 == seen.get("sha256")
+        self._record(schedule_id, {
+            "taskId": task["taskId"],
+            "sha256": download.sha256,
+            "creationDate": task.get("creationDate"),
+        })
+        if duplicate:
+            path.unlink()
+            return None
+        return ScheduleResult(schedule_id, task["taskId"], path, download.sha256, task)
+
+    def _record(self, schedule_id: str, entry: dict[str, Any]) -> None:
+        with self._lock:
+            self.state[schedule_id] = entry
+            tmp = self._state_path.with_name(self._state_path.name + ".tmp")
+            tmp.write_text(json.dumps(self.state, indent=2, sort_keys=True))
+            os.replace(tmp, self._state_path)
@@ -6,16 +6,17 @@ Version: v1.18.0
 
 from __future__ import annotations
 
+from functools import partial
 from typing import Any, TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from ebay_sdk.client import EbayClient
+    from ebay_sdk.client import AsyncEbayClient, EbayClient
 
 _BASE = "/sell/finances/v1"
 
 
 class SellFinancesApi:
-    def __init__(self, client: EbayClient) -> None:
+    def __init__(self, client: EbayClient | AsyncEbayClient) -> None:
         self._c = client
 
     # -- Payout ----------------------------------------------------------------
@@ -73,6 +74,23 @@ class SellFinancesApi:
             params["offset"] = offset
         return self._c.get(f"{_BASE}/transaction", params=params)
 
+    def iter_transactions(
+        self,
+        *,
+        filter: str | None = None,
+        sort: str | None = None,
+        page_size: int = 1000,
+        prefetch: int = 0,
+    ) -> Any:
+        """Iterate over all matching transactions, fetching pages lazily.
+
+        *prefetch* pages are fetched ahead concurrently once the total is known.
+        """
+        fetch = partial(self.get_transactions, filter=filter, sort=sort)
+        return self._c.paginate(
+            fetch, "transactions", page_size=page_size, prefetch=prefetch
+        )
+
     def get_transaction_summary(
         self, *, filter: str | None = None
     ) -> Any:
@@ -6,16 +6,22 @@ Version: v1.20.7
 
 from __future__ import annotations
 
-from typing import Any, TYPE_CHECKING
+import os
+from collections.abc import Iterator
+from functools import partial
+from typing import IO, Any, TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from ebay_sdk.client import EbayClient
+    from ebay_sdk.client import AsyncEbayClient, EbayClient
+    from ebay_sdk.streaming import DownloadResult
 
 _BASE = "/sell/fulfillment/v1"
+# Evidence files are images and PDFs, not JSON.
+_DOWNLOAD_HEADERS = {"Accept": "application/octet-stream"}
 
 
 class SellFulfillmentApi:
-    def __init__(self, client: EbayClient) -> None:
+    def __init__(self, client: EbayClient | AsyncEbayClient) -> None:
         self._c = client
 
     # -- Orders ----------------------------------------------------------------
@@ -43,6 +49,26 @@ class SellFulfillmentApi:
             params["fieldGroups"] = fieldgroups
         return self._c.get(f"{_BASE}/order", params=params)
 
+    def iter_orders(
+        self,
+        *,
+        filter: str | None = None,
+        order_ids: str | None = None,
+        fieldgroups: str | None = None,
+        page_size: int = 200,
+        prefetch: int = 0,
+    ) -> Any:
+        """Iterate over all matching orders, fetching pages lazily.
+
+        *prefetch* pages are fetched ahead concurrently once the total is known.
+        """
+        fetch = partial(
+            self.get_orders, filter=filter, order_ids=order_ids, fieldgroups=fieldgroups
+        )
+        return self._c.paginate(
+            fetch, "orders", page_size=page_size, prefetch=prefetch
+        )
+
     def get_order(self, order_id: str, *, fieldgroups: str | None = None) -> Any:
         """Get a specific order."""
         params: dict[str, Any] = {}
@@ -107,6 +133,30 @@ class SellFulfillmentApi:
             params["offset"] = offset
         return self._c.get(f"{_BASE}/payment_dispute", params=params)
 
+    def iter_payment_disputes(
+        self,
+        *,
+        order_id: str | None = None,
+        buyer_username: str | None = None,
+        open_date_from: str | None = None,
+        open_date_to: str | None = None,
+        payment_dispute_status: str | None = None,
+        page_size: int = 200,
+        prefetch: int = 0,
+    ) -> Any:
+        """Iterate over all matching payment dispute summaries, fetching pages lazily."""
+        fetch = partial(
+            self.get_payment_disputes,
+            order_id=order_id,
+            buyer_username=buyer_username,
+            open_date_from=open_date_from,
+            open_date_to=open_date_to,
+            payment_dispute_status=payment_dispute_status,
+        )
+        return self._c.paginate(
+            fetch, "paymentDisputeSummaries", page_size=page_size, prefetch=prefetch
+        )
+
     def get_payment_dispute(self, payment_dispute_id: str) -> Any:
         """Get a specific payment dispute."""
         return self._c.get(f"{_BASE}/payment_dispute/{payment_dispute_id}")
@@ -139,10 +189,53 @@ class SellFulfillmentApi:
         evidence_id: str,
         file_id: str,
     ) -> Any:
-        """Fetch evidence content for a payment dispute."""
-        return self._c.get(
+        """Fetch an evidence file (image or PDF) for a payment dispute as raw bytes.
+
+        The file is held in memory; prefer :meth:`download_evidence_content_to`
+        or :meth:`iter_evidence_content` for large files.
+        """
+        return self._c.get_bytes(
+            f"{_BASE}/payment_dispute/{payment_dispute_id}/fetch_evidence_content",
+            params={"evidence_id": evidence_id, "file_id": file_id},
+            headers=_DOWNLOAD_HEADERS,
+        )
+
+    def iter_evidence_content(
+        self,
+        payment_dispute_id: str,
+        evidence_id: str,
+        file_id: str,
+    ) -> Iterator[bytes]:
+        """Yield an evidence file as raw chunks. Requires :class:`EbayClient`."""
+        with self._c.stream(
+            "GET",
+            f"{_BASE}/payment_dispute/{payment_dispute_id}/fetch_evidence_content",
+            params={"evidence_id": evidence_id, "file_id": file_id},
+            headers=_DOWNLOAD_HEADERS,
+        ) as resp:
+            yield from resp.iter_bytes()
+
+    def download_evidence_content_to(
+        self,
+        payment_dispute_id: str,
+        evidence_id: str,
+        file_id: str,
+        dest: str | os.PathLike[str] | IO[bytes],
+        *,
+        resume: bool = True,
+        sha256: str | None = None,
+    ) -> DownloadResult:
+        """Stream an evidence file to a path or binary file object.
+
+        See :meth:`EbayClient.download` for resume and checksum behaviour.
+        """
+        return self._c.download(
             f"{_BASE}/payment_dispute/{payment_dispute_id}/fetch_evidence_content",
+            dest,
             params={"evidence_id": evidence_id, "file_id": file_id},
+            headers=_DOWNLOAD_HEADERS,
+            resume=resume,
+            sha256=sha256,
         )
 
     def add_evidence(
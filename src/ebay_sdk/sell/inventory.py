@@ -6,16 +6,22 @@ Version: v1.18.4
 
 from __future__ import annotations
 
+import inspect
+from collections.abc import Awaitable, Callable, Iterable
+from functools import partial
 from typing import Any, TYPE_CHECKING
 
+from ebay_sdk.batch import BulkResult, async_bulk_call, bulk_call
+
 if TYPE_CHECKING:
-    from ebay_sdk.client import EbayClient
+    from ebay_sdk.client import AsyncEbayClient, EbayClient
 
 _BASE = "/sell/inventory/v1"
+_BULK_LIMIT = 25
 
 
 class SellInventoryApi:
-    def __init__(self, client: EbayClient) -> None:
+    def __init__(self, client: EbayClient | AsyncEbayClient) -> None:
         self._c = client
 
     # -- Inventory Item --------------------------------------------------------
@@ -43,6 +49,20 @@ class SellInventoryApi:
             params["offset"] = offset
         return self._c.get(f"{_BASE}/inventory_item", params=params)
 
+    def iter_inventory_items(
+        self, *, page_size: int = 100, prefetch: int = 0
+    ) -> Any:
+        """Iterate over all inventory items, fetching pages lazily.
+
+        *prefetch* pages are fetched ahead concurrently once the total is known.
+        """
+        return self._c.paginate(
+            self.get_inventory_items,
+            "inventoryItems",
+            page_size=page_size,
+            prefetch=prefetch,
+        )
+
     def bulk_create_or_replace_inventory_item(self, body: dict[str, Any]) -> Any:
         """Bulk create or replace up to 25 inventory items."""
         return self._c.post(f"{_BASE}/bulk_create_or_replace_inventory_item", json=body)
@@ -55,6 +75,53 @@ class SellInventoryApi:
         """Bulk update price/quantity for inventory offers."""
         return self._c.post(f"{_BASE}/bulk_update_price_quantity", json=body)
 
+    # -- Chunked bulk helpers ---------------------------------------------------
+
+    def bulk_create_or_replace_inventory_items(
+        self, items: Iterable[dict[str, Any]], *, max_workers: int = 4
+    ) -> BulkResult | Awaitable[BulkResult]:
+        """Create or replace any number of items, 25 per concurrent call.
+
+        Each entry is a ``requests`` element of
+        :meth:`bulk_create_or_replace_inventory_item` (including ``sku``).
+        On :class:`AsyncEbayClient` this returns an awaitable and the calls
+        run on the event loop instead of threads.
+        """
+        return self._bulk(self.bulk_create_or_replace_inventory_item, items, max_workers)
+
+    def bulk_get_inventory_items(
+        self, skus: Iterable[str], *, max_workers: int = 4
+    ) -> BulkResult | Awaitable[BulkResult]:
+        """Retrieve any number of items by SKU, 25 per concurrent call.
+
+        On :class:`AsyncEbayClient` this returns an awaitable and the calls
+        run on the event loop instead of threads.
+        """
+        return self._bulk(
+            self.bulk_get_inventory_item, ({"sku": sku} for sku in skus), max_workers
+        )
+
+    def bulk_update_price_quantities(
+        self, updates: Iterable[dict[str, Any]], *, max_workers: int = 4
+    ) -> BulkResult | Awaitable[BulkResult]:
+        """Update price/quantity for any number of SKUs, 25 per concurrent call.
+
+        Each entry is a ``requests`` element of
+        :meth:`bulk_update_price_quantity`. On :class:`AsyncEbayClient` this
+        returns an awaitable and the calls run on the event loop instead of
+        threads.
+        """
+        return self._bulk(self.bulk_update_price_quantity, updates, max_workers)
+
+    def _bulk(
+        self,
+        call: Callable[[dict[str, Any]], Any],
+        entries: Iterable[dict[str, Any]],
+        max_workers: int,
+    ) -> BulkResult | Awaitable[BulkResult]:
+        runner = async_bulk_call if inspect.iscoroutinefunction(self._c.post) else bulk_call
+        return runner(call, entries, chunk_size=_BULK_LIMIT, max_workers=max_workers)
+
     # -- Offer -----------------------------------------------------------------
 
     def get_offers(
@@ -80,6 +147,26 @@ class SellInventoryApi:
             params["offset"] = offset
         return self._c.get(f"{_BASE}/offer", params=params)
 
+    def iter_offers(
+        self,
+        *,
+        sku: str | None = None,
+        marketplace_id: str | None = None,
+        format: str | None = None,
+        page_size: int = 100,
+        prefetch: int = 0,
+    ) -> Any:
+        """Iterate over all matching offers, fetching pages lazily.
+
+        *prefetch* pages are fetched ahead concurrently once the total is known.
+        """
+        fetch = partial(
+            self.get_offers, sku=sku, marketplace_id=marketplace_id, format=format
+        )
+        return self._c.paginate(
+            fetch, "offers", page_size=page_size, prefetch=prefetch
+        )
+
     def get_offer(self, offer_id: str) -> Any:
         """Get a specific offer."""
         return self._c.get(f"{_BASE}/offer/{offer_id}")
@@ -6,16 +6,17 @@ Version: v1.22.2
 
 from __future__ import annotations
 
+from functools import partial
 from typing import Any, TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from ebay_sdk.client import EbayClient
+    from ebay_sdk.client import AsyncEbayClient, EbayClient
 
 _BASE = "/sell/marketing/v1"
 
 
 class SellMarketingApi:
-    def __init__(self, client: EbayClient) -> None:
+    def __init__(self, client: EbayClient | AsyncEbayClient) -> None:
         self._c = client
 
     # -- Campaign --------------------------------------------------------------
@@ -43,6 +44,29 @@ class SellMarketingApi:
             params["offset"] = offset
         return self._c.get(f"{_BASE}/ad_campaign", params=params)
 
+    def iter_campaigns(
+        self,
+        *,
+        campaign_name: str | None = None,
+        campaign_status: str | None = None,
+        funding_strategy: str | None = None,
+        page_size: int = 500,
+        prefetch: int = 0,
+    ) -> Any:
+        """Iterate over all matching campaigns, fetching pages lazily.
+
+        *prefetch* pages are fetched ahead concurrently once the total is known.
+        """
+        fetch = partial(
+            self.get_campaigns,
+            campaign_name=campaign_name,
+            campaign_status=campaign_status,
+            funding_strategy=funding_strategy,
+        )
+        return self._c.paginate(
+            fetch, "campaigns", page_size=page_size, prefetch=prefetch
+        )
+
     def get_campaign(self, campaign_id: str) -> Any:
         """Get a specific campaign."""
         return self._c.get(f"{_BASE}/ad_campaign/{campaign_id}")
@@ -208,6 +232,31 @@ class SellMarketingApi:
             params["offset"] = offset
         return self._c.get(f"{_BASE}/ad_campaign/{campaign_id}/ad", params=params)
 
+    def iter_ads(
+        self,
+        campaign_id: str,
+        *,
+        ad_group_ids: str | None = None,
+        ad_status: str | None = None,
+        listing_ids: str | None = None,
+        page_size: int = 500,
+        prefetch: int = 0,
+    ) -> Any:
+        """Iterate over all ads for a campaign, fetching pages lazily.
+
+        *prefetch* pages are fetched ahead concurrently once the total is known.
+        """
+        fetch = partial(
+            self.get_ads,
+            campaign_id,
+            ad_group_ids=ad_group_ids,
+            ad_status=ad_status,
+            listing_ids=listing_ids,
+        )
+        return self._c.paginate(
+            fetch, "ads", page_size=page_size, prefetch=prefetch
+        )
+
     def get_ad(self, campaign_id: str, ad_id: str) -> Any:
         """Get a specific ad."""
         return self._c.get(f"{_BASE}/ad_campaign/{campaign_id}/ad/{ad_id}")
@@ -0,0 +1,165 @@
+"""Coalesce single-order lookups into batched ``get_orders`` calls.
+
+Notification handlers typically fetch one order at a time. :class:`OrderHydrator`
+collects those lookups for a short window and resolves up to 50 of them
+with one ``get_orders(order_ids=...)`` call, handing each caller its own
+order through a :class:`~concurrent.futures.Future`::
+
+    with OrderHydrator(ebay.sell_fulfillment) as hydrator:
+        futures = [hydrator.submit(n["orderId"]) for n in notifications]
+        orders = [f.result() for f in futures]
+
+:meth:`~OrderHydrator.get_order` is a blocking drop-in for
+``SellFulfillmentApi.get_order`` that can be called from many threads.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any
+
+from ebay_sdk.client import EbayApiError
+from ebay_sdk.sell.fulfillment import SellFulfillmentApi
+
+# ``get_orders`` accepts at most 50 ids in ``orderIds``.
+_ORDER_IDS_LIMIT = 50
+
+
+class OrderHydrator:
+    """Batching front end to ``get_order``.
+
+    Parameters
+    ----------
+    fulfillment:
+        ``ebay.sell_fulfillment`` of a synchronous :class:`EbayClient`.
+    window:
+        Seconds to wait after the first pending lookup before sending the
+        batch; a batch that reaches *max_batch* ids goes out immediately.
+    max_batch:
+        Ids per ``get_orders`` call, at most 50.
+    max_workers:
+        ``get_orders`` calls in flight at once.
+    fieldgroups:
+        Passed through to ``get_orders``.
+    """
+
+    def __init__(
+        self,
+        fulfillment: SellFulfillmentApi,
+        *,
+        window: float = 0.05,
+        max_batch: int = _ORDER_IDS_LIMIT,
+        max_workers: int = 4,
+        fieldgroups: str | None = None,
+    ) -> None:
+        if not 1 <= max_batch <= _ORDER_IDS_LIMIT:
+            raise ValueError(f"max_batch must be between 1 and {_ORDER_IDS_LIMIT}")
+        self._fulfillment = fulfillment
+        self._window = window
+        self._max_batch = max_batch
+        self._fieldgroups = fieldgroups
+        self._pending: dict[str, list[Future[dict[str, Any]]]] = {}
+        self._deadline = 0.0
+        self._closed = False
+        self._cond = threading.Condition()
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="ebay-order-hydrator"
+        )
+        self._flusher = threading.Thread(
+            target=self._flush_loop, name="ebay-order-hydrator", daemon=True
+        )
+        self._flusher.start()
+        self.calls = 0
+
+    def submit(self, order_id: str) -> Future[dict[str, Any]]:
+        """Queue a lookup of *order_id* and return a future for the order.
+
+        Lookups of the same id within one batch share a single entry. An
+        order eBay does not return fails with :class:`EbayApiError` 404.
+        """
+        future: Future[dict[str, Any]] = Future()
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("OrderHydrator is closed")
+            if not self._pending:
+                self._deadline = time.monotonic() + self._window
+                self._cond.notify()
+            self._pending.setdefault(order_id, []).append(future)
+            if len(self._pending) >= self._max_batch:
+                self._dispatch()
+        return future
+
+    def get_order(self, order_id: str) -> dict[str, Any]:
+        """Fetch one order, batched with concurrent callers."""
+        return self.submit(order_id).result()
+
+    def get_orders(self, order_ids: Iterable[str]) -> list[dict[str, Any]]:
+        """Fetch many orders in input order, 50 per call."""
+        futures = [self.submit(order_id) for order_id in order_ids]
+        return [future.result() for future in futures]
+
+    def close(self) -> None:
+        """Send whatever is pending and wait for all calls to finish."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self._flusher.join()
+        self._pool.shutdown(wait=True)
+
+    def __enter__(self) -> OrderHydrator:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    # -- internals -------------------------------------------------------------
+
+    def _dispatch(self) -> None:
+        # Called with self._cond held.
+        batch, self._pending = self._pending, {}
+        self._pool.submit(self._resolve, batch)
+
+    def _flush_loop(self) -> None:
+        with self._cond:
+            while True:
+                if self._pending:
+                    remaining = self._deadline - time.monotonic()
+                    if remaining <= 0 or self._closed:
+                        self._dispatch()
+                    else:
+                        self._cond.wait(remaining)
+                elif self._closed:
+                    return
+                else:
+                    self._cond.wait()
+
+    def _resolve(self, batch: dict[str, list[Future[dict[str, Any]]]]) -> None:
+        with self._cond:
+            self.calls += 1
+        try:
+            response = self._fulfillment.get_orders(
+                order_ids=",".join(batch), fieldgroups=self._fieldgroups
+            )
+        except BaseException as exc:
+            for futures in batch.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(exc)
+            return
+        found = {order["orderId"]: order for order in (response or {}).get("orders", [])}
+        for order_id, futures in batch.items():
+            order = found.get(order_id)
+            for future in futures:
+                if future.done():
+                    continue
+                if order is not None:
+                    future.set_result(order)
+                else:
+                    future.set_exception(EbayApiError(
+                        404,
+                        (response or {}).get("warnings"),
+                        f"/sell/fulfillment/v1/order/{order_id}",
+                    ))
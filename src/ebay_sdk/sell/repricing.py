@@ -0,0 +1,260 @@
+"""Streaming price/quantity pipeline on ``bulk_update_price_quantity``.
+
+Updates are read from any iterable (typically a generator fed by a pricing
+engine) and grouped into time windows, which close on a timer even while
+the input is idle. Within a window, later updates to the
+same offer replace earlier ones; updates that match what was last sent are
+dropped; the rest go out 25 SKUs per call with several calls in flight.
+Windows are sent in order on a background thread, so reading the next
+window overlaps with sending the previous one and a newer price can never
+be overtaken by an older one.
+"""
+
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from collections.abc import Callable, Iterable, MutableMapping
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Any, NamedTuple
+
+from ebay_sdk.batch import chunked, run_concurrently
+from ebay_sdk.sell.inventory import SellInventoryApi
+
+_BULK_LIMIT = 25
+
+
+class PriceQuantityUpdate(NamedTuple):
+    """A new price and/or quantity for one offer; *None* leaves a field as is."""
+
+    sku: str
+    offer_id: str
+    price: Decimal | str | float | None = None
+    quantity: int | None = None
+    currency: str = "USD"
+
+
+@dataclass
+class RepricingStats:
+    """Counters for a :meth:`Repricer.run`, updated as windows complete."""
+
+    received: int = 0
+    coalesced: int = 0
+    unchanged: int = 0
+    sent: int = 0
+    failed: int = 0
+    calls: int = 0
+    started: float = field(default_factory=time.monotonic)
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started
+
+    @property
+    def sent_per_second(self) -> float:
+        elapsed = self.elapsed
+        return self.sent / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def received_per_second(self) -> float:
+        elapsed = self.elapsed
+        return self.received / elapsed if elapsed > 0 else 0.0
+
+
+class Repricer:
+    """Coalescing, de-duplicating, parallel price/quantity pusher.
+
+    Parameters
+    ----------
+    inventory:
+        ``ebay.sell_inventory`` of a (synchronous) :class:`EbayClient`.
+    window:
+        Seconds of input to coalesce before sending.
+    max_window_size:
+        Flush early once this many distinct offers are pending.
+    max_workers:
+        Concurrent ``bulk_update_price_quantity`` calls per window.
+    last_sent:
+        Mapping of ``(sku, offer_id)`` to the ``(price, quantity)`` last
+        accepted by eBay. Defaults to an in-memory dict; pass a persistent
+        mapping (e.g. a ``shelve``) to keep de-duplication across runs.
+    on_failure:
+        Called with each failed per-offer response (or a synthesised one for
+        a failed call). Failures are collected in :attr:`failures` otherwise.
+    on_progress:
+        Called with the running :class:`RepricingStats` after each window.
+    """
+
+    def __init__(
+        self,
+        inventory: SellInventoryApi,
+        *,
+        window: float = 1.0,
+        max_window_size: int = 5000,
+        max_workers: int = 4,
+        last_sent: MutableMapping[tuple[str, str], tuple[str | None, int | None]] | None = None,
+        on_failure: Callable[[dict[str, Any]], None] | None = None,
+        on_progress: Callable[[RepricingStats], None] | None = None,
+    ) -> None:
+        self._inventory = inventory
+        self._window = window
+        self._max_window_size = max_window_size
+        self._max_workers = max_workers
+        self.last_sent = last_sent if last_sent is not None else {}
+        self.failures: list[dict[str, Any]] = []
+        self._on_failure = on_failure or self.failures.append
+        self._on_progress = on_progress
+        self.stats = RepricingStats()
+
+    def run(self, updates: Iterable[PriceQuantityUpdate]) -> RepricingStats:
+        """Consume *updates* until exhausted and push every effective change.
+
+        Windows are closed on a timer, so updates still go out on schedule
+        while *updates* is waiting for its next item.
+        """
+        self.stats = RepricingStats()
+        incoming: queue.Queue[PriceQuantityUpdate | None] = queue.Queue(
+            maxsize=self._max_window_size
+        )
+        windows: queue.Queue[dict[tuple[str, str], PriceQuantityUpdate] | None] = queue.Queue(maxsize=1)
+        errors: list[BaseException] = []
+        coalescer = threading.Thread(
+            target=self._coalesce, args=(incoming, windows, errors),
+            name="ebay-repricer-window", daemon=True,
+        )
+        sender = threading.Thread(
+            target=self._send_windows, args=(windows, errors), name="ebay-repricer", daemon=True
+        )
+        coalescer.start()
+        sender.start()
+        try:
+            for update in updates:
+                if errors:
+                    break
+                incoming.put(update)
+        finally:
+            incoming.put(None)
+            coalescer.join()
+            sender.join()
+        if errors:
+            raise errors[0]
+        return self.stats
+
+    # -- internals -------------------------------------------------------------
+
+    def _coalesce(
+        self,
+        incoming: queue.Queue,
+        windows: queue.Queue,
+        errors: list[BaseException],
+    ) -> None:
+        # Runs on its own thread so the window deadline is honoured even
+        # while the producer is blocked waiting for input.
+        pending: dict[tuple[str, str], PriceQuantityUpdate] = {}
+        deadline = 0.0
+        try:
+            while True:
+                timeout = max(deadline - time.monotonic(), 0.0) if pending else None
+                try:
+                    update = incoming.get(timeout=timeout)
+                except queue.Empty:
+                    windows.put(pending)
+                    pending = {}
+                    continue
+                if update is None:
+                    break
+                self.stats.received += 1
+                if not pending:
+                    deadline = time.monotonic() + self._window
+                key = (update.sku, update.offer_id)
+                if key in pending:
+                    self.stats.coalesced += 1
+                    update = _merge(pending.pop(key), update)
+                pending[key] = update
+                if len(pending) >= self._max_window_size or time.monotonic() >= deadline:
+                    windows.put(pending)
+                    pending = {}
+            if pending:
+                windows.put(pending)
+        except BaseException as exc:
+            errors.append(exc)
+            # Keep draining so the producer never blocks on a full queue.
+            while incoming.get() is not None:
+                pass
+        finally:
+            windows.put(None)
+
+    def _send_windows(self, windows: queue.Queue, errors: list[BaseException]) -> None:
+        try:
+            while (pending := windows.get()) is not None:
+                self._send_window(pending)
+        except BaseException as exc:
+            errors.append(exc)
+            # Keep draining so the producer never blocks on a full queue.
+            while windows.get() is not None:
+                pass
+
+    def _send_window(self, pending: dict[tuple[str, str], PriceQuantityUpdate]) -> None:
+        changed: dict[tuple[str, str], tuple[str | None, int | None]] = {}
+        by_sku: dict[str, list[dict[str, Any]]] = {}
+        for key, update in pending.items():
+            price = _normalise_price(update.price)
+            previous = self.last_sent.get(key, (None, None))
+            offer: dict[str, Any] = {"offerId": update.offer_id}
+            if price is not None and price != previous[0]:
+                offer["price"] = {"value": price, "currency": update.currency}
+            if update.quantity is not None and update.quantity != previous[1]:
+                offer["availableQuantity"] = update.quantity
+            if len(offer) == 1:
+                self.stats.unchanged += 1
+                continue
+            changed[key] = (
+                price if price is not None else previous[0],
+                update.quantity if update.quantity is not None else previous[1],
+            )
+            by_sku.setdefault(update.sku, []).append(offer)
+        entries = ({"sku": sku, "offers": offers} for sku, offers in by_sku.items())
+        for outcome in run_concurrently(
+            lambda chunk: self._inventory.bulk_update_price_quantity({"requests": chunk}),
+            chunked(entries, _BULK_LIMIT),
+            max_workers=self._max_workers,
+        ):
+            self.stats.calls += 1
+            if outcome.error is not None:
+                for entry in outcome.item:
+                    for offer in entry["offers"]:
+                        self.stats.failed += 1
+                        self._on_failure({
+                            "sku": entry["sku"],
+                            "offerId": offer["offerId"],
+                            "statusCode": getattr(outcome.error, "status_code", None),
+                            "errors": [{"message": str(outcome.error)}],
+                        })
+                continue
+            for response in (outcome.value or {}).get("responses") or []:
+                key = (response.get("sku"), response.get("offerId"))
+                if response.get("statusCode", 200) >= 400:
+                    self.stats.failed += 1
+                    self._on_failure(response)
+                elif key in changed:
+                    self.stats.sent += 1
+                    self.last_sent[key] = changed[key]
+        if self._on_progress is not None:
+            self._on_progress(self.stats)
+
+
+def _merge(old: PriceQuantityUpdate, new: PriceQuantityUpdate) -> PriceQuantityUpdate:
+    """Fold *new* over *old*, keeping fields that *new* leaves unset."""
+    return new._replace(
+        price=new.price if new.price is not None else old.price,
+        quantity=new.quantity if new.quantity is not None else old.quantity,
+        currency=new.currency if new.price is not None else old.currency,
+    )
+
+
+def _normalise_price(price: Decimal | str | float | None) -> str | None:
+    if price is None:
+        return None
+    return format(Decimal(str(price)).normalize(), "f")
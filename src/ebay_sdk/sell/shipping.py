@@ -0,0 +1,153 @@
+"""Submit many shipping fulfillments concurrently, skipping ones already made.
+
+End-of-day tracking uploads are one ``create_shipping_fulfillment`` call per
+package. :class:`FulfillmentSubmitter` runs them on a bounded thread pool.
+Before the first submission for an order it reads the order's existing
+fulfillments once and remembers their tracking numbers, so re-running a
+batch after a crash or a partial failure only sends what is still missing::
+
+    submitter = FulfillmentSubmitter(ebay.sell_fulfillment, max_workers=16)
+    outcomes = submitter.submit(
+        Shipment(row.order_id, [{"lineItemId": row.line_item_id, "quantity": 1}],
+                 "USPS", row.tracking)
+        for row in todays_labels
+    )
+    failed = [o for o in outcomes if o.status == "failed"]
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterable, MutableMapping, Sequence
+from dataclasses import dataclass
+from typing import Any, NamedTuple
+
+from ebay_sdk.batch import run_concurrently
+from ebay_sdk.sell.fulfillment import SellFulfillmentApi
+
+
+class Shipment(NamedTuple):
+    """One package to report as shipped."""
+
+    order_id: str
+    line_items: Sequence[dict[str, Any]]
+    carrier: str
+    tracking_number: str
+    shipped_date: str | None = None
+
+    def body(self) -> dict[str, Any]:
+        body: dict[str, Any] = {
+            "lineItems": [dict(item) for item in self.line_items],
+            "shippingCarrierCode": self.carrier,
+            "trackingNumber": self.tracking_number,
+        }
+        if self.shipped_date is not None:
+            body["shippedDate"] = self.shipped_date
+        return body
+
+
+@dataclass
+class ShipmentOutcome:
+    """What happened to a :class:`Shipment`: ``created``, ``skipped`` or ``failed``."""
+
+    shipment: Shipment
+    status: str
+    response: Any = None
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.status != "failed"
+
+
+class FulfillmentSubmitter:
+    """Bounded-concurrency, idempotent ``create_shipping_fulfillment`` runner.
+
+    Parameters
+    ----------
+    fulfillment:
+        ``ebay.sell_fulfillment`` of a synchronous :class:`EbayClient`.
+    max_workers:
+        Orders processed at once. Shipments for the same order are sent one
+        after another so they are checked against each other.
+    shipped:
+        Mapping of order id to the tracking numbers already on that order.
+        Defaults to an in-memory dict; pass a persistent mapping (e.g. a
+        ``shelve``) to skip the lookups on later runs.
+    """
+
+    def __init__(
+        self,
+        fulfillment: SellFulfillmentApi,
+        *,
+        max_workers: int = 8,
+        shipped: MutableMapping[str, list[str]] | None = None,
+    ) -> None:
+        self._fulfillment = fulfillment
+        self._max_workers = max_workers
+        self.shipped = shipped if shipped is not None else {}
+        self._lock = threading.Lock()
+
+    def submit(self, shipments: Iterable[Shipment]) -> list[ShipmentOutcome]:
+        """Send every shipment not already on eBay; outcomes in input order.
+
+        A shipment is skipped when its tracking number is already on the
+        order. Line items are not compared, since one multi-quantity line
+        item may ship in several packages. Errors are recorded per shipment
+        and never stop the batch.
+        """
+        by_order: dict[str, list[tuple[int, Shipment]]] = {}
+        for index, shipment in enumerate(shipments):
+            by_order.setdefault(shipment.order_id, []).append((index, shipment))
+        outcomes: dict[int, ShipmentOutcome] = {}
+        for outcome in run_concurrently(
+            self._submit_order, by_order.values(), max_workers=self._max_workers
+        ):
+            if outcome.error is not None:
+                for index, shipment in outcome.item:
+                    outcomes[index] = ShipmentOutcome(shipment, "failed", error=outcome.error)
+            else:
+                outcomes.update(outcome.value)
+        return [outcomes[index] for index in sorted(outcomes)]
+
+    # -- internals -------------------------------------------------------------
+
+    def _submit_order(
+        self, shipments: list[tuple[int, Shipment]]
+    ) -> dict[int, ShipmentOutcome]:
+        order_id = shipments[0][1].order_id
+        tracking_numbers = self._existing(order_id)
+        outcomes = {}
+        for index, shipment in shipments:
+            if shipment.tracking_number in tracking_numbers:
+                outcomes[index] = ShipmentOutcome(shipment, "skipped")
+                continue
+            try:
+                response = self._fulfillment.create_shipping_fulfillment(
+                    order_id, shipment.body()
+                )
+            except Exception as exc:
+                outcomes[index] = ShipmentOutcome(shipment, "failed", error=exc)
+                continue
+            tracking_numbers = [*tracking_numbers, shipment.tracking_number]
+            self._remember(order_id, tracking_numbers)
+            outcomes[index] = ShipmentOutcome(shipment, "created", response=response)
+        return outcomes
+
+    def _existing(self, order_id: str) -> list[str]:
+        with self._lock:
+            cached = self.shipped.get(order_id)
+        if cached is not None:
+            return cached
+        response = self._fulfillment.get_shipping_fulfillments(order_id) or {}
+        tracking_numbers = [
+            fulfillment["shipmentTrackingNumber"]
+            for fulfillment in response.get("fulfillments", [])
+            if fulfillment.get("shipmentTrackingNumber")
+        ]
+        self._remember(order_id, tracking_numbers)
+        return tracking_numbers
+
+    def _remember(self, order_id: str, tracking_numbers: list[str]) -> None:
+        with self._lock:
+            self.shipped[order_id] = tracking_numbers
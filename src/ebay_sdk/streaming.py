@@ -0,0 +1,343 @@
+"""Incremental decoding and downloading of large response bodies.
+
+Some eBay endpoints (``fetch_item_aspects``, Feed API result files) return
+payloads far too large to hold in memory. The decoders here work on any
+iterable of byte chunks — typically ``httpx.Response.iter_bytes()`` — and
+keep only a small window of the body at a time; :class:`PartialDownload`
+backs the clients' resumable ``download`` methods and :class:`UploadReader`
+feeds multipart uploads from disk or a generator.
+"""
+
+from __future__ import annotations
+
+import codecs
+import hashlib
+import io
+import json
+import os
+import re
+import zlib
+from collections.abc import Callable, Iterable, Iterator
+from pathlib import Path
+from typing import IO, Any, NamedTuple
+
+_GZIP_MAGIC = b"\x1f\x8b"
+_WHITESPACE = re.compile(r"[\s,]*")
+_ELEMENT_END = re.compile(r"\s*[,\]]")
+
+
+def gunzip_chunks(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """Transparently decompress a gzip stream; pass other data through.
+
+    The format is sniffed from the first bytes, so this is safe to apply to
+    bodies that may or may not have been gzipped (for instance when a proxy
+    already stripped the ``Content-Encoding``). Concatenated gzip members
+    are handled.
+    """
+    iterator = iter(chunks)
+    head = b""
+    for chunk in iterator:
+        head += chunk
+        if len(head) >= 2:
+            break
+    if not head.startswith(_GZIP_MAGIC):
+        if head:
+            yield head
+        yield from iterator
+        return
+    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    pending = head
+    while True:
+        while pending:
+            data = decompressor.decompress(pending)
+            if data:
+                yield data
+            if decompressor.eof:
+                pending = decompressor.unused_data
+                decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+            else:
+                pending = b""
+        chunk = next(iterator, None)
+        if chunk is None:
+            break
+        pending = chunk
+    tail = decompressor.flush()
+    if tail:
+        yield tail
+
+
+def iter_json_array(chunks: Iterable[bytes], key: str | None) -> Iterator[Any]:
+    """Yield the elements of the JSON array stored under *key*, one by one.
+
+    Only the element currently being decoded is buffered, so a document
+    whose array holds gigabytes of entries streams in bounded memory. Keys
+    before the array are skipped; anything after it is ignored. With *key*
+    *None* the document itself must be an array. A body that ends before
+    the array is closed raises :class:`json.JSONDecodeError`.
+    """
+    start = re.compile(r'^\s*\[' if key is None else r'"%s"\s*:\s*\[' % re.escape(key))
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    buffer = ""
+    in_array = False
+    for chunk in chunks:
+        buffer += text_decoder.decode(chunk)
+        if not in_array:
+            match = start.search(buffer)
+            if match is None:
+                if key is None and buffer.strip():
+                    break
+                # Keep enough of the tail to match a key split across chunks.
+                buffer = buffer[-(len(key or "") + 64):]
+                continue
+            buffer = buffer[match.end():]
+            in_array = True
+        pos = 0
+        while True:
+            pos = _WHITESPACE.match(buffer, pos).end()
+            if pos >= len(buffer):
+                break
+            if buffer[pos] == "]":
+                return
+            try:
+                item, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                break  # element continues in the next chunk
+            if _ELEMENT_END.match(buffer, end) is None:
+                # A number may go on in the next chunk ("1" + "23", "1." + "5").
+                break
+            yield item
+            pos = end
+        buffer = buffer[pos:]
+    buffer += text_decoder.decode(b"", final=True)
+    if not in_array:
+        raise ValueError(
+            "stream is not a JSON array" if key is None else f"no {key!r} array found in stream"
+        )
+    # The closing bracket never arrived: report it the way ``json.loads`` would.
+    pos = _WHITESPACE.match(buffer).end()
+    if pos == len(buffer):
+        raise json.JSONDecodeError("Expecting value", buffer, pos)
+    _, end = decoder.raw_decode(buffer, pos)
+    raise json.JSONDecodeError("Expecting ',' delimiter", buffer, end)
+
+
+class IterableReader(io.RawIOBase):
+    """Read-only raw stream over an iterable of ``bytes`` chunks.
+
+    Wrap it in :class:`io.BufferedReader` to hand a generator (such as
+    ``Response.iter_bytes()``) to APIs that expect a binary file.
+    """
+
+    def __init__(self, chunks: Iterable[bytes]) -> None:
+        self._chunks = iter(chunks)
+        self._pending = b""
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        while not self._pending:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return 0
+            self._pending = chunk
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+
+class ChecksumMismatchError(ValueError):
+    """Raised when a downloaded body does not match the expected SHA-256."""
+
+    def __init__(self, expected: str, actual: str) -> None:
+        self.expected = expected
+        self.actual = actual
+        super().__init__(f"SHA-256 mismatch: expected {expected}, got {actual}")
+
+
+class DownloadResult(NamedTuple):
+    path: Path | None
+    size: int
+    sha256: str
+    resumed_from: int
+
+
+class PartialDownload:
+    """Destination bookkeeping for the clients' ``download`` methods.
+
+    A path destination is written to ``<name>.part`` and renamed into place
+    only once complete, so an interrupted transfer leaves a partial file to
+    resume from with a ``Range`` request. File objects are written as-is and
+    cannot be resumed.
+    """
+
+    def __init__(self, dest: str | os.PathLike[str] | IO[bytes], *, resume: bool = True) -> None:
+        self._digest = hashlib.sha256()
+        self.offset = 0
+        self.resumed_from = 0
+        if isinstance(dest, (str, os.PathLike)):
+            self.path: Path | None = Path(dest)
+            self._part = self.path.with_name(self.path.name + ".part")
+            if resume and self._part.exists():
+                with open(self._part, "rb") as existing:
+                    for block in iter(lambda: existing.read(1 << 20), b""):
+                        self._digest.update(block)
+                        self.offset += len(block)
+            self._file: IO[bytes] = open(self._part, "ab" if self.offset else "wb")
+            self.resumable = True
+        else:
+            self.path = None
+            self._file = dest
+            self.resumable = False
+
+    def range_headers(self) -> dict[str, str]:
+        """``Range`` header asking only for the bytes not yet written."""
+        return {"Range": f"bytes={self.offset}-"} if self.offset else {}
+
+    def begin(self, status_code: int) -> None:
+        """Prepare for a response body; a full ``200`` restarts from zero."""
+        if status_code == 206:
+            if not self.resumed_from:
+                self.resumed_from = self.offset
+            return
+        if self.offset:
+            self._file.seek(0)
+            self._file.truncate()
+            self._digest = hashlib.sha256()
+            self.offset = 0
+            self.resumed_from = 0
+
+    def write(self, chunk: bytes) -> None:
+        self._file.write(chunk)
+        self._digest.update(chunk)
+        self.offset += len(chunk)
+
+    def finish(self, expected_sha256: str | None = None) -> DownloadResult:
+        """Close the file, verify the checksum and move it into place."""
+        actual = self._digest.hexdigest()
+        if self.path is None:
+            self._file.flush()
+        else:
+            self._file.close()
+        if expected_sha256 is not None and actual != expected_sha256.lower():
+            if self.path is not None:
+                self._part.unlink()  # never resume from corrupt data
+            raise ChecksumMismatchError(expected_sha256, actual)
+        if self.path is not None:
+            os.replace(self._part, self.path)
+        return DownloadResult(self.path, self.offset, actual, self.resumed_from)
+
+    def close(self) -> None:
+        """Release the file, keeping any partial data for a later resume."""
+        if self.path is not None and not self._file.closed:
+            self._file.close()
+
+    def __enter__(self) -> PartialDownload:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+
+class UploadReader:
+    """Binary file-like view over an upload source, reporting progress.
+
+    *source* is a path, a binary file object or any iterable of ``bytes``.
+    Paths and seekable files expose their size (so the upload is sent with a
+    ``Content-Length``) and can be rewound for a retry; an iterable is read
+    exactly once.
+
+    Parameters
+    ----------
+    source:
+        What to upload.
+    on_progress:
+        Called as ``on_progress(bytes_sent, total)`` after each chunk is
+        handed to the HTTP layer; *total* is *None* when unknown.
+    total:
+        Size of an iterable source, if known, for progress reporting.
+    """
+
+    def __init__(
+        self,
+        source: str | os.PathLike[str] | IO[bytes] | Iterable[bytes],
+        *,
+        on_progress: Callable[[int, int | None], None] | None = None,
+        total: int | None = None,
+    ) -> None:
+        self._owned = isinstance(source, (str, os.PathLike))
+        self._chunks: Iterator[bytes] | None = None
+        self._file: IO[bytes] | None = None
+        self._buffer = b""
+        if self._owned:
+            self._file = open(source, "rb")  # type: ignore[arg-type]
+        elif hasattr(source, "read"):
+            self._file = source  # type: ignore[assignment]
+        else:
+            self._chunks = iter(source)  # type: ignore[arg-type]
+        if self._file is not None:
+            self.name = getattr(self._file, "name", "upload")
+            if total is None and self.seekable():
+                # Multipart encoding rewinds the file, so the size is the whole file.
+                position = self._file.tell()
+                total = self._file.seek(0, os.SEEK_END)
+                self._file.seek(position)
+        else:
+            self.name = "upload"
+        self.total = total
+        self.sent = 0
+        self._on_progress = on_progress
+
+    def read(self, size: int = -1) -> bytes:
+        if self._file is not None:
+            data = self._file.read(size)
+        else:
+            data = self._read_chunks(size)
+        if data:
+            self.sent += len(data)
+            if self._on_progress is not None:
+                self._on_progress(self.sent, self.total)
+        return data
+
+    def _read_chunks(self, size: int) -> bytes:
+        assert self._chunks is not None
+        while size < 0 or len(self._buffer) < size:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            self._buffer += chunk
+        if size < 0:
+            data, self._buffer = self._buffer, b""
+        else:
+            data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+    def seekable(self) -> bool:
+        return self._file is not None and self._file.seekable()
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        if not self.seekable():
+            raise io.UnsupportedOperation("upload source is not seekable")
+        assert self._file is not None
+        position = self._file.seek(offset, whence)
+        if whence == os.SEEK_SET and offset == 0:
+            self.sent = 0  # rewound for a retry
+        return position
+
+    def tell(self) -> int:
+        if not self.seekable():
+            raise io.UnsupportedOperation("upload source is not seekable")
+        assert self._file is not None
+        return self._file.tell()
+
+    def close(self) -> None:
+        if self._owned and self._file is not None:
+            self._file.close()
+
+    def __enter__(self) -> UploadReader:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
@@ -1,15 +1,19 @@
 """Shared fixtures for integration tests.
 
-All tests hit the real eBay sandbox API — no mocks.
+Integration tests hit the real eBay sandbox API — no mocks.
 Requires sandbox credentials configured for ``ldraney-ebay-oauth``.
+The few offline tests cover responses the sandbox cannot be made to
+return, such as non-JSON error bodies, through ``offline_ebay``.
 """
 
 import os
 
+import httpx
 import pytest
+import pytest_asyncio
 from ebay_oauth import EbayOAuthClient
 
-from ebay_sdk import EbayClient
+from ebay_sdk import AsyncEbayClient, EbayClient
 
 
 @pytest.fixture(scope="session")
@@ -40,3 +44,41 @@ def ebay(oauth_client: EbayOAuthClient) -> EbayClient:
     client = EbayClient(oauth_client, sandbox=True)
     yield client
     client.close()
+
+
+@pytest_asyncio.fixture
+async def async_ebay(oauth_client: EbayOAuthClient) -> AsyncEbayClient:
+    """Return a real AsyncEbayClient pointed at the sandbox."""
+    client = AsyncEbayClient(oauth_client, sandbox=True)
+    yield client
+    await client.aclose()
+
+
+class _StaticToken:
+    """Stands in for ``EbayOAuthClient`` where eBay is never reached."""
+
+    _token_expiry = None
+
+    def get_access_token(self) -> str:
+        return "offline"
+
+
+@pytest.fixture
+def offline_ebay():
+    """Return a factory for an EbayClient whose responses come from *handler*.
+
+    *handler* takes an ``httpx.Request`` and returns an ``httpx.Response``.
+    """
+    clients = []
+
+    def make(handler) -> EbayClient:
+        client = EbayClient(_StaticToken(), sandbox=True)
+        client._http = httpx.Client(
+            base_url=client._base_url, transport=httpx.MockTransport(handler)
+        )
+        clients.append(client)
+        return client
+
+    yield make
+    for client in clients:
+        client.close()
@@ -0,0 +1,69 @@
+"""Integration tests for AsyncEbayClient.
+
+Exercises the shared sub-API classes over ``httpx.AsyncClient``.
+"""
+
+import asyncio
+
+import pytest
+
+from ebay_sdk import AsyncEbayClient
+from ebay_sdk.client import EbayApiError
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+class TestAsyncClient:
+    async def test_get_default_category_tree_id(self, async_ebay: AsyncEbayClient):
+        result = await async_ebay.commerce_taxonomy.get_default_category_tree_id(
+            "EBAY_US"
+        )
+        assert "categoryTreeId" in result
+
+    async def test_concurrent_requests(self, async_ebay: AsyncEbayClient):
+        search, orders = await asyncio.gather(
+            async_ebay.buy_browse.search(q="laptop", limit=3),
+            async_ebay.sell_fulfillment.get_orders(limit=3),
+        )
+        assert isinstance(search, dict)
+        assert isinstance(orders, dict)
+
+    async def test_error_raises_ebay_api_error(self, async_ebay: AsyncEbayClient):
+        with pytest.raises(EbayApiError):
+            await async_ebay.sell_inventory.get_inventory_item(
+                "SDK-TEST-DOES-NOT-EXIST"
+            )
+
+    async def test_upload_file_from_disk(self, async_ebay: AsyncEbayClient, tmp_path):
+        tasks = await async_ebay.sell_feed.get_tasks(limit=10)
+        target = next(
+            (t for t in tasks.get("tasks", []) if t.get("status") == "CREATED"), None
+        )
+        if target is None:
+            pytest.skip("No task available for file upload in sandbox")
+        feed = tmp_path / "inventory.xml"
+        feed.write_bytes(b"<?xml version='1.0' encoding='UTF-8'?><BulkDataExchangeRequests/>")
+        progress = []
+        try:
+            await async_ebay.sell_feed.upload_file_from(
+                target["taskId"],
+                feed,
+                on_progress=lambda sent, total: progress.append((sent, total)),
+            )
+        except EbayApiError as exc:
+            if exc.status_code in (400, 403, 404, 409):
+                pytest.skip(f"upload_file not available: {exc.status_code}")
+            raise
+        # The file is only read once the returned coroutine is awaited.
+        assert progress[-1] == (feed.stat().st_size, feed.stat().st_size)
+
+    async def test_bulk_get_inventory_items_chunks_past_limit(
+        self, async_ebay: AsyncEbayClient
+    ):
+        skus = [f"SDK-TEST-INV-ASYNC-{i:03d}" for i in range(30)]
+        result = await async_ebay.sell_inventory.bulk_get_inventory_items(
+            skus, max_workers=2
+        )
+        answered = [r["sku"] for r in result.responses]
+        answered += [r["sku"] for e in result.chunk_errors for r in e.requests]
+        assert sorted(answered) == skus
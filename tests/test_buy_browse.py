@@ -3,6 +3,8 @@
 Spec: https://developer.ebay.com/api-docs/master/buy/browse/openapi/3/buy_browse_v1_oas3.json
 """
 
+from itertools import islice
+
 import pytest
 
 from ebay_sdk import EbayClient
@@ -15,6 +17,11 @@ class TestSearch:
         result = ebay.buy_browse.search(q="laptop", limit=3)
         assert "itemSummaries" in result or "total" in result
 
+    def test_iter_search_crosses_pages(self, ebay: EbayClient):
+        items = list(islice(ebay.buy_browse.iter_search(q="laptop", page_size=3), 7))
+        assert all("itemId" in item for item in items)
+        assert len({item["itemId"] for item in items}) == len(items)
+
     def test_search_by_category(self, ebay: EbayClient):
         # 177 = Cell Phones & Smartphones
         result = ebay.buy_browse.search(category_ids="177", limit=3)
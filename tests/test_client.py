@@ -0,0 +1,150 @@
+"""Integration tests for EbayClient transport behaviour.
+
+Token handling, connection tuning, retries and rate limiting, exercised
+against the sandbox through a lightweight Taxonomy call. Non-JSON error
+bodies are checked offline.
+"""
+
+import time
+
+import httpx
+import pytest
+from ebay_oauth import EbayOAuthClient
+
+from ebay_sdk import (
+    EbayClient,
+    HttpConfig,
+    RateLimit,
+    RateLimiter,
+    RetryPolicy,
+    SqliteRateLimiter,
+)
+from ebay_sdk.auth import TokenCache
+from ebay_sdk.client import EbayApiError
+
+
+@pytest.mark.integration
+class TestTokenCache:
+    def test_get_caches_header(self, oauth_client: EbayOAuthClient):
+        cache = TokenCache(oauth_client)
+        first = cache.get()
+        assert first.startswith("Bearer ")
+        assert cache.peek() == first
+        assert cache.get() == first
+
+    def test_invalidate_ignores_other_header(self, oauth_client: EbayOAuthClient):
+        cache = TokenCache(oauth_client)
+        first = cache.get()
+        cache.invalidate("Bearer some-older-token")
+        assert cache.peek() == first
+
+    def test_revoked_token_is_replaced_on_401(self, oauth_client: EbayOAuthClient):
+        with EbayClient(oauth_client, sandbox=True) as ebay:
+            ebay.commerce_taxonomy.get_default_category_tree_id("EBAY_US")
+            # Simulate eBay revoking the token before its tracked expiry.
+            ebay._token._authorization = "Bearer revoked"
+            result = ebay.commerce_taxonomy.get_default_category_tree_id("EBAY_US")
+            assert "categoryTreeId" in result
+            assert ebay._token.peek() not in (None, "Bearer revoked")
+
+
+@pytest.mark.integration
+class TestHttpConfig:
+    def test_round_trip_with_tuned_pool(self, oauth_client: EbayOAuthClient):
+        config = HttpConfig(
+            max_connections=4,
+            max_keepalive_connections=2,
+            keepalive_expiry=30.0,
+            connect_timeout=10.0,
+            read_timeout=20.0,
+        )
+        with EbayClient(oauth_client, sandbox=True, timeout=15.0, http_config=config) as ebay:
+            result = ebay.commerce_taxonomy.get_default_category_tree_id("EBAY_US")
+            assert "categoryTreeId" in result
+            timeout = ebay._http.timeout
+            assert (timeout.connect, timeout.read, timeout.write) == (10.0, 20.0, 15.0)
+
+
+@pytest.mark.integration
+class TestRetryPolicy:
+    def test_round_trip_with_retries(self, oauth_client: EbayOAuthClient):
+        policy = RetryPolicy(max_attempts=3, backoff_factor=0.1)
+        with EbayClient(oauth_client, sandbox=True, retry=policy) as ebay:
+            result = ebay.commerce_taxonomy.get_default_category_tree_id("EBAY_US")
+            assert "categoryTreeId" in result
+
+    def test_client_error_is_not_retried(self, oauth_client: EbayOAuthClient):
+        policy = RetryPolicy(max_attempts=5, backoff_factor=5.0, jitter=False)
+        with EbayClient(oauth_client, sandbox=True, retry=policy) as ebay:
+            started = time.monotonic()
+            with pytest.raises(EbayApiError) as excinfo:
+                ebay.sell_inventory.get_inventory_item("SDK-TEST-DOES-NOT-EXIST")
+            assert excinfo.value.status_code not in policy.retry_statuses
+            # A retry would have slept at least backoff_factor seconds.
+            assert time.monotonic() - started < policy.backoff_factor
+
+    def test_post_only_resent_when_safe(self):
+        policy = RetryPolicy()
+        assert policy.should_retry_status("GET", 503, 1)
+        assert not policy.should_retry_status("POST", 503, 1)
+        assert policy.should_retry_status("POST", 429, 1)
+        assert not policy.should_retry_status("GET", 503, policy.max_attempts)
+
+    def test_retries_can_be_disabled(self, oauth_client: EbayOAuthClient):
+        with EbayClient(oauth_client, sandbox=True, retry=None) as ebay:
+            assert ebay._retry.max_attempts == 1
+            result = ebay.commerce_taxonomy.get_default_category_tree_id("EBAY_US")
+            assert "categoryTreeId" in result
+
+
+@pytest.mark.integration
+class TestRateLimiter:
+    def test_calls_are_spaced_by_rate(self, oauth_client: EbayOAuthClient):
+        limiter = RateLimiter({"/commerce/taxonomy/v1": RateLimit(rate=4, burst=1)})
+        with EbayClient(oauth_client, sandbox=True, rate_limiter=limiter) as ebay:
+            started = time.monotonic()
+            for _ in range(3):
+                result = ebay.commerce_taxonomy.get_default_category_tree_id("EBAY_US")
+                assert "categoryTreeId" in result
+            # Burst of one, then a token every 0.25 s.
+            assert time.monotonic() - started >= 0.45
+
+    def test_sqlite_limiter_shares_buckets(self, oauth_client: EbayOAuthClient, tmp_path):
+        limits = {"/commerce/taxonomy/v1": RateLimit(rate=1, burst=2)}
+        first = SqliteRateLimiter(tmp_path / "quota.db", limits)
+        with EbayClient(oauth_client, sandbox=True, rate_limiter=first) as ebay:
+            ebay.commerce_taxonomy.get_default_category_tree_id("EBAY_US")
+            ebay.commerce_taxonomy.get_default_category_tree_id("EBAY_US")
+        # Another limiter on the same file sees the burst already spent.
+        second = SqliteRateLimiter(tmp_path / "quota.db", limits)
+        assert second.reserve("/commerce/taxonomy/v1/get_default_category_tree_id") > 0
+
+
+class TestErrorBodies:
+    def test_non_json_error_body_raises_api_error(self, offline_ebay):
+        ebay = offline_ebay(
+            lambda request: httpx.Response(502, text="<html>Bad Gateway</html>")
+        )
+        with pytest.raises(EbayApiError) as excinfo:
+            ebay.get("/commerce/taxonomy/v1/get_default_category_tree_id")
+        assert excinfo.value.status_code == 502
+        assert excinfo.value.detail == "<html>Bad Gateway</html>"
+
+    def test_416_with_html_body_completes_resume(self, offline_ebay, tmp_path):
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(
+                416,
+                text="<html>Range Not Satisfiable</html>",
+                headers={"Content-Type": "text/html"},
+            )
+
+        dest = tmp_path / "result.zip"
+        (tmp_path / "result.zip.part").write_bytes(b"complete")
+        ebay = offline_ebay(handler)
+        result = ebay.download("/sell/feed/v1/task/t1/download_result_file", dest)
+        assert requests[0].headers["Range"] == "bytes=8-"
+        assert dest.read_bytes() == b"complete"
+        assert result.size == 8
@@ -4,9 +4,15 @@ Spec: https://developer.ebay.com/api-docs/master/commerce/taxonomy/openapi/3/com
 """
 
 import pytest
+from ebay_oauth import EbayOAuthClient
 
-from ebay_sdk import EbayClient
+from ebay_sdk import EbayClient, ResponseCache
 from ebay_sdk.client import EbayApiError
+from ebay_sdk.commerce.aspects import AspectIndex
+from ebay_sdk.commerce.category_suggest import CategorySuggester
+from ebay_sdk.commerce.category_tree import CategoryTree
+from ebay_sdk.commerce.compatibility import CompatibilityResolver
+from ebay_sdk.commerce.taxonomy_sync import TaxonomySync
 
 
 @pytest.mark.integration
@@ -35,6 +41,66 @@ class TestCategoryTree:
         result = ebay.commerce_taxonomy.get_category_suggestions(tree_id, "laptop")
         assert "categorySuggestions" in result
 
+    def test_cached_category_tree_reuses_response(
+        self, oauth_client: EbayOAuthClient
+    ):
+        with EbayClient(oauth_client, sandbox=True, cache=ResponseCache()) as ebay:
+            tree_id = ebay.commerce_taxonomy.get_default_category_tree_id("EBAY_US")[
+                "categoryTreeId"
+            ]
+            first = ebay.commerce_taxonomy.get_category_tree(tree_id)
+            second = ebay.commerce_taxonomy.get_category_tree(tree_id)
+            assert second is first
+
+    def test_cache_leaves_tree_version_uncached(self, oauth_client: EbayOAuthClient):
+        with EbayClient(oauth_client, sandbox=True, cache=ResponseCache()) as ebay:
+            first = ebay.commerce_taxonomy.get_default_category_tree_id("EBAY_US")
+            second = ebay.commerce_taxonomy.get_default_category_tree_id("EBAY_US")
+            # Fetched again each time, so TaxonomySync sees version changes.
+            assert second is not first
+            assert second["categoryTreeId"] == first["categoryTreeId"]
+
+    def test_category_tree_index_round_trip(self, ebay: EbayClient, tmp_path):
+        tree_id_resp = ebay.commerce_taxonomy.get_default_category_tree_id("EBAY_US")
+        tree_id = tree_id_resp["categoryTreeId"]
+        tree = CategoryTree.from_response(
+            ebay.commerce_taxonomy.get_category_tree(tree_id)
+        )
+        leaf = next(tree.leaves())
+        assert tree.path(leaf.category_id).endswith(leaf.name)
+        assert all(not a.leaf for a in tree.ancestors(leaf.category_id))
+
+        tree.save(tmp_path / "categories.db")
+        loaded = CategoryTree.load(tmp_path / "categories.db")
+        assert loaded.version == tree.version
+        assert len(loaded) == len(tree)
+        assert loaded.path(leaf.category_id) == tree.path(leaf.category_id)
+
+    def test_offline_category_suggestions(self, ebay: EbayClient):
+        tree_id_resp = ebay.commerce_taxonomy.get_default_category_tree_id("EBAY_US")
+        tree_id = tree_id_resp["categoryTreeId"]
+        tree = CategoryTree.from_response(
+            ebay.commerce_taxonomy.get_category_tree(tree_id)
+        )
+        suggester = CategorySuggester(tree, taxonomy=ebay.commerce_taxonomy)
+        local = suggester.suggest_local("cell phones smartphones")
+        assert local and local[0].source == "local"
+        assert tree[local[0].category_id].leaf
+        assert suggester.suggest("laptop")
+
+    def test_incremental_taxonomy_sync(self, ebay: EbayClient, tmp_path):
+        sync = TaxonomySync(ebay.commerce_taxonomy, tmp_path / "categories.db")
+        first = sync.sync()
+        assert first.full
+        assert len(sync.tree) > 1
+
+        second = sync.sync()
+        assert not second.changed and not second.full and second.refreshed == []
+
+        reopened = TaxonomySync(ebay.commerce_taxonomy, tmp_path / "categories.db")
+        assert reopened.tree.version == first.version
+        assert reopened.remap("no-such-category") == "no-such-category"
+
     def test_get_expired_categories(self, ebay: EbayClient):
         tree_id_resp = ebay.commerce_taxonomy.get_default_category_tree_id("EBAY_US")
         tree_id = tree_id_resp["categoryTreeId"]
@@ -62,6 +128,25 @@ class TestCategoryTree:
                 )
             raise
 
+    def test_stream_item_aspects_into_index(self, ebay: EbayClient, tmp_path):
+        tree_id_resp = ebay.commerce_taxonomy.get_default_category_tree_id("EBAY_US")
+        tree_id = tree_id_resp["categoryTreeId"]
+        try:
+            index = AspectIndex.build(
+                tmp_path / "aspects.db",
+                ebay.commerce_taxonomy.iter_item_aspects(tree_id),
+                tree_id=tree_id,
+            )
+        except EbayApiError as exc:
+            if exc.status_code in (404, 500):
+                pytest.skip(
+                    f"fetch_item_aspects not available: {exc.status_code}"
+                )
+            raise
+        assert len(index) > 0
+        if "9355" in index:
+            assert isinstance(index.validate("9355", {}), list)
+
 
 @pytest.mark.integration
 class TestAspects:
@@ -130,3 +215,28 @@ class TestCompatibility:
                     f"get_compatibility_property_values with filter failed: {exc.status_code}"
                 )
             raise
+
+    def test_compatibility_resolver_memoises_lookups(self, ebay: EbayClient, tmp_path):
+        tree_id_resp = ebay.commerce_taxonomy.get_default_category_tree_id("EBAY_US")
+        tree_id = tree_id_resp["categoryTreeId"]
+        resolver = CompatibilityResolver(
+            ebay.commerce_taxonomy, tree_id, "6000", properties=["Year", "Make"]
+        )
+        try:
+            years = resolver.values("Year")
+        except EbayApiError as exc:
+            if exc.status_code in (404,):
+                pytest.skip(
+                    f"get_compatibility_property_values failed: {exc.status_code}"
+                )
+            raise
+        assert resolver.values("Year") == years
+        assert resolver.calls == 1
+        if years:
+            makes = resolver.values("Make", {"Year": years[0]})
+            resolver.save(tmp_path / "fitment.json")
+            loaded = CompatibilityResolver.load(
+                ebay.commerce_taxonomy, tmp_path / "fitment.json"
+            )
+            assert loaded.values("Make", {"Year": years[0]}) == makes
+            assert loaded.calls == 0
@@ -1,12 +1,22 @@
 """Integration tests for Sell Feed API.
 
 Spec: https://developer.ebay.com/api-docs/master/sell/feed/openapi/3/sell_feed_v1_oas3.json
+
+Result file parsing is also checked offline against small in-memory files.
 """
 
+import gzip
+import io
+import json
+import zipfile
+
 import pytest
 
 from ebay_sdk import EbayClient
 from ebay_sdk.client import EbayApiError
+from ebay_sdk.sell.feed import iter_feed_records
+from ebay_sdk.sell.feed_jobs import FeedJob, FeedOrchestrator
+from ebay_sdk.sell.feed_schedules import ScheduleResultFetcher
 
 
 @pytest.mark.integration
@@ -57,6 +67,31 @@ class TestTasks:
                 pytest.skip(f"upload_file not available: {exc.status_code}")
             raise
 
+    def test_upload_file_from_disk(self, ebay: EbayClient, tmp_path):
+        tasks = ebay.sell_feed.get_tasks(limit=10)
+        items = tasks.get("tasks", [])
+        target = None
+        for t in items:
+            if t.get("status") == "CREATED":
+                target = t
+                break
+        if target is None:
+            pytest.skip("No task available for file upload in sandbox")
+        feed = tmp_path / "inventory.xml"
+        feed.write_bytes(b"<?xml version='1.0' encoding='UTF-8'?><BulkDataExchangeRequests/>")
+        progress = []
+        try:
+            ebay.sell_feed.upload_file_from(
+                target["taskId"],
+                feed,
+                on_progress=lambda sent, total: progress.append((sent, total)),
+            )
+        except EbayApiError as exc:
+            if exc.status_code in (400, 403, 404, 409):
+                pytest.skip(f"upload_file not available: {exc.status_code}")
+            raise
+        assert progress[-1] == (feed.stat().st_size, feed.stat().st_size)
+
     def test_download_result_file(self, ebay: EbayClient):
         tasks = ebay.sell_feed.get_tasks(limit=10)
         items = tasks.get("tasks", [])
@@ -69,12 +104,59 @@ class TestTasks:
             pytest.skip("No completed task available for download in sandbox")
         try:
             result = ebay.sell_feed.download_result_file(target["taskId"])
-            assert result is not None
+            assert isinstance(result, bytes)
         except EbayApiError as exc:
             if exc.status_code in (403, 404):
                 pytest.skip(f"download_result_file not available: {exc.status_code}")
             raise
 
+    def test_stream_result_file_to_disk(self, ebay: EbayClient, tmp_path):
+        tasks = ebay.sell_feed.get_tasks(limit=10)
+        items = tasks.get("tasks", [])
+        target = None
+        for t in items:
+            if t.get("status") == "COMPLETED":
+                target = t
+                break
+        if target is None:
+            pytest.skip("No completed task available for download in sandbox")
+        try:
+            result = ebay.sell_feed.download_result_file_to(
+                target["taskId"], tmp_path / "result.zip"
+            )
+        except EbayApiError as exc:
+            if exc.status_code in (403, 404):
+                pytest.skip(f"download_result_file not available: {exc.status_code}")
+            raise
+        assert result.size == (tmp_path / "result.zip").stat().st_size
+        assert not (tmp_path / "result.zip.part").exists()
+        again = ebay.sell_feed.download_result_file_to(
+            target["taskId"], tmp_path / "again.zip", sha256=result.sha256
+        )
+        assert again.sha256 == result.sha256
+
+    def test_iter_feed_records_from_result_file(self, ebay: EbayClient):
+        tasks = ebay.sell_feed.get_tasks(limit=10)
+        items = tasks.get("tasks", [])
+        target = None
+        for t in items:
+            if t.get("status") == "COMPLETED":
+                target = t
+                break
+        if target is None:
+            pytest.skip("No completed task available for download in sandbox")
+        try:
+            records = list(
+                iter_feed_records(ebay.sell_feed.iter_result_file(target["taskId"]))
+            )
+        except EbayApiError as exc:
+            if exc.status_code in (403, 404):
+                pytest.skip(f"download_result_file not available: {exc.status_code}")
+            raise
+        # Parsing the stream must match parsing the whole file from memory.
+        content = ebay.sell_feed.download_result_file(target["taskId"])
+        assert records == list(iter_feed_records(io.BytesIO(content)))
+
 
 @pytest.mark.integration
 class TestOrderTasks:
@@ -111,6 +193,33 @@ class TestOrderTasks:
         assert isinstance(result, dict)
         assert result["taskId"] == task_id
 
+    def test_orchestrated_order_report(self, ebay: EbayClient):
+        job = FeedJob(
+            "LMS_ORDER_REPORT",
+            kind="order_task",
+            extra={
+                "filterCriteria": {
+                    "creationDateRange": {"from": "2024-01-01T00:00:00.000Z"},
+                    "orderStatus": "ACTIVE",
+                }
+            },
+        )
+        received = []
+        orchestrator = FeedOrchestrator(ebay.sell_feed, poll_initial=1.0, timeout=120.0)
+        [result] = orchestrator.run(
+            [job], on_result=lambda r, chunks: received.append(b"".join(chunks))
+        )
+        if isinstance(result.error, EbayApiError) and result.error.status_code in (
+            403, 409,
+        ):
+            pytest.skip(f"create_order_task not available: {result.error.status_code}")
+        if isinstance(result.error, TimeoutError):
+            pytest.skip("order task did not finish in sandbox")
+        assert result.error is None
+        assert result.task_id
+        if result.status == "COMPLETED":
+            assert received
+
 
 @pytest.mark.integration
 class TestInventoryTasks:
@@ -175,6 +284,74 @@ class TestCustomerServiceMetricTasks:
         assert result["taskId"] == task_id
 
 
+
+def _zip(members: dict[str, bytes]) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        for name, data in members.items():
+            archive.writestr(name, data)
+    return buffer.getvalue()
+
+
+class TestIterFeedRecords:
+    """Offline: result file parsing is pure and needs no sandbox."""
+
+    CSV = b"sku,quantity,title\r\nA-1,3,\"Mug, blue\"\r\nB-2,0,Plate\r\n"
+    XML = (
+        b'<?xml version="1.0" encoding="UTF-8"?>'
+        b'<BulkDataExchangeResponses xmlns="urn:ebay:apis:eBLBaseComponents">'
+        b'<ActiveInventoryReport><SKUDetails>'
+        b'<SKU>A-1</SKU><Price currencyID="USD">9.99</Price>'
+        b"<Variation><SKU>A-1-S</SKU></Variation><Variation><SKU>A-1-L</SKU></Variation>"
+        b"</SKUDetails><SKUDetails><SKU>B-2</SKU></SKUDetails>"
+        b"</ActiveInventoryReport></BulkDataExchangeResponses>"
+    )
+
+    def test_csv_rows_as_dicts(self):
+        records = list(iter_feed_records(io.BytesIO(self.CSV)))
+        assert records == [
+            {"sku": "A-1", "quantity": "3", "title": "Mug, blue"},
+            {"sku": "B-2", "quantity": "0", "title": "Plate"},
+        ]
+
+    def test_tsv_with_bom_as_tuples(self):
+        data = b"\xef\xbb\xbfsku\tquantity\nA-1\t3\nB-2\t0\n"
+        records = list(iter_feed_records(io.BytesIO(data), fmt="csv", tuples=True))
+        assert records == [("A-1", "3"), ("B-2", "0")]
+
+    def test_xml_namespaces_attributes_and_repeated_children(self):
+        records = list(iter_feed_records(io.BytesIO(self.XML), record_tag="SKUDetails"))
+        assert records == [
+            {
+                "SKU": "A-1",
+                "Price": {"@currencyID": "USD", "#text": "9.99"},
+                "Variation": [{"SKU": "A-1-S"}, {"SKU": "A-1-L"}],
+            },
+            {"SKU": "B-2"},
+        ]
+
+    def test_xml_default_records_are_root_children(self):
+        records = list(iter_feed_records(io.BytesIO(self.XML)))
+        assert [len(r["SKUDetails"]) for r in records] == [2]
+
+    def test_zip_from_non_seekable_chunks(self):
+        data = _zip({"report.csv": self.CSV, "report.xml": self.XML})
+        chunks = (data[i:i + 100] for i in range(0, len(data), 100))
+        records = list(iter_feed_records(chunks, record_tag="SKUDetails"))
+        assert [r.get("sku") or r.get("SKU") for r in records] == ["A-1", "B-2", "A-1", "B-2"]
+
+    def test_gzip_named_by_inner_suffix(self, tmp_path):
+        path = tmp_path / "report.csv.gz"
+        path.write_bytes(gzip.compress(self.CSV))
+        records = list(iter_feed_records(path, tuples=True))
+        assert records == [("A-1", "3", "Mug, blue"), ("B-2", "0", "Plate")]
+
+    def test_gzip_json_sniffed_from_content(self):
+        data = gzip.compress(json.dumps({"orders": [{"orderId": "1"}, {"orderId": "2"}]}).encode())
+        records = list(iter_feed_records(io.BytesIO(data), json_key="orders"))
+        assert records == [{"orderId": "1"}, {"orderId": "2"}]
+
+
 @pytest.mark.integration
 class TestSchedules:
     def test_get_schedules(self, ebay: EbayClient):
@@ -269,7 +446,7 @@ class TestSchedules:
         schedule_id = items[0]["scheduleId"]
         try:
             result = ebay.sell_feed.get_latest_result_file(schedule_id)
-            assert result is not None
+            assert isinstance(result, bytes)
         except EbayApiError as exc:
             if exc.status_code in (403, 404):
                 pytest.skip(
@@ -277,6 +454,49 @@ class TestSchedules:
                 )
             raise
 
+    def test_schedule_result_fetcher_dedupes(self, ebay: EbayClient, tmp_path):
+        schedules = ebay.sell_feed.get_schedules("LMS_ORDER_REPORT", limit=5)
+        items = schedules.get("schedules", []) if schedules else []
+        if not items:
+            pytest.skip("No schedules available in sandbox")
+        schedule_ids = [s["scheduleId"] for s in items]
+        fetcher = ScheduleResultFetcher(
+            ebay.sell_feed, tmp_path / "state.json", tmp_path / "downloads"
+        )
+        try:
+            first = fetcher.poll(schedule_ids)
+        except EbayApiError as exc:
+            if exc.status_code in (403, 404):
+                pytest.skip(f"schedule results not available: {exc.status_code}")
+            raise
+        for result in first:
+            assert result.path.exists()
+        reopened = ScheduleResultFetcher(
+            ebay.sell_feed, tmp_path / "state.json", tmp_path / "downloads"
+        )
+        assert reopened.poll(schedule_ids) == []
+
+    def test_schedule_result_fetcher_skips_older_tasks(self, ebay: EbayClient, tmp_path):
+        schedules = ebay.sell_feed.get_schedules("LMS_ORDER_REPORT", limit=5)
+        items = schedules.get("schedules", []) if schedules else []
+        if not items:
+            pytest.skip("No schedules available in sandbox")
+        schedule_ids = [s["scheduleId"] for s in items]
+        state = tmp_path / "state.json"
+        # A result delivered "later" than any task eBay can list.
+        state.write_text(json.dumps({
+            schedule_id: {"taskId": "delivered", "creationDate": "9999-01-01T00:00:00.000Z"}
+            for schedule_id in schedule_ids
+        }))
+        fetcher = ScheduleResultFetcher(ebay.sell_feed, state, tmp_path / "downloads")
+        try:
+            assert fetcher.poll(schedule_ids) == []
+        except EbayApiError as exc:
+            if exc.status_code in (403, 404):
+                pytest.skip(f"schedule results not available: {exc.status_code}")
+            raise
+        assert not any((tmp_path / "downloads").iterdir())
+
     def test_get_schedule_templates(self, ebay: EbayClient):
         result = ebay.sell_feed.get_schedule_templates("LMS_ORDER_REPORT")
         assert isinstance(result, dict)
@@ -3,6 +3,8 @@
 Spec: https://developer.ebay.com/api-docs/master/sell/finances/openapi/3/sell_finances_v1_oas3.json
 """
 
+from itertools import islice
+
 import pytest
 
 from ebay_sdk import EbayClient
@@ -60,6 +62,12 @@ class TestTransactions:
         result = ebay.sell_finances.get_transactions(limit=5)
         assert isinstance(result, dict)
 
+    def test_iter_transactions(self, ebay: EbayClient):
+        transactions = list(
+            islice(ebay.sell_finances.iter_transactions(page_size=2), 5)
+        )
+        assert all(isinstance(t, dict) for t in transactions)
+
     def test_get_transactions_with_sort(self, ebay: EbayClient):
         try:
             result = ebay.sell_finances.get_transactions(
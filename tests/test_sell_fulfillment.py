@@ -1,12 +1,22 @@
 """Integration tests for Sell Fulfillment API.
 
 Spec: https://developer.ebay.com/api-docs/master/sell/fulfillment/openapi/3/sell_fulfillment_v1_oas3.json
+
+Evidence download errors with non-JSON bodies are checked offline.
 """
 
+from datetime import timedelta
+from itertools import islice
+
+import httpx
 import pytest
 
 from ebay_sdk import EbayClient
 from ebay_sdk.client import EbayApiError
+from ebay_sdk.sell.disputes import DisputeInbox, download_evidence
+from ebay_sdk.sell.order_hydrator import OrderHydrator
+from ebay_sdk.sell.order_sync import OrderSync
+from ebay_sdk.sell.shipping import FulfillmentSubmitter, Shipment
 
 
 @pytest.mark.integration
@@ -16,6 +26,35 @@ class TestOrders:
         assert isinstance(result, dict)
         assert "orders" in result or "total" in result
 
+    def test_iter_orders(self, ebay: EbayClient):
+        orders = list(islice(ebay.sell_fulfillment.iter_orders(page_size=2), 5))
+        assert all("orderId" in order for order in orders)
+
+    def test_iter_orders_prefetch_matches_sequential(self, ebay: EbayClient):
+        sequential = [
+            o["orderId"]
+            for o in islice(ebay.sell_fulfillment.iter_orders(page_size=2), 6)
+        ]
+        prefetched = [
+            o["orderId"]
+            for o in islice(
+                ebay.sell_fulfillment.iter_orders(page_size=2, prefetch=3), 6
+            )
+        ]
+        assert prefetched == sequential
+
+    def test_order_sync_emits_each_change_once(self, ebay: EbayClient, tmp_path):
+        sync = OrderSync(
+            ebay.sell_fulfillment, tmp_path / "sync.json", initial_lookback=timedelta(days=90)
+        )
+        first = sync.sync()
+        assert all("orderId" in order for order in first)
+        assert sync.filter().startswith("lastmodifieddate:[")
+        # A fresh instance resumes from the saved high-water mark.
+        resumed = OrderSync(ebay.sell_fulfillment, tmp_path / "sync.json")
+        assert resumed.high_water_mark == sync.high_water_mark
+        assert resumed.sync() == []
+
     def test_get_order(self, ebay: EbayClient):
         orders = ebay.sell_fulfillment.get_orders(limit=1)
         items = orders.get("orders", [])
@@ -26,6 +65,19 @@ class TestOrders:
         assert isinstance(result, dict)
         assert result["orderId"] == order_id
 
+    def test_order_hydrator_batches_lookups(self, ebay: EbayClient):
+        orders = ebay.sell_fulfillment.get_orders(limit=5)
+        order_ids = [order["orderId"] for order in orders.get("orders", [])]
+        if not order_ids:
+            pytest.skip("No orders available in sandbox")
+        with OrderHydrator(ebay.sell_fulfillment) as hydrator:
+            hydrated = hydrator.get_orders(order_ids)
+            assert [order["orderId"] for order in hydrated] == order_ids
+            assert hydrator.calls == 1
+            with pytest.raises(EbayApiError) as excinfo:
+                hydrator.get_order("00-00000-00000")
+        assert excinfo.value.status_code in (400, 404)
+
     def test_issue_refund(self, ebay: EbayClient):
         orders = ebay.sell_fulfillment.get_orders(limit=1)
         items = orders.get("orders", [])
@@ -130,6 +182,50 @@ class TestShippingFulfillment:
                 raise
         pytest.skip("No orders with line items found in sandbox")
 
+    def test_fulfillment_submitter_skips_existing(self, ebay: EbayClient):
+        orders = ebay.sell_fulfillment.get_orders(limit=5)
+        items = [o for o in orders.get("orders", []) if o.get("lineItems")]
+        if not items:
+            pytest.skip("No orders with line items found in sandbox")
+        shipments = [
+            Shipment(
+                order["orderId"],
+                [{"lineItemId": order["lineItems"][0]["lineItemId"], "quantity": 1}],
+                "USPS",
+                "SDK-TEST-BULK-001",
+                "2024-01-15T00:00:00.000Z",
+            )
+            for order in items
+        ]
+        submitter = FulfillmentSubmitter(ebay.sell_fulfillment, max_workers=4)
+        first = submitter.submit(shipments)
+        assert [o.shipment for o in first] == shipments
+        if not any(o.status == "created" for o in first):
+            pytest.skip("create_shipping_fulfillment not available in sandbox")
+        # A fresh submitter has no cache, so the skip must come from the
+        # order's fulfillments as returned by get_shipping_fulfillments.
+        again = FulfillmentSubmitter(ebay.sell_fulfillment, max_workers=4).submit(shipments)
+        assert all(
+            o.status == "skipped" for o, prev in zip(again, first) if prev.status == "created"
+        )
+
+    def test_fulfillment_submitter_sends_split_packages(self, ebay: EbayClient):
+        orders = ebay.sell_fulfillment.get_orders(limit=5)
+        items = [o for o in orders.get("orders", []) if o.get("lineItems")]
+        if not items:
+            pytest.skip("No orders with line items found in sandbox")
+        order = items[0]
+        line_items = [{"lineItemId": order["lineItems"][0]["lineItemId"], "quantity": 1}]
+        shipments = [
+            Shipment(order["orderId"], line_items, "USPS", tracking, "2024-01-15T00:00:00.000Z")
+            for tracking in ("SDK-TEST-SPLIT-A", "SDK-TEST-SPLIT-B")
+        ]
+        outcomes = FulfillmentSubmitter(ebay.sell_fulfillment).submit(shipments)
+        if outcomes[0].status != "created":
+            pytest.skip("create_shipping_fulfillment not available in sandbox")
+        # One line item in two packages: the second is not a duplicate.
+        assert outcomes[1].status != "skipped"
+
 
 @pytest.mark.integration
 class TestPaymentDisputes:
@@ -137,6 +233,28 @@ class TestPaymentDisputes:
         result = ebay.sell_fulfillment.get_payment_disputes(limit=5)
         assert isinstance(result, dict)
 
+    def test_iter_payment_disputes(self, ebay: EbayClient):
+        disputes = list(
+            islice(ebay.sell_fulfillment.iter_payment_disputes(page_size=2), 5)
+        )
+        assert all("paymentDisputeId" in dispute for dispute in disputes)
+
+    def test_dispute_inbox_hydrates_only_changes(self, ebay: EbayClient):
+        inbox = DisputeInbox(ebay.sell_fulfillment, max_workers=4)
+        try:
+            first = inbox.refresh()
+        except EbayApiError as exc:
+            if exc.status_code in (403, 404):
+                pytest.skip(f"payment disputes not available: {exc.status_code}")
+            raise
+        if not first.entries:
+            pytest.skip("No payment disputes available in sandbox")
+        assert set(first.refreshed) | set(first.errors) == {
+            entry.dispute_id for entry in first.entries
+        }
+        second = inbox.refresh()
+        assert set(second.refreshed) <= set(first.errors)
+
     def test_get_payment_dispute(self, ebay: EbayClient):
         disputes = ebay.sell_fulfillment.get_payment_disputes(limit=1)
         items = disputes.get("paymentDisputeSummaries", [])
@@ -228,12 +346,29 @@ class TestPaymentDisputes:
                 result = ebay.sell_fulfillment.fetch_evidence_content(
                     dispute_id, evidence_id, file_id
                 )
-                assert result is not None
+                assert isinstance(result, bytes)
                 return
             except EbayApiError:
                 continue
         pytest.skip("No disputes with evidence found in sandbox")
 
+    def test_download_evidence(self, ebay: EbayClient, tmp_path):
+        disputes = ebay.sell_fulfillment.get_payment_disputes(limit=5)
+        items = disputes.get("paymentDisputeSummaries", [])
+        if not items:
+            pytest.skip("No payment disputes available for evidence download test")
+        downloads = download_evidence(
+            ebay.sell_fulfillment,
+            [item["paymentDisputeId"] for item in items],
+            tmp_path,
+            max_workers=4,
+        )
+        fetched = [d for d in downloads if d.error is None]
+        if not fetched:
+            pytest.skip("No disputes with evidence found in sandbox")
+        for download in fetched:
+            assert download.path.stat().st_size == download.result.size
+
     def test_add_evidence(self, ebay: EbayClient):
         disputes = ebay.sell_fulfillment.get_payment_disputes(limit=5)
         items = disputes.get("paymentDisputeSummaries", [])
@@ -271,3 +406,15 @@ class TestPaymentDisputes:
                     f"update_evidence not available: {exc.status_code}"
                 )
             raise
+
+
+class TestEvidenceErrors:
+    def test_fetch_evidence_content_non_json_error(self, offline_ebay):
+        ebay = offline_ebay(lambda request: httpx.Response(
+            404, text="Not Found", headers={"Content-Type": "text/plain"}
+        ))
+        with pytest.raises(EbayApiError) as excinfo:
+            ebay.sell_fulfillment.fetch_evidence_content("D1", "E1", "F1")
+        assert excinfo.value.status_code == 404
+        assert excinfo.value.detail == "Not Found"
+        assert "evidence_id=E1" in excinfo.value.url
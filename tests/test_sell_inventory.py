@@ -3,10 +3,14 @@
 Spec: https://developer.ebay.com/api-docs/master/sell/inventory/openapi/3/sell_inventory_v1_oas3.json
 """
 
+import threading
+from itertools import islice
+
 import pytest
 
 from ebay_sdk import EbayClient
 from ebay_sdk.client import EbayApiError
+from ebay_sdk.sell.repricing import PriceQuantityUpdate, Repricer
 
 
 # ---------------------------------------------------------------------------
@@ -112,6 +116,10 @@ class TestInventoryItem:
         result = ebay.sell_inventory.get_inventory_items(limit=2, offset=0)
         assert isinstance(result, dict)
 
+    def test_iter_inventory_items(self, ebay: EbayClient):
+        items = list(islice(ebay.sell_inventory.iter_inventory_items(page_size=2), 5))
+        assert all("sku" in item for item in items)
+
     def test_bulk_create_or_replace_inventory_item(self, ebay: EbayClient):
         """Bulk create two items and clean up."""
         skus = ["SDK-TEST-INV-BULK-001", "SDK-TEST-INV-BULK-002"]
@@ -203,6 +211,42 @@ class TestInventoryItem:
                 )
             raise
 
+    def test_bulk_get_inventory_items_chunks_past_limit(self, ebay: EbayClient):
+        """30 SKUs span two 25-entry calls; every SKU gets an outcome."""
+        skus = [f"SDK-TEST-INV-CHUNK-{i:03d}" for i in range(30)]
+        result = ebay.sell_inventory.bulk_get_inventory_items(skus, max_workers=2)
+        answered = [r["sku"] for r in result.responses]
+        answered += [r["sku"] for e in result.chunk_errors for r in e.requests]
+        assert sorted(answered) == skus
+
+    def test_repricer_reports_unknown_offers(self, ebay: EbayClient):
+        updates = [
+            PriceQuantityUpdate("SDK-TEST-REPRICE-001", "0", "9.99", 1),
+            PriceQuantityUpdate("SDK-TEST-REPRICE-001", "0", "8.99", 1),
+        ]
+        repricer = Repricer(ebay.sell_inventory, window=0.1)
+        stats = repricer.run(updates)
+        assert stats.received == 2
+        assert stats.coalesced == 1
+        assert stats.sent + stats.failed == 1
+
+    def test_repricer_flushes_window_while_input_idle(self, ebay: EbayClient):
+        window_sent = threading.Event()
+
+        def updates():
+            yield PriceQuantityUpdate("SDK-TEST-REPRICE-001", "0", "9.99", 1)
+            # The feed goes quiet; the open window must still be sent.
+            assert window_sent.wait(30)
+            yield PriceQuantityUpdate("SDK-TEST-REPRICE-001", "0", "7.99", 1)
+
+        repricer = Repricer(
+            ebay.sell_inventory, window=0.1, on_progress=lambda s: window_sent.set()
+        )
+        stats = repricer.run(updates())
+        assert stats.received == 2
+        assert stats.coalesced == 0
+        assert stats.calls == 2
+
 
 # ---------------------------------------------------------------------------
 # Offer (10 methods)
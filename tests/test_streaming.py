@@ -0,0 +1,48 @@
+"""Offline tests for the streaming helpers.
+
+``iter_json_array`` is pure parsing over byte chunks, so chunk boundaries
+are checked directly rather than through the sandbox.
+"""
+
+import json
+
+import pytest
+
+from ebay_sdk.streaming import iter_json_array
+
+
+def _split(data: bytes, size: int) -> list[bytes]:
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+class TestIterJsonArray:
+    def test_number_split_across_chunks(self):
+        assert list(iter_json_array([b"[1,", b"2", b"3, 4]"], None)) == [1, 23, 4]
+
+    def test_literals_split_across_chunks(self):
+        chunks = [b"[tr", b"ue,", b"n", b"ull,fals", b"e, 1", b".5e", b"3]"]
+        assert list(iter_json_array(chunks, None)) == [True, None, False, 1500.0]
+
+    def test_element_ending_at_chunk_boundary(self):
+        chunks = [b'[{"a": 1}', b', "x"', b", 7", b"]"]
+        assert list(iter_json_array(chunks, None)) == [{"a": 1}, "x", 7]
+
+    @pytest.mark.parametrize("size", [1, 2, 3, 7])
+    def test_keyed_array_any_chunk_size(self, size):
+        records = [{"sku": f"S{i}", "qty": i * 10, "ok": i % 2 == 0} for i in range(12)]
+        document = json.dumps({"total": 12, "items": records, "next": None}).encode()
+        assert list(iter_json_array(_split(document, size), "items")) == records
+
+    @pytest.mark.parametrize("size", [1, 2, 5])
+    def test_bare_array_any_chunk_size(self, size):
+        values = [0, -12, 3.25, 1e-3, "é€", [], {}, [1, [2]], True, None]
+        document = b"\xef\xbb\xbf" + json.dumps(values, ensure_ascii=False).encode()
+        assert list(iter_json_array(_split(document, size), None)) == values
+
+    def test_truncated_array_raises(self):
+        with pytest.raises(ValueError):
+            list(iter_json_array([b"[1, 2", b"3"], None))
+
+    def test_missing_key_raises(self):
+        with pytest.raises(ValueError):
+            list(iter_json_array([b'{"other": [1]}'], "items"))